@@ -0,0 +1,79 @@
+"""Compare CLI cold-start latency of the zipapp and the installed entry point.
+
+Usage: python benchmarks/bench_startup.py [--zipapp dist/pb-spec.pyz] [--runs 20]
+
+Each command is run ``--runs`` times in a fresh process; the median and
+minimum wall-clock times are reported. Build the zipapp first with
+``just zipapp``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+ARGUMENT_SETS: tuple[tuple[str, ...], ...] = (("--version",), ("--help",), ("validate", "--task"))
+
+
+def time_command(command: list[str], runs: int) -> dict[str, float]:
+    """Run ``command`` ``runs`` times and return median/min wall time in milliseconds."""
+    env = {**os.environ, "PB_SPEC_NO_DAEMON": "1"}
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, env=env, capture_output=True, check=False)
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"median_ms": statistics.median(samples), "min_ms": min(samples)}
+
+
+def launchers(zipapp: Path) -> dict[str, list[str]]:
+    """Return the available ways to start pb-spec, keyed by label."""
+    found: dict[str, list[str]] = {}
+    if zipapp.is_file():
+        found["zipapp"] = [sys.executable, str(zipapp)]
+    entry_point = shutil.which("pb-spec")
+    if entry_point:
+        found["entry-point"] = [entry_point]
+    found["python -m"] = [sys.executable, "-m", "pb_spec.cli"]
+    return found
+
+
+def main() -> None:
+    """Time every launcher on every argument set and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--zipapp", type=Path, default=ROOT / "dist" / "pb-spec.pyz")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Emit results as JSON.")
+    args = parser.parse_args()
+
+    results = {
+        label: {
+            " ".join(arguments): time_command([*command, *arguments], args.runs)
+            for arguments in ARGUMENT_SETS
+        }
+        for label, command in launchers(args.zipapp).items()
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    if "zipapp" not in results:
+        print(f"note: {args.zipapp} not found; run `just zipapp` to include it", file=sys.stderr)
+    print(f"{'launcher':<12} {'command':<16} {'median':>9} {'min':>9}")
+    for label, timings in results.items():
+        for arguments, timing in timings.items():
+            print(
+                f"{label:<12} {arguments:<16} "
+                f"{timing['median_ms']:>7.1f}ms {timing['min_ms']:>7.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
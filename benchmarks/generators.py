@@ -0,0 +1,191 @@
+"""Deterministic generators for synthetic repositories and spec corpora.
+
+The same arguments and seed always produce byte-identical trees, so timings
+from different runs and machines measure the same work.
+"""
+
+from __future__ import annotations
+
+import random
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+# Lines that trip each scanner rule family, inserted at ``marker_density``.
+# Split literals keep pb-spec's own scan from flagging this file.
+MARKER_LINES: tuple[str, ...] = (
+    "    # TO" + "DO: handle the remaining cases",
+    "    # FIX" + "ME: this leaks on retry",
+    "    console" + '.log("state", state)',
+    "    break" + "point()",
+    "    raise NotImplemented" + "Error",
+    "@pytest.mark.sk" + "ip(reason='flaky')",
+)
+
+_WORDS = (
+    "account",
+    "batch",
+    "cache",
+    "config",
+    "event",
+    "index",
+    "order",
+    "queue",
+    "record",
+    "session",
+    "token",
+    "window",
+)
+
+DESIGN_SECTIONS = (
+    "Summary",
+    "Approach",
+    "Architecture Decisions",
+    "BDD/TDD Strategy",
+    "Verification",
+)
+
+
+@dataclass(frozen=True)
+class RepositoryStats:
+    """What generate_repository wrote."""
+
+    files: int
+    lines: int
+    markers: int
+
+
+@dataclass(frozen=True)
+class SpecStats:
+    """What generate_spec wrote."""
+
+    tasks: int
+    scenarios: int
+    feature_files: int
+    contract_blocks: int
+
+
+def _code_line(rng: random.Random, index: int) -> str:
+    left, right = rng.choice(_WORDS), rng.choice(_WORDS)
+    return f"    {left}_{index} = compute_{right}({left}, limit={rng.randrange(1, 1000)})"
+
+
+def generate_repository(
+    root: Path,
+    files: int,
+    lines: int,
+    marker_density: float = 0.001,
+    seed: int = 0,
+    git: bool = True,
+) -> RepositoryStats:
+    """Write ``files`` Python modules of ``lines`` lines each under ``root``.
+
+    Each line is a scanner marker with probability ``marker_density``.
+    Modules are spread over nested packages, ten per directory. With ``git``,
+    the tree is initialised as a repository and every file staged.
+    """
+    rng = random.Random(seed)
+    markers = 0
+    for file_index in range(files):
+        directory = root / "src" / f"pkg{file_index // 100}" / f"mod{file_index // 10 % 10}"
+        directory.mkdir(parents=True, exist_ok=True)
+        body = [f'"""Generated module {file_index}."""', "", f"def run_{file_index}():"]
+        for line_index in range(lines - len(body)):
+            if rng.random() < marker_density:
+                body.append(rng.choice(MARKER_LINES))
+                markers += 1
+            else:
+                body.append(_code_line(rng, line_index))
+        (directory / f"module_{file_index}.py").write_text("\n".join(body) + "\n")
+
+    if git:
+        subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+        subprocess.run(["git", "add", "-A"], cwd=root, check=True)
+    return RepositoryStats(files=files, lines=files * lines, markers=markers)
+
+
+def _task_block(number: int, scenario_tags: list[str], depends_on: str) -> str:
+    major, minor = divmod(number, 10)
+    coverage = ", ".join(scenario_tags) if scenario_tags else "N/A"
+    return (
+        f"### Task {major + 1}.{minor + 1}: Implement generated unit {number}\n\n"
+        f"TaskID: T{number}\n"
+        f"DependsOn: {depends_on}\n"
+        f"Context: Build unit {number} in `src/pkg{number // 100}/module_{number}.py`.\n"
+        f"Verification: `pytest tests/test_unit_{number}.py`\n"
+        "Status: 🟢 DONE\n"
+        f"Scenario Coverage: {coverage}\n\n"
+        f"- [x] Step 1: Write a failing test for unit {number}\n"
+        f"- [x] Step 2: Implement unit {number}\n"
+        "- [x] Step 3: Refactor\n"
+    )
+
+
+def _contract_block(number: int) -> str:
+    major, minor = divmod(number, 10)
+    return (
+        f"🛑 Build Blocked — Task {major + 1}.{minor + 1}: Implement generated unit {number}\n\n"
+        f"Reason: Upstream API for unit {number} is not available.\n"
+        "Requested Change: Stub the API behind an interface.\n"
+        "Impact: One task is delayed.\n"
+    )
+
+
+def generate_spec(
+    spec_dir: Path,
+    tasks: int,
+    scenarios: int,
+    scenarios_per_feature: int = 50,
+    contract_every: int = 0,
+    seed: int = 0,
+) -> SpecStats:
+    """Write design.md, tasks.md and features/*.feature for a plan of ``tasks`` tasks.
+
+    Scenarios are tagged ``@sN`` and assigned round-robin to tasks' Scenario
+    Coverage; most tasks depend on a random earlier task. With
+    ``contract_every`` > 0, a Build Blocked packet follows every such task.
+    The result passes ``validate_plan``.
+    """
+    rng = random.Random(seed)
+    features_dir = spec_dir / "features"
+    features_dir.mkdir(parents=True, exist_ok=True)
+
+    design = ["# Design Document", ""]
+    for section in DESIGN_SECTIONS:
+        design += [f"## {section}", f"Generated {section.lower()} text.", ""]
+    (spec_dir / "design.md").write_text("\n".join(design))
+
+    coverage: list[list[str]] = [[] for _ in range(tasks)]
+    feature_files = 0
+    for start in range(0, scenarios, scenarios_per_feature):
+        chunk = range(start, min(start + scenarios_per_feature, scenarios))
+        lines = [f"Feature: Generated feature {feature_files}", ""]
+        for scenario in chunk:
+            coverage[scenario % tasks].append(f"@s{scenario}")
+            word = rng.choice(_WORDS)
+            lines += [
+                f"  @s{scenario}",
+                f"  Scenario: Generated scenario {scenario}",
+                f"    Given a {word} numbered {scenario}",
+                f"    When the {word} is processed",
+                "    Then it is stored",
+                "",
+            ]
+        (features_dir / f"generated_{feature_files}.feature").write_text("\n".join(lines))
+        feature_files += 1
+
+    blocks = ["# Tasks", ""]
+    contract_blocks = 0
+    for number in range(tasks):
+        depends_on = f"T{rng.randrange(number)}" if number and rng.random() < 0.7 else "none"
+        blocks.append(_task_block(number, coverage[number], depends_on))
+        if contract_every and number % contract_every == contract_every - 1:
+            blocks.append(_contract_block(number))
+            contract_blocks += 1
+    (spec_dir / "tasks.md").write_text("\n".join(blocks))
+    return SpecStats(
+        tasks=tasks,
+        scenarios=scenarios,
+        feature_files=feature_files,
+        contract_blocks=contract_blocks,
+    )
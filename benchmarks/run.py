@@ -0,0 +1,182 @@
+"""Time pb-spec's hot paths on a synthetic repository and spec corpus.
+
+Usage: python benchmarks/run.py [--scale small|medium|large] [--repeat 5]
+                                [--output results.json] [--save-baseline]
+                                [--compare baseline.json] [--threshold 0.2]
+
+The corpus is regenerated deterministically (see ``generators.py``) in a
+temporary directory. Each case runs ``--repeat`` times; the minimum and
+median wall-clock times are reported. With ``--compare``, any case whose
+minimum is slower than the baseline by more than ``--threshold`` (a
+fraction) is reported and the script exits 1. Baselines are stored under
+``benchmarks/baselines/<scale>.json``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_DIR = ROOT / "benchmarks" / "baselines"
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.generators import generate_repository, generate_spec  # noqa: E402
+from pb_spec.validation.build import validate_build  # noqa: E402
+from pb_spec.validation.parser import parse_contract_blocks, parse_task_blocks  # noqa: E402
+from pb_spec.validation.plan import validate_plan  # noqa: E402
+from pb_spec.validation.scanner import CodeScanner  # noqa: E402
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Corpus size for one benchmark preset."""
+
+    files: int
+    lines: int
+    marker_density: float
+    tasks: int
+    scenarios: int
+    contract_every: int
+
+
+SCALES: dict[str, Scale] = {
+    "small": Scale(
+        files=200, lines=200, marker_density=0.001, tasks=200, scenarios=400, contract_every=10
+    ),
+    "medium": Scale(
+        files=1000, lines=300, marker_density=0.001, tasks=1000, scenarios=2000, contract_every=10
+    ),
+    "large": Scale(
+        files=4000, lines=400, marker_density=0.001, tasks=5000, scenarios=10000, contract_every=10
+    ),
+}
+
+
+def time_case(function: Callable[[], object], repeat: int) -> dict[str, float]:
+    """Call ``function`` ``repeat`` times and return min/median wall time in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"min_ms": min(samples), "median_ms": statistics.median(samples)}
+
+
+def _run_cli(repo: Path) -> None:
+    env = {
+        **os.environ,
+        "PB_SPEC_NO_DAEMON": "1",
+        "PYTHONPATH": os.pathsep.join([str(ROOT / "src"), os.environ.get("PYTHONPATH", "")]),
+    }
+    subprocess.run(
+        [sys.executable, "-m", "pb_spec.cli", "validate", "--build", "--specs-dir", "specs"],
+        cwd=repo,
+        env=env,
+        capture_output=True,
+        check=False,
+    )
+
+
+def run_benchmarks(scale: Scale, repeat: int, work_dir: Path) -> dict[str, dict[str, float]]:
+    """Generate the corpus under ``work_dir`` and time every case."""
+    repo = work_dir / "repo"
+    repo.mkdir()
+    spec_dir = repo / "specs" / "2026-01-01-generated"
+    generate_spec(spec_dir, scale.tasks, scale.scenarios, contract_every=scale.contract_every)
+    generate_repository(repo, scale.files, scale.lines, scale.marker_density)
+    tasks_md = (spec_dir / "tasks.md").read_text(encoding="utf-8")
+
+    cases: dict[str, Callable[[], object]] = {
+        "scanner.scan": lambda: CodeScanner(root_dir=repo).scan(),
+        "parse_task_blocks": lambda: parse_task_blocks(tasks_md),
+        "parse_contract_blocks": lambda: parse_contract_blocks(tasks_md),
+        "validate_plan": lambda: validate_plan(spec_dir),
+        "validate_build": lambda: validate_build(spec_dir),
+        "cli validate --build": lambda: _run_cli(repo),
+    }
+    return {name: time_case(function, repeat) for name, function in cases.items()}
+
+
+def find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Return a message for each case slower than its baseline by more than ``threshold``."""
+    regressions = []
+    for name, timing in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["min_ms"], timing["min_ms"]
+        if before > 0 and (after - before) / before > threshold:
+            regressions.append(
+                f"{name}: {before:.1f}ms -> {after:.1f}ms (+{(after - before) / before:.0%})"
+            )
+    return regressions
+
+
+def main() -> None:
+    """Run the suite, write JSON, and compare against a baseline if requested."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Write results JSON to this path.")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Store results as the scale's baseline."
+    )
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    scale = SCALES[args.scale]
+    with tempfile.TemporaryDirectory(prefix="pb-spec-bench-") as tmp:
+        results = run_benchmarks(scale, args.repeat, Path(tmp))
+
+    document = {
+        "meta": {
+            "scale": args.scale,
+            "corpus": asdict(scale),
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    payload = json.dumps(document, indent=2) + "\n"
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    if args.save_baseline:
+        BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+        (BASELINE_DIR / f"{args.scale}.json").write_text(payload, encoding="utf-8")
+
+    print(f"{'case':<24} {'min':>10} {'median':>10}")
+    for name, timing in results.items():
+        print(f"{name:<24} {timing['min_ms']:>8.1f}ms {timing['median_ms']:>8.1f}ms")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if baseline["meta"]["scale"] != args.scale:
+            raise SystemExit(f"Baseline is for scale {baseline['meta']['scale']!r}.")
+        regressions = find_regressions(results, baseline["results"], args.threshold)
+        if regressions:
+            print(f"\nRegressions beyond {args.threshold:.0%}:", file=sys.stderr)
+            for message in regressions:
+                print(f"  {message}", file=sys.stderr)
+            raise SystemExit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -39,6 +39,7 @@ _DCR_FIELDS: dict[str, str] = {
 
 _VALID_FEATURE_FILE = (
     "Feature: Test Feature\n"
+    "  @scenario-1.1\n"
     "  Scenario: Test scenario\n"
     "    Given a condition\n"
     "    When action\n"
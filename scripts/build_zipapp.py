@@ -0,0 +1,88 @@
+"""Build a self-contained ``pb-spec.pyz`` zipapp with precompiled bytecode.
+
+The archive bundles pb_spec and click, each module shipped with an
+unchecked-hash ``.pyc`` for the building interpreter next to its source, so
+zipimport loads bytecode without compiling (other interpreters fall back to
+the sources). The version is written to ``pb_spec/_build_info.py`` so the
+zipapp never needs ``importlib.metadata``. Entries are stored uncompressed to
+keep start-up reads cheap.
+
+Usage: python scripts/build_zipapp.py [--output dist/pb-spec.pyz]
+"""
+
+from __future__ import annotations
+
+import argparse
+import compileall
+import importlib.util
+import py_compile
+import shutil
+import sys
+import tempfile
+import tomllib
+import zipapp
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUTPUT = ROOT / "dist" / "pb-spec.pyz"
+INTERPRETER = "/usr/bin/env python3"
+
+_IGNORED = shutil.ignore_patterns("__pycache__", "*.pyc", "*.pyo")
+
+MAIN = """\
+from pb_spec.cli import main
+
+main()
+"""
+
+
+def _package_dir(name: str) -> Path:
+    spec = importlib.util.find_spec(name)
+    if spec is None or not spec.submodule_search_locations:
+        raise SystemExit(f"Cannot find package {name!r}; install it before building.")
+    return Path(next(iter(spec.submodule_search_locations)))
+
+
+def _project_version() -> str:
+    with (ROOT / "pyproject.toml").open("rb") as f:
+        return tomllib.load(f)["project"]["version"]
+
+
+def build(output: Path) -> Path:
+    """Stage, precompile and archive the zipapp; return its path."""
+    with tempfile.TemporaryDirectory(prefix="pb-spec-zipapp-") as tmp:
+        stage = Path(tmp)
+        shutil.copytree(ROOT / "src" / "pb_spec", stage / "pb_spec", ignore=_IGNORED)
+        shutil.copytree(_package_dir("click"), stage / "click", ignore=_IGNORED)
+        (stage / "pb_spec" / "_build_info.py").write_text(
+            f'"""Generated by scripts/build_zipapp.py."""\n\nVERSION = "{_project_version()}"\n',
+            encoding="utf-8",
+        )
+        (stage / "__main__.py").write_text(MAIN, encoding="utf-8")
+
+        # zipimport only finds legacy-layout .pyc files (next to the source).
+        if not compileall.compile_dir(
+            stage,
+            quiet=1,
+            legacy=True,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+        ):
+            raise SystemExit("Bytecode compilation failed.")
+
+        output.parent.mkdir(parents=True, exist_ok=True)
+        zipapp.create_archive(stage, output, interpreter=INTERPRETER, compressed=False)
+    return output
+
+
+def main() -> None:
+    """Parse arguments and build the zipapp."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+    output = build(args.output)
+    tag = sys.implementation.cache_tag
+    print(f"Built {output} ({output.stat().st_size // 1024} KiB, bytecode for {tag})")
+
+
+if __name__ == "__main__":
+    main()
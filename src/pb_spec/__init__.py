@@ -2,6 +2,28 @@
 
 from __future__ import annotations
 
-from importlib.metadata import version
+from functools import cache
+from importlib import import_module
 
-__version__ = version("pb-spec")
+
+@cache
+def get_version() -> str:
+    """Return the pb-spec version, resolved on first use.
+
+    Zipapp builds embed it in ``pb_spec._build_info``; installed packages read
+    it from their distribution metadata.
+    """
+    try:
+        build_info = import_module("pb_spec._build_info")
+    except ImportError:
+        from importlib.metadata import version
+
+        return version("pb-spec")
+    return build_info.VERSION
+
+
+def __getattr__(name: str) -> str:
+    # ``__version__`` is resolved lazily: importlib.metadata is slow to import.
+    if name == "__version__":
+        return get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,19 +2,99 @@
 
 from __future__ import annotations
 
+import importlib
+from typing import Any
+
 import click
 
-from pb_spec import __version__
-from pb_spec.commands.validate import validate_cmd
+from pb_spec import get_version
 
+# Subcommands are imported only when invoked, so `--help`, `--version` and each
+# command pay only for the modules they use. Short help is kept here so the
+# command listing does not import every command module; tests/test_startup.py
+# checks it against each command's docstring.
+LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "baseline": (
+        "pb_spec.commands.baseline:baseline_cmd",
+        "Record pre-existing scan issues so validation reports only new ones.",
+    ),
+    "daemon": (
+        "pb_spec.commands.daemon:daemon_cmd",
+        "Keep a warm validation process so repeat checks skip CLI startup.",
+    ),
+    "impact": (
+        "pb_spec.commands.impact:impact_cmd",
+        "Select test files and feature files affected by changed Python modules.",
+    ),
+    "plan": ("pb_spec.commands.plan:plan_cmd", "Analyse the latest spec's task plan."),
+    "specs": ("pb_spec.commands.specs:specs_cmd", "Inspect spec directories under specs/."),
+    "validate": (
+        "pb_spec.commands.validate:validate_cmd",
+        "Validate pb-spec workflow artifacts at different stages.",
+    ),
+    "verify": (
+        "pb_spec.commands.verify:verify_cmd",
+        "Run each task's Verification commands, wave by wave.",
+    ),
+}
 
-@click.group()
-@click.version_option(version=__version__, prog_name="pb-spec")
-def main() -> None:
-    """Plan-Build Spec (pb-spec): A CLI tool for managing AI coding assistant skills."""
 
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use."""
+
+    def __init__(
+        self, *args: Any, lazy_commands: dict[str, tuple[str, str]] | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.commands or cmd_name not in self.lazy_commands:
+            return super().get_command(ctx, cmd_name)
+        module_name, _, attribute = self.lazy_commands[cmd_name][0].partition(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        self.add_command(command, cmd_name)
+        return command
 
-main.add_command(validate_cmd)
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        names = self.list_commands(ctx)
+        limit = formatter.width - 6 - max((len(name) for name in names), default=0)
+        rows = []
+        for name in names:
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                rows.append((name, command.get_short_help_str(limit)))
+            else:
+                placeholder = click.Command(name, help=self.lazy_commands[name][1])
+                rows.append((name, placeholder.get_short_help_str(limit)))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+def _print_version(ctx: click.Context, _param: click.Parameter, value: bool) -> None:
+    if not value or ctx.resilient_parsing:
+        return
+    click.echo(f"pb-spec, version {get_version()}")
+    ctx.exit()
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
+@click.option(
+    "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=_print_version,
+    help="Show the version and exit.",
+)
+def main() -> None:
+    """Plan-Build Spec (pb-spec): A CLI tool for managing AI coding assistant skills."""
 
 
 if __name__ == "__main__":
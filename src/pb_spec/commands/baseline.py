@@ -0,0 +1,49 @@
+"""Baseline command group for pb-spec: record known scan issues to suppress later."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+
+from pb_spec.output import print_success
+from pb_spec.validation.baseline import BASELINE_FILE_NAME, create_baseline
+
+
+@click.group("baseline")
+def baseline_cmd() -> None:
+    """Record pre-existing scan issues so validation reports only new ones.
+
+    Pass the file to `pb-spec validate --baseline` to suppress the recorded
+    issues; files unchanged since the baseline are not even re-read.
+    """
+
+
+@baseline_cmd.command("create")
+@click.option(
+    "--root",
+    "root_dir",
+    type=click.Path(path_type=Path, file_okay=False, exists=True),
+    default=Path("."),
+    help="Project root to scan (default: current directory).",
+)
+@click.option(
+    "--output",
+    "output_path",
+    type=click.Path(path_type=Path, dir_okay=False),
+    default=None,
+    help=f"Baseline file to write (default: <root>/{BASELINE_FILE_NAME}).",
+)
+def create_cmd(root_dir: Path, output_path: Path | None) -> None:
+    """Scan the codebase and record a fingerprint of every current issue.
+
+    A fingerprint covers the file path, issue type and normalised line
+    content, so known issues stay suppressed when surrounding lines move.
+    """
+    baseline = create_baseline(root_dir)
+    path = output_path or root_dir / BASELINE_FILE_NAME
+    path.write_text(baseline.dumps(), encoding="utf-8")
+    print_success(
+        f"Recorded {len(baseline.fingerprints)} issue fingerprint(s) "
+        f"and {len(baseline.blobs)} file hash(es) in {path}"
+    )
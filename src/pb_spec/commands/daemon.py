@@ -0,0 +1,119 @@
+"""Daemon command group for pb-spec: run, start, stop and inspect the validation daemon."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import click
+
+from pb_spec.config import DAEMON_IDLE_TIMEOUT
+from pb_spec.daemon import serve, spawn_daemon
+from pb_spec.daemon_client import default_socket_path, send_request
+from pb_spec.output import print_error, print_info, print_success
+
+socket_option = click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(path_type=Path, dir_okay=False),
+    default=None,
+    help="Unix socket path (default: $PB_SPEC_DAEMON_SOCKET or a per-user runtime file).",
+)
+idle_timeout_option = click.option(
+    "--idle-timeout",
+    type=click.FloatRange(min=0),
+    default=DAEMON_IDLE_TIMEOUT,
+    show_default=True,
+    help="Exit after this many idle seconds (0 = never).",
+)
+metrics_file_option = click.option(
+    "--metrics-file",
+    type=click.Path(path_type=Path, dir_okay=False),
+    default=None,
+    help="Export OpenMetrics (node_exporter textfile) metrics here, refreshed periodically.",
+)
+
+
+@click.group("daemon")
+def daemon_cmd() -> None:
+    """Keep a warm validation process so repeat checks skip CLI startup.
+
+    While a daemon is running, `pb-spec validate` forwards requests to it and
+    falls back to in-process validation when it is unavailable. Set
+    PB_SPEC_NO_DAEMON=1 to always validate in-process.
+    """
+
+
+@daemon_cmd.command("run")
+@socket_option
+@idle_timeout_option
+@metrics_file_option
+@click.pass_context
+def run_cmd(
+    ctx: click.Context, socket_path: Path | None, idle_timeout: float, metrics_file: Path | None
+) -> None:
+    """Run the daemon in the foreground."""
+    path = socket_path or default_socket_path()
+    try:
+        serve(path, idle_timeout=idle_timeout, metrics_file=metrics_file)
+    except (RuntimeError, OSError) as e:
+        print_error(str(e))
+        ctx.exit(1)
+
+
+@daemon_cmd.command("start")
+@socket_option
+@idle_timeout_option
+@metrics_file_option
+@click.pass_context
+def start_cmd(
+    ctx: click.Context, socket_path: Path | None, idle_timeout: float, metrics_file: Path | None
+) -> None:
+    """Start the daemon in the background (no-op if one is already running)."""
+    path = socket_path or default_socket_path()
+    reply = send_request({"command": "ping"}, path, timeout=1.0)
+    if reply is not None:
+        print_info(f"Daemon already running (pid {reply.get('pid')}) on {path}")
+        return
+    pid = spawn_daemon(path, idle_timeout=idle_timeout, metrics_file=metrics_file)
+    if pid is None:
+        print_error(f"Daemon did not start listening on {path}")
+        ctx.exit(1)
+    print_success(f"Daemon started (pid {pid}) on {path}")
+
+
+@daemon_cmd.command("stop")
+@socket_option
+@click.pass_context
+def stop_cmd(ctx: click.Context, socket_path: Path | None) -> None:
+    """Stop a running daemon."""
+    path = socket_path or default_socket_path()
+    if send_request({"command": "shutdown"}, path, timeout=5.0) is None:
+        print_error(f"No daemon is listening on {path}")
+        ctx.exit(1)
+    print_success("Daemon stopped.")
+
+
+@daemon_cmd.command("status")
+@socket_option
+@click.option("--json", "as_json", is_flag=True, help="Emit daemon statistics as JSON.")
+@click.pass_context
+def status_cmd(ctx: click.Context, socket_path: Path | None, as_json: bool) -> None:
+    """Report whether a daemon is running, with its cache statistics."""
+    path = socket_path or default_socket_path()
+    reply = send_request({"command": "stats"}, path, timeout=5.0)
+    if reply is None:
+        if as_json:
+            click.echo(json.dumps({"running": False, "socket": str(path)}))
+        else:
+            print_info(f"No daemon is listening on {path}")
+        ctx.exit(1)
+    if as_json:
+        click.echo(json.dumps({"running": True, "socket": str(path), **reply}, indent=2))
+        return
+    cache = reply.get("scan_cache", {})
+    print_success(
+        f"Daemon pid {reply.get('pid')} (pb-spec {reply.get('version')}) on {path}: "
+        f"{reply.get('requests')} request(s), {cache.get('entries')} cached file(s), "
+        f"{cache.get('hits')} hit(s) / {cache.get('misses')} miss(es)"
+    )
@@ -2,29 +2,31 @@
 
 from __future__ import annotations
 
-import re
 from pathlib import Path
 
 from pb_spec.exceptions import SpecNotFoundError
-
-_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+from pb_spec.spec_index import latest_spec_name
 
 
 def get_latest_spec_dir(specs_dir: Path | None = None) -> Path:
-    """Get the latest feature spec directory from specs/."""
+    """Get the latest feature spec directory from specs/.
+
+    Reads the ``specs/.index`` manifest when it is fresh and otherwise falls back
+    to a single directory scan.
+    """
     if specs_dir is None:
         specs_dir = Path("specs")
 
-    if not specs_dir.exists() or not specs_dir.is_dir():
+    if not specs_dir.is_dir():
         raise SpecNotFoundError("Directory 'specs/' not found. Run /pb-plan first.")
 
-    spec_dirs = [d for d in specs_dir.iterdir() if d.is_dir()]
-    if not spec_dirs:
+    latest = latest_spec_name(specs_dir)
+    if latest is None:
         raise SpecNotFoundError("No feature specs found in 'specs/'.")
 
-    def sort_key(d: Path) -> tuple[int, str]:
-        if _DATE_RE.match(d.name):
-            return (1, d.name)
-        return (0, d.name)
+    return specs_dir / latest
+
 
-    return sorted(spec_dirs, key=sort_key)[-1]
+def project_root_for(spec_dir: Path) -> Path:
+    """Return the project root for a spec dir (two levels up from specs/<spec>)."""
+    return spec_dir.parent.parent if spec_dir.parent.name == "specs" else spec_dir.parent
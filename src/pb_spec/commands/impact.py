@@ -0,0 +1,90 @@
+"""Impact command for pb-spec: select the tests affected by changed files."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import click
+
+from pb_spec.git_utils import get_git_modified_files
+from pb_spec.orchestration.impact import DEFAULT_GRAPH_CACHE_PATH, ImportGraph, select_impacted
+from pb_spec.output import print_info, print_warning
+
+
+def _relative_changes(root: Path, paths: set[Path]) -> list[str]:
+    changed: list[str] = []
+    for path in paths:
+        try:
+            changed.append(path.resolve().relative_to(root).as_posix())
+        except ValueError:
+            continue
+    return sorted(changed)
+
+
+@click.command("impact")
+@click.option(
+    "--root",
+    type=click.Path(path_type=Path, exists=True, file_okay=False),
+    default=Path("."),
+    help="Project root to analyse (default: current directory).",
+)
+@click.option(
+    "--changed",
+    "changed_paths",
+    multiple=True,
+    type=click.Path(path_type=Path),
+    help="Changed file (relative to --root); default: files modified in git.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "pytest", "behave", "json"]),
+    default="text",
+    show_default=True,
+    help="pytest/behave print one selected path per line for use as arguments.",
+)
+@click.option("--no-cache", is_flag=True, help="Re-parse every file instead of using the cache.")
+def impact_cmd(
+    root: Path,
+    changed_paths: tuple[Path, ...],
+    output_format: str,
+    no_cache: bool,
+) -> None:
+    """Select test files and feature files affected by changed Python modules.
+
+    Builds the project's import graph from the AST of every Python file
+    (cached in .pb-spec/import-graph.json and re-parsed per file only when its
+    hash changes), then walks importers transitively from the changed files.
+    Step or environment modules under a features directory select that
+    directory's feature files. Changed non-Python files are listed as unmapped.
+    """
+    root = root.resolve()
+    if changed_paths:
+        changed = _relative_changes(root, {root / p for p in changed_paths})
+    else:
+        changed = _relative_changes(root, get_git_modified_files(root))
+
+    cache_path = None if no_cache else root / DEFAULT_GRAPH_CACHE_PATH
+    graph = ImportGraph(root, cache_path).build()
+    selection = select_impacted(root, graph, changed)
+
+    if output_format == "json":
+        click.echo(json.dumps(selection.to_dict(), indent=2))
+        return
+    if output_format in ("pytest", "behave"):
+        selected = selection.test_files if output_format == "pytest" else selection.feature_files
+        for path in selected:
+            click.echo(path)
+        return
+
+    print_info(
+        f"{len(selection.changed)} changed file(s) impact {len(selection.impacted_modules)} "
+        f"module(s); parsed {graph.parsed} of {len(graph.files)} file(s)"
+    )
+    for path in selection.test_files:
+        click.echo(f"test: {path}")
+    for path in selection.feature_files:
+        click.echo(f"feature: {path}")
+    for path in selection.unmapped:
+        print_warning(f"No import information for {path}; consider a full run")
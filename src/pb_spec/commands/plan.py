@@ -0,0 +1,228 @@
+"""Plan command group for pb-spec (analysis of tasks.md and features/)."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import click
+
+from pb_spec.commands.discovery import get_latest_spec_dir
+from pb_spec.exceptions import FileReadError, SpecNotFoundError
+from pb_spec.orchestration.simulate import (
+    DEFAULT_COMPLEXITY_WEIGHTS,
+    calibrate_weights,
+    simulate_build,
+    task_durations,
+)
+from pb_spec.output import print_error, print_info, print_success, print_warning
+from pb_spec.validation.dag import build_task_graph, compute_waves
+from pb_spec.validation.io import read_file_content
+from pb_spec.validation.parser import parse_task_blocks
+from pb_spec.validation.plan import compute_spec_coverage
+
+specs_dir_option = click.option(
+    "--specs-dir",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Path to specs directory (default: specs/).",
+)
+
+
+@click.group("plan")
+def plan_cmd() -> None:
+    """Analyse the latest spec's task plan."""
+
+
+def _resolve_spec_dir(ctx: click.Context, specs_dir: Path | None) -> Path:
+    try:
+        return get_latest_spec_dir(specs_dir)
+    except SpecNotFoundError as e:
+        print_error(str(e))
+        ctx.exit(1)
+
+
+@plan_cmd.command("coverage")
+@specs_dir_option
+@click.option("--json", "as_json", is_flag=True, help="Emit the coverage matrix as JSON.")
+@click.pass_context
+def coverage_cmd(ctx: click.Context, specs_dir: Path | None, as_json: bool) -> None:
+    """Cross-reference Scenario Coverage tags against features/*.feature.
+
+    Exits non-zero when a task references a scenario tag that does not exist.
+    """
+    spec_dir = _resolve_spec_dir(ctx, specs_dir)
+    try:
+        report = compute_spec_coverage(spec_dir)
+    except FileReadError as e:
+        print_error(str(e))
+        ctx.exit(1)
+
+    if as_json:
+        click.echo(json.dumps(report.to_dict(), indent=2))
+    else:
+        for task_id in report.task_ids:
+            names = ", ".join(s.name for s in report.covered_by(task_id)) or "none"
+            click.echo(f"Task {task_id}: {names}")
+        for dangling in report.dangling:
+            print_error(f"Task {dangling.task_id}: unknown scenario {dangling.tag}")
+        for scenario in report.uncovered:
+            print_warning(f"Uncovered scenario: {scenario.name} ({scenario.file_path})")
+        summary = report.summary()
+        print_info(
+            f"{summary['covered']}/{summary['scenarios']} scenario(s) covered by "
+            f"{summary['tasks']} task(s)"
+        )
+        if not report.dangling:
+            print_success("All Scenario Coverage references resolve.")
+
+    ctx.exit(1 if report.dangling else 0)
+
+
+@plan_cmd.command("waves")
+@specs_dir_option
+@click.option("--json", "as_json", is_flag=True, help="Emit the wave schedule as JSON.")
+@click.pass_context
+def waves_cmd(ctx: click.Context, specs_dir: Path | None, as_json: bool) -> None:
+    """Group tasks into parallel waves from their DependsOn metadata.
+
+    Every task in a wave depends only on tasks in earlier waves, so a wave can
+    be dispatched to as many subagents as it has tasks. Exits non-zero on
+    dependency cycles or unknown task references.
+    """
+    spec_dir = _resolve_spec_dir(ctx, specs_dir)
+    try:
+        task_blocks = parse_task_blocks(read_file_content(spec_dir / "tasks.md"))
+    except FileReadError as e:
+        print_error(str(e))
+        ctx.exit(1)
+
+    graph = build_task_graph(task_blocks)
+    schedule = compute_waves(graph)
+    failed = bool(graph.dangling or schedule.cyclic)
+
+    if as_json:
+        payload = {
+            "waves": schedule.waves,
+            "critical_path": schedule.critical_path,
+            "critical_path_length": len(schedule.critical_path),
+            "max_parallelism": schedule.max_parallelism,
+            "cyclic": schedule.cyclic,
+            "dangling": [{"task": d.task_id, "reference": d.reference} for d in graph.dangling],
+        }
+        click.echo(json.dumps(payload, indent=2))
+        ctx.exit(1 if failed else 0)
+
+    for number, wave in enumerate(schedule.waves, start=1):
+        click.echo(f"Wave {number}: {', '.join(wave)}")
+    for dangling in graph.dangling:
+        print_error(f"Task {dangling.task_id}: unknown dependency '{dangling.reference}'")
+    if schedule.cyclic:
+        print_error(f"Dependency cycle blocks: {', '.join(schedule.cyclic)}")
+    print_info(
+        f"Critical path: {len(schedule.critical_path)} task(s) "
+        f"({' -> '.join(schedule.critical_path)}); max parallelism {schedule.max_parallelism}"
+    )
+    ctx.exit(1 if failed else 0)
+
+
+def _parse_worker_range(value: str) -> tuple[int, int]:
+    low, separator, high = value.partition("..")
+    try:
+        return (int(low), int(high)) if separator else (1, int(low))
+    except ValueError:
+        raise click.BadParameter(f"expected N or A..B, got {value!r}") from None
+
+
+def _parse_weights(values: tuple[str, ...]) -> dict[str, float]:
+    weights = dict(DEFAULT_COMPLEXITY_WEIGHTS)
+    for value in values:
+        name, separator, number = value.partition("=")
+        try:
+            if not separator:
+                raise ValueError(value)
+            weights[name.strip().lower()] = float(number)
+        except ValueError:
+            raise click.BadParameter(f"expected Complexity=duration, got {value!r}") from None
+    return weights
+
+
+@plan_cmd.command("simulate")
+@specs_dir_option
+@click.option(
+    "--workers",
+    default="1..8",
+    show_default=True,
+    help="Worker count N (simulates 1..N) or an explicit range A..B.",
+)
+@click.option(
+    "--weight",
+    "weight_values",
+    multiple=True,
+    metavar="COMPLEXITY=DURATION",
+    help="Duration weight per Complexity value (default: Low=1, High=3).",
+)
+@click.option(
+    "--history",
+    "history_path",
+    type=click.Path(path_type=Path, exists=True, dir_okay=False),
+    default=None,
+    help="Recorded run durations (JSON/JSONL) used to calibrate the weights.",
+)
+@click.option("--json", "as_json", is_flag=True, help="Emit the prediction as JSON.")
+@click.pass_context
+def simulate_cmd(
+    ctx: click.Context,
+    specs_dir: Path | None,
+    workers: str,
+    weight_values: tuple[str, ...],
+    history_path: Path | None,
+    as_json: bool,
+) -> None:
+    """Predict build wall-clock time for a range of worker counts.
+
+    Runs list scheduling over the DependsOn DAG with Complexity-based task
+    durations and reports where adding workers stops shortening the build.
+    """
+    min_workers, max_workers = _parse_worker_range(workers)
+    weights = _parse_weights(weight_values)
+    spec_dir = _resolve_spec_dir(ctx, specs_dir)
+    try:
+        task_blocks = parse_task_blocks(read_file_content(spec_dir / "tasks.md"))
+        if history_path is not None:
+            weights = calibrate_weights(history_path, task_blocks, weights)
+    except (FileReadError, OSError, ValueError) as e:
+        print_error(str(e))
+        ctx.exit(1)
+
+    graph = build_task_graph(task_blocks)
+    try:
+        result = simulate_build(
+            graph, task_durations(task_blocks, weights), max_workers, min_workers
+        )
+    except ValueError as e:
+        print_error(str(e))
+        ctx.exit(1)
+
+    if as_json:
+        payload = {
+            "weights": weights,
+            "total_work": result.total_work,
+            "critical_path_time": result.critical_path_time,
+            "saturation_workers": result.saturation_workers,
+            "points": [asdict(point) for point in result.points],
+        }
+        click.echo(json.dumps(payload, indent=2))
+        return
+
+    click.echo(f"{'workers':>7}  {'makespan':>10}  {'utilization':>11}  {'speedup':>7}")
+    for point in result.points:
+        click.echo(
+            f"{point.workers:>7}  {point.makespan:>10.2f}  "
+            f"{point.utilization:>10.0%}  {point.speedup:>7.2f}"
+        )
+    print_info(
+        f"Total work {result.total_work:.2f}, critical path {result.critical_path_time:.2f}; "
+        f"more than {result.saturation_workers} worker(s) stop helping."
+    )
@@ -2,9 +2,22 @@
 
 from __future__ import annotations
 
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, TextIO
+
+import click
+
 from pb_spec.output import print_error, print_info, print_success, print_warning
+from pb_spec.profiling import traced
 from pb_spec.validation.result import ErrorSeverity, ValidationError, ValidationResult
-from pb_spec.validation.rumdl import FormatResult
+
+if TYPE_CHECKING:
+    from pb_spec.profiling import SpanSummary
+    from pb_spec.validation.rumdl import FormatResult
+    from pb_spec.validation.scanner import ScanStats
+    from pb_spec.watch import IssueDelta
 
 _SEVERITY_PREFIX: dict[ErrorSeverity, str] = {
     ErrorSeverity.CRITICAL: "[CRITICAL]",
@@ -13,6 +26,10 @@ _SEVERITY_PREFIX: dict[ErrorSeverity, str] = {
     ErrorSeverity.LOW: "[LOW]",
 }
 
+_SCAN_RESULT_SHOWN = 10
+
+_MODE_LABELS = {"plan": "Post-Plan", "build": "Post-Build"}
+
 
 def _format_location(error: ValidationError) -> str:
     if not error.file_path:
@@ -25,6 +42,7 @@ def _format_location(error: ValidationError) -> str:
     return f" ({':'.join(parts[:2])}{' ' + ' '.join(parts[2:]) if len(parts) > 2 else ''})"
 
 
+@traced("report")
 def report_validation_result(result: ValidationResult, label: str) -> None:
     """Print validation errors and warnings with colored output."""
     print_info(f"Running {label} Validation")
@@ -51,6 +69,7 @@ def report_format_result(result: FormatResult) -> None:
             print_warning(msg)
 
 
+@traced("report")
 def report_scan_result(result: ValidationResult) -> bool:
     """Print scan issues grouped by type and return whether the scan is clean.
 
@@ -61,17 +80,355 @@ def report_scan_result(result: ValidationResult) -> bool:
         print_success("Codebase scan passed - no issues found.")
         return True
 
-    passed = True
+    # One pass: count every error but keep only the first few of each severity.
     severity_counts: dict[ErrorSeverity, int] = {}
+    shown: dict[ErrorSeverity, list[ValidationError]] = {}
     for error in result.errors:
-        severity_counts[error.severity] = severity_counts.get(error.severity, 0) + 1
+        count = severity_counts.get(error.severity, 0)
+        severity_counts[error.severity] = count + 1
+        if count < _SCAN_RESULT_SHOWN:
+            shown.setdefault(error.severity, []).append(error)
 
     for severity, count in sorted(severity_counts.items(), key=lambda x: x[0].value):
         print_error(f"Found {count} {severity.value} issue(s):")
-        severity_errors = [e for e in result.errors if e.severity == severity]
-        for error in severity_errors[:10]:
+        for error in shown[severity]:
             print_info(f"  {error.message}{_format_location(error)}")
-        if len(severity_errors) > 10:
-            print_info(f"  ... and {len(severity_errors) - 10} more")
-        passed = False
-    return passed
+        if count > _SCAN_RESULT_SHOWN:
+            print_info(f"  ... and {count - _SCAN_RESULT_SHOWN} more")
+    return not severity_counts
+
+
+def report_mode_result(result: ValidationResult, mode: str) -> None:
+    """Print ``result`` as a scan summary for --task, else as a labelled validation."""
+    if mode == "task":
+        report_scan_result(result)
+    else:
+        report_validation_result(result, _MODE_LABELS[mode])
+
+
+def report_outcome(passed: bool) -> None:
+    """Print the closing pass/fail line of a text report."""
+    if passed:
+        print_success("All validations passed successfully!")
+    else:
+        print_error("Validation Failed. Please fix the above issues.")
+
+
+def report_baseline(suppressed: int, skipped_files: int) -> None:
+    """Print how many known issues and unchanged files a baseline left out."""
+    print_info(
+        f"Baseline: {suppressed} known issue(s) suppressed, "
+        f"{skipped_files} unchanged file(s) not re-read"
+    )
+
+
+def report_issue_delta(delta: IssueDelta, result: ValidationResult, elapsed: float) -> None:
+    """Print only the issues introduced (+) and resolved (-) by a revalidation."""
+    for error in delta.new:
+        prefix = _SEVERITY_PREFIX.get(error.severity, "")
+        print_error(f"+ {prefix} {error.message}{_format_location(error)}")
+    for error in delta.resolved:
+        prefix = _SEVERITY_PREFIX.get(error.severity, "")
+        print_success(f"- {prefix} {error.message}{_format_location(error)}")
+    for warning in delta.new_warnings:
+        print_warning(f"+ {warning}")
+    for warning in delta.resolved_warnings:
+        print_success(f"- {warning}")
+    summary = (
+        f"{len(result.errors)} error(s), {len(result.warnings)} warning(s) "
+        f"[+{len(delta.new)} -{len(delta.resolved)}] in {elapsed:.2f}s"
+    )
+    if result.is_valid:
+        print_success(f"Revalidated: {summary}")
+    else:
+        print_info(f"Revalidated: {summary}")
+
+
+def report_profile(summaries: list[SpanSummary]) -> None:
+    """Print per-span call counts and wall times to stderr, slowest first.
+
+    Spans nest (``validate_build`` contains its phases), so totals overlap.
+    """
+    width = max((len(summary.name) for summary in summaries), default=4)
+    click.echo(f"{'span':<{width}} {'calls':>7} {'total':>11} {'max':>11}", err=True)
+    for summary in summaries:
+        click.echo(
+            f"{summary.name:<{width}} {summary.calls:>7} "
+            f"{summary.total_ms:>9.1f}ms {summary.max_ms:>9.1f}ms",
+            err=True,
+        )
+
+
+def report_scan_stats(stats: ScanStats, limit: int = 10) -> None:
+    """Print scan rule costs, the slowest files and per-extension throughput to stderr."""
+    patterns = stats.patterns_by_time()
+    total_ns = sum(p.time_ns for p in patterns) or 1
+    click.echo("Scan rules by cumulative search time:", err=True)
+    click.echo(f"  {'time':>10} {'share':>6} {'evals':>9} {'hits':>7}  rule", err=True)
+    for p in patterns:
+        click.echo(
+            f"  {p.time_ns / 1e6:>8.1f}ms {p.time_ns / total_ns:>6.1%} {p.evaluations:>9} "
+            f"{p.hits:>7}  {p.issue_type.value}: {p.pattern}",
+            err=True,
+        )
+    click.echo(f"Slowest files ({len(stats.files)} scanned):", err=True)
+    for f in stats.slowest_files(limit):
+        click.echo(
+            f"  {f.time_ns / 1e6:>8.1f}ms {f.size / 1024:>8.1f} KiB {f.lines:>7} lines  {f.path}",
+            err=True,
+        )
+    click.echo("Throughput by extension:", err=True)
+    for t in stats.throughput_by_extension():
+        click.echo(
+            f"  {t.extension or '(none)':<8} {t.files:>6} files {t.size / 1024:>10.1f} KiB "
+            f"{t.bytes_per_second / 2**20:>8.2f} MiB/s",
+            err=True,
+        )
+
+
+class JsonlWriter:
+    """Stream validation records to stdout as JSON Lines.
+
+    Each error and warning becomes one ``{"type": ...}`` object, written in
+    batches of about ``buffer_size`` characters. Only per-severity counts are
+    kept, so memory stays constant however many errors are streamed. ``close``
+    appends the ``summary`` record and flushes.
+    """
+
+    def __init__(self, stream: TextIO | None = None, buffer_size: int = 64 * 1024) -> None:
+        self._stream = stream
+        self._buffer_size = buffer_size
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self._lock = threading.Lock()
+        self.severity_counts = dict.fromkeys(ErrorSeverity, 0)
+        self.warnings = 0
+
+    def error(self, error: ValidationError) -> None:
+        """Write one error record; safe to call from a worker thread."""
+        with self._lock:
+            self.severity_counts[error.severity] += 1
+            self._write({"type": "error", **error.to_dict()})
+
+    def warning(self, message: str) -> None:
+        """Write one warning record."""
+        with self._lock:
+            self.warnings += 1
+            self._write({"type": "warning", "message": message})
+
+    def result(self, result: ValidationResult) -> None:
+        """Write every error and warning collected in ``result``."""
+        for error in result.errors:
+            self.error(error)
+        for warning in result.warnings:
+            self.warning(warning)
+
+    def close(self, mode: str, is_valid: bool) -> None:
+        """Write the summary record with the error and warning counts, then flush."""
+        with self._lock:
+            self._write(
+                {
+                    "type": "summary",
+                    "mode": mode,
+                    "is_valid": is_valid,
+                    "errors": sum(self.severity_counts.values()),
+                    "warnings": self.warnings,
+                    "by_severity": {s.value: n for s, n in self.severity_counts.items()},
+                }
+            )
+            self._flush()
+
+    def _write(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        self._buffer.append(line)
+        self._buffered += len(line)
+        if self._buffered >= self._buffer_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        click.echo("".join(self._buffer), file=self._stream, nl=False)
+        self._buffer.clear()
+        self._buffered = 0
+
+
+# Declaration order of ErrorSeverity is most to least severe; warnings rank last.
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(ErrorSeverity)}
+_AGENT_LOCATIONS = 3
+_AGENT_MESSAGES = 5
+_CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class _Digest:
+    """Occurrences of one distinct message, with its first few locations."""
+
+    count: int = 0
+    locations: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _PatternGroup:
+    """Messages of one severity sharing a pattern, such as every "Todo found: ..."."""
+
+    severity: ErrorSeverity | None
+    pattern: str
+    count: int = 0
+    files: set[str] = field(default_factory=set)
+    messages: dict[str, _Digest] = field(default_factory=dict)
+
+    @property
+    def rank(self) -> int:
+        """Return the sort rank: severity order, then warnings."""
+        return len(_SEVERITY_RANK) if self.severity is None else _SEVERITY_RANK[self.severity]
+
+    def add(self, message: str, file_path: str | None, location: str | None) -> None:
+        """Count one occurrence of ``message``."""
+        self.count += 1
+        if file_path:
+            self.files.add(file_path)
+        digest = self.messages.setdefault(message, _Digest())
+        digest.count += 1
+        if location and len(digest.locations) < _AGENT_LOCATIONS:
+            digest.locations.append(location)
+
+    def render(self) -> str:
+        """Return the group as one line, or a header line with one line per message."""
+        prefix = "[WARNING]" if self.severity is None else _SEVERITY_PREFIX[self.severity]
+        if len(self.messages) == 1:
+            message, digest = next(iter(self.messages.items()))
+            return f"{prefix} {message}{_digest_suffix(digest)}"
+        where = f" in {len(self.files)} file(s)" if self.files else ""
+        lines = [f"{prefix} {self.pattern} ×{self.count}{where}:"]
+        ranked = sorted(self.messages.items(), key=lambda item: -item[1].count)
+        for message, digest in ranked[:_AGENT_MESSAGES]:
+            lines.append(f"  - {message.removeprefix(f'{self.pattern}: ')}{_digest_suffix(digest)}")
+        rest = ranked[_AGENT_MESSAGES:]
+        if rest:
+            occurrences = sum(digest.count for _, digest in rest)
+            lines.append(f"  - +{len(rest)} more distinct message(s), {occurrences} occurrence(s)")
+        return "\n".join(lines)
+
+
+def _digest_suffix(digest: _Digest) -> str:
+    times = f" ×{digest.count}" if digest.count > 1 else ""
+    if not digest.locations:
+        return times
+    more = digest.count - len(digest.locations)
+    extra = f", +{more} more" if more > 0 else ""
+    return f"{times} ({', '.join(digest.locations)}{extra})"
+
+
+def _message_pattern(message: str) -> str:
+    """Return the part repeats of a message share: the text before its first ": "."""
+    head, separator, _ = message.partition(": ")
+    return head if separator else message
+
+
+def _short_location(error: ValidationError) -> str | None:
+    if not error.file_path:
+        return None
+    return f"{error.file_path}:{error.line_number}" if error.line_number else error.file_path
+
+
+def _count_phrase(counts: dict[ErrorSeverity, int]) -> str:
+    return ", ".join(f"{n} {s.value}" for s, n in counts.items() if n)
+
+
+class AgentReport:
+    """Condense validation records into a compact digest for an agent's context window.
+
+    Identical messages are merged across files and messages sharing a pattern
+    are collapsed into one group with counts and up to three representative
+    locations each. Groups are printed most severe first until the approximate
+    token budget (four characters per token) is spent; anything left out is
+    counted in a final "Omitted" line. Memory grows with the number of distinct
+    messages, not occurrences.
+    """
+
+    def __init__(self, budget: int, stream: TextIO | None = None) -> None:
+        self.budget = budget
+        self._stream = stream
+        self._groups: dict[tuple[ErrorSeverity | None, str], _PatternGroup] = {}
+        self._lock = threading.Lock()
+        self.severity_counts = dict.fromkeys(ErrorSeverity, 0)
+        self.warnings = 0
+
+    def error(self, error: ValidationError) -> None:
+        """Add one error; safe to call from a worker thread."""
+        message = " ".join(error.message.split())
+        with self._lock:
+            self.severity_counts[error.severity] += 1
+            self._add(error.severity, message, error.file_path, _short_location(error))
+
+    def warning(self, message: str) -> None:
+        """Add one warning."""
+        message = " ".join(message.split())
+        with self._lock:
+            self.warnings += 1
+            self._add(None, message, None, None)
+
+    def result(self, result: ValidationResult) -> None:
+        """Add every error and warning collected in ``result``."""
+        for error in result.errors:
+            self.error(error)
+        for warning in result.warnings:
+            self.warning(warning)
+
+    def close(self, mode: str, is_valid: bool) -> None:
+        """Print the digest."""
+        click.echo(self.render(mode, is_valid), file=self._stream)
+
+    def render(self, mode: str, is_valid: bool) -> str:
+        """Return the digest, truncated to the token budget."""
+        errors = sum(self.severity_counts.values())
+        breakdown = _count_phrase(self.severity_counts)
+        lines = [
+            f"validate --{mode} {'passed' if is_valid else 'FAILED'}: {errors} error(s)"
+            f"{f' ({breakdown})' if breakdown else ''}, {self.warnings} warning(s)"
+        ]
+        limit = self.budget * _CHARS_PER_TOKEN
+        used = len(lines[0]) + 1
+        groups = sorted(self._groups.values(), key=lambda g: (g.rank, -g.count, g.pattern))
+        notes = self._omission_notes(groups)
+        for index, group in enumerate(groups):
+            block = group.render()
+            # Keep room for the note that would follow if later groups are left out.
+            reserve = len(notes[index + 1]) + 1 if index + 1 < len(groups) else 0
+            if used + len(block) + 1 + reserve > limit:
+                lines.append(notes[index])
+                break
+            lines.append(block)
+            used += len(block) + 1
+        return "\n".join(lines)
+
+    def _add(
+        self,
+        severity: ErrorSeverity | None,
+        message: str,
+        file_path: str | None,
+        location: str | None,
+    ) -> None:
+        pattern = _message_pattern(message)
+        group = self._groups.get((severity, pattern))
+        if group is None:
+            group = self._groups[severity, pattern] = _PatternGroup(severity, pattern)
+        group.add(message, file_path, location)
+
+    def _omission_notes(self, groups: list[_PatternGroup]) -> list[str]:
+        """Return, for each index, the note describing ``groups[index:]`` as omitted."""
+        notes: list[str] = []
+        counts = dict.fromkeys(ErrorSeverity, 0)
+        warnings = 0
+        for remaining, group in enumerate(reversed(groups), start=1):
+            if group.severity is None:
+                warnings += group.count
+            else:
+                counts[group.severity] += group.count
+            breakdown = _count_phrase(counts)
+            notes.append(
+                f"Omitted to fit the ~{self.budget}-token budget: {remaining} group(s) with "
+                f"{sum(counts.values())} error(s){f' ({breakdown})' if breakdown else ''} and "
+                f"{warnings} warning(s). Use --format jsonl for the full list."
+            )
+        notes.reverse()
+        return notes
@@ -0,0 +1,62 @@
+"""Specs command group for pb-spec (spec directory listing)."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import click
+
+from pb_spec.output import print_error, print_info
+from pb_spec.spec_index import SpecIndexEntry, refresh_spec_index, spec_sort_key
+
+
+@click.group("specs")
+def specs_cmd() -> None:
+    """Inspect spec directories under specs/."""
+
+
+def _format_entry(entry: SpecIndexEntry) -> str:
+    counts = ", ".join(f"{status} ×{n}" for status, n in sorted(entry.status_counts.items()))
+    line = f"{entry.name}  [{counts or 'no tasks'}]"
+    if entry.last_validation is not None:
+        verdict = "passed" if entry.last_validation.passed else "failed"
+        line += f"  last {entry.last_validation.mode}: {verdict}"
+    return line
+
+
+@specs_cmd.command("list")
+@click.option(
+    "--specs-dir",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Path to specs directory (default: specs/).",
+)
+@click.option("--json", "as_json", is_flag=True, help="Emit the index as JSON.")
+@click.pass_context
+def list_cmd(ctx: click.Context, specs_dir: Path | None, as_json: bool) -> None:
+    """List spec directories, newest last, with task status counts.
+
+    Refreshes the specs/.index manifest incrementally: only specs whose
+    tasks.md changed since the last refresh are re-parsed.
+    """
+    specs_dir = specs_dir or Path("specs")
+    if not specs_dir.is_dir():
+        print_error("Directory 'specs/' not found. Run /pb-plan first.")
+        ctx.exit(1)
+
+    index = refresh_spec_index(specs_dir)
+    entries = sorted(index.entries.values(), key=lambda e: spec_sort_key(e.name))
+
+    if as_json:
+        click.echo(
+            json.dumps({"latest": index.latest, "specs": [asdict(e) for e in entries]}, indent=2)
+        )
+        return
+
+    if not entries:
+        print_info("No feature specs found in 'specs/'.")
+        return
+    for entry in entries:
+        click.echo(_format_entry(entry))
@@ -1,22 +1,61 @@
-"""Validate command for pb-spec with --plan, --build, and --task modes."""
+"""Validate command for pb-spec with --plan, --build, and --task modes.
+
+Only what forwarding to a warm daemon needs is imported here; the validation
+stack in :mod:`pb_spec.commands.validate_local` loads only when the daemon
+does not answer.
+"""
 
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 import click
 
 from pb_spec.commands.discovery import get_latest_spec_dir
-from pb_spec.commands.report import (
-    report_format_result,
-    report_scan_result,
-    report_validation_result,
-)
+from pb_spec.commands.report import report_format_result, report_mode_result, report_outcome
+from pb_spec.config import AGENT_TOKEN_BUDGET
+from pb_spec.daemon_client import request_validation
 from pb_spec.exceptions import SpecNotFoundError
-from pb_spec.output import print_error, print_success
-from pb_spec.validation.build import validate_build, validate_task
-from pb_spec.validation.plan import load_contract_config, validate_plan
-from pb_spec.validation.rumdl import run_rumdl_format
+from pb_spec.spec_index import record_validation_outcome
+from pb_spec.validation.result import ValidationResult
+
+
+def _validate_via_daemon(
+    ctx: click.Context, mode: str, specs_dir: Path | None, config_path: Path | None
+) -> None:
+    """Run the validation in a warm daemon and exit with its status.
+
+    Returns, so the caller validates in-process, when there is no spec to
+    validate or the daemon does not handle the request.
+    """
+    spec_dir = None
+    payload: dict[str, Any] = {"mode": mode}
+    if mode == "task":
+        payload["root"] = str(Path.cwd())
+    else:
+        try:
+            spec_dir = get_latest_spec_dir(specs_dir)
+        except SpecNotFoundError:
+            return
+        payload["spec_dir"] = str(spec_dir.resolve())
+    if config_path is not None:
+        payload["config"] = str(config_path.resolve())
+    reply = request_validation(payload)
+    if reply is None:
+        return
+    if "format" in reply:
+        from pb_spec.validation.rumdl import FormatResult
+
+        report_format_result(
+            FormatResult(success=reply["format"]["success"], messages=reply["format"]["messages"])
+        )
+    result = ValidationResult.from_dict(reply["result"])
+    report_mode_result(result, mode)
+    if spec_dir is not None:
+        record_validation_outcome(spec_dir, mode, result.is_valid)
+    report_outcome(result.is_valid)
+    ctx.exit(0 if result.is_valid else 1)
 
 
 @click.command("validate")
@@ -51,55 +90,164 @@ from pb_spec.validation.rumdl import run_rumdl_format
     default=None,
     help="Path to project-specific contract_sections.toml.",
 )
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="Keep running and revalidate incrementally whenever files change.",
+)
+@click.option(
+    "--poll",
+    is_flag=True,
+    help="With --watch, poll file timestamps instead of using inotify.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print per-phase call counts and wall times to stderr.",
+)
+@click.option(
+    "--trace",
+    "trace_path",
+    type=click.Path(path_type=Path, dir_okay=False),
+    default=None,
+    help="Write Chrome trace-event JSON (open in Perfetto) to this file.",
+)
+@click.option(
+    "--cprofile",
+    "cprofile_path",
+    type=click.Path(path_type=Path, dir_okay=False),
+    default=None,
+    help="Write cProfile stats (pstats format) to this file.",
+)
+@click.option(
+    "--tracemalloc",
+    "tracemalloc_path",
+    type=click.Path(path_type=Path, dir_okay=False),
+    default=None,
+    help="Write the top tracemalloc allocation sites and peak memory to this file.",
+)
+@click.option(
+    "--scan-stats",
+    "show_scan_stats",
+    is_flag=True,
+    help="Print per-pattern scan cost, the slowest files and per-extension throughput.",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(path_type=Path, dir_okay=False),
+    default=None,
+    help="Write OpenMetrics (node_exporter textfile) metrics here, replaced atomically.",
+)
+@click.option(
+    "--baseline",
+    "baseline_path",
+    type=click.Path(path_type=Path, dir_okay=False, exists=True),
+    default=None,
+    help="Suppress scan issues recorded by `pb-spec baseline create`.",
+)
+@click.option(
+    "--rev",
+    default=None,
+    metavar="REF",
+    help="With --build or --task, scan the code as committed at this git revision.",
+)
+@click.option(
+    "--staged",
+    is_flag=True,
+    help="With --build or --task, scan the code as staged in the git index.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "jsonl", "agent"]),
+    default="text",
+    show_default=True,
+    help=(
+        "text: colored report; jsonl: one JSON object per error, then a summary record; "
+        "agent: deduplicated digest sized to --budget."
+    ),
+)
+@click.option(
+    "--budget",
+    type=click.IntRange(min=1),
+    default=AGENT_TOKEN_BUDGET,
+    show_default=True,
+    help="With --format agent, the approximate output size in tokens.",
+)
 @click.pass_context
 def validate_cmd(
     ctx: click.Context,
     mode: str | None,
     specs_dir: Path | None,
     config_path: Path | None,
+    watch: bool,
+    poll: bool,
+    profile: bool,
+    trace_path: Path | None,
+    cprofile_path: Path | None,
+    tracemalloc_path: Path | None,
+    show_scan_stats: bool,
+    metrics_file: Path | None,
+    baseline_path: Path | None,
+    rev: str | None,
+    staged: bool,
+    output_format: str,
+    budget: int,
 ) -> None:
     """Validate pb-spec workflow artifacts at different stages.
 
     Use --plan after /pb-plan to check spec structure.
     Use --build after /pb-build to verify task completion.
+    --plan and --build record their outcome in the specs/.index manifest.
     Use --task for subagent self-check before signaling READY_FOR_EVAL.
     Use --config to load project-specific validation rules.
+    Use --watch to revalidate on every change, printing only new and resolved issues.
+    Use --profile, --trace, --cprofile or --tracemalloc to see where the time goes,
+    and --scan-stats to see which scan rules and files cost the most.
+    Use --metrics-file to export run metrics for Prometheus; with --watch the
+    file is rewritten after every revalidation.
+    Use --baseline to report only scan issues missing from a recorded baseline.
+    Use --rev or --staged to scan a commit or the index without checking it
+    out; --task then checks the files that revision or the index changes.
+    Use --format jsonl to stream machine-readable records as they are found,
+    or --format agent for a compact digest that fits a token --budget.
+    These options always validate in-process.
     """
-    if config_path is not None:
-        load_contract_config(config_path)
-    if mode is None:
-        print_error("Must specify one of --plan, --build, or --task")
-        click.echo("Run 'pb-spec validate --help' for usage information.")
-        ctx.exit(1)
+    profiled = profile or any(
+        path is not None for path in (trace_path, cprofile_path, tracemalloc_path)
+    )
+    if (
+        mode is not None
+        and not watch
+        and not profiled
+        and not show_scan_stats
+        and metrics_file is None
+        and baseline_path is None
+        and rev is None
+        and not staged
+        and output_format == "text"
+    ):
+        _validate_via_daemon(ctx, mode, specs_dir, config_path)
 
-    all_passed = True
+    # Deferred: a forwarded validation never needs the in-process stack.
+    from pb_spec.commands.validate_local import run_validation
 
-    if mode in ("plan", "build"):
-        try:
-            latest_spec = get_latest_spec_dir(specs_dir)
-        except SpecNotFoundError as e:
-            print_error(str(e))
-            ctx.exit(1)
-
-        if mode == "plan":
-            format_result = run_rumdl_format(latest_spec)
-            report_format_result(format_result)
-            result = validate_plan(latest_spec)
-            report_validation_result(result, "Post-Plan")
-            all_passed = result.is_valid
-
-        elif mode == "build":
-            result = validate_build(latest_spec)
-            report_validation_result(result, "Post-Build")
-            all_passed = result.is_valid
-
-    elif mode == "task":
-        result = validate_task()
-        all_passed = report_scan_result(result)
-
-    if not all_passed:
-        print_error("Validation Failed. Please fix the above issues.")
-        ctx.exit(1)
-    else:
-        print_success("All validations passed successfully!")
-        ctx.exit(0)
+    run_validation(
+        ctx,
+        mode=mode,
+        specs_dir=specs_dir,
+        config_path=config_path,
+        watch=watch,
+        poll=poll,
+        profile=profile,
+        trace_path=trace_path,
+        cprofile_path=cprofile_path,
+        tracemalloc_path=tracemalloc_path,
+        show_scan_stats=show_scan_stats,
+        metrics_file=metrics_file,
+        baseline_path=baseline_path,
+        rev=rev,
+        staged=staged,
+        output_format=output_format,
+        budget=budget,
+    )
@@ -0,0 +1,331 @@
+"""In-process validation behind ``pb-spec validate``.
+
+Imported only once the daemon has not answered, so a forwarded validation
+never loads the build, plan and scanner modules in the client.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+
+from pb_spec.commands.discovery import get_latest_spec_dir, project_root_for
+from pb_spec.commands.report import (
+    AgentReport,
+    JsonlWriter,
+    report_baseline,
+    report_format_result,
+    report_issue_delta,
+    report_mode_result,
+    report_outcome,
+    report_profile,
+    report_scan_stats,
+)
+from pb_spec.exceptions import BaselineError, ContractConfigError, GitError, SpecNotFoundError
+from pb_spec.git_utils import GitBlobs
+from pb_spec.output import print_error, print_info
+from pb_spec.profiling import profiling_session
+from pb_spec.spec_index import record_validation_outcome
+from pb_spec.validation.baseline import Baseline, load_baseline
+from pb_spec.validation.build import validate_build, validate_task
+from pb_spec.validation.contract_config import ContractConfig, load_contract_config
+from pb_spec.validation.plan import validate_plan
+from pb_spec.validation.result import ValidationResult
+from pb_spec.validation.rumdl import run_rumdl_format
+from pb_spec.validation.scanner import ScanStats
+
+if TYPE_CHECKING:
+    from pb_spec.metrics import MetricsFile
+
+
+def _revision_blobs(
+    ctx: click.Context, root: Path, rev: str | None, staged: bool
+) -> GitBlobs | None:
+    """Open the git revision or index to scan, or return None for the working tree."""
+    if rev is None and not staged:
+        return None
+    try:
+        return GitBlobs(root, rev)
+    except GitError as e:
+        print_error(str(e))
+        ctx.exit(1)
+
+
+def _report(
+    result: ValidationResult,
+    mode: str,
+    writer: JsonlWriter | AgentReport | None,
+    baseline: Baseline | None = None,
+) -> None:
+    """Print ``result`` for ``mode``, or stream its collected records to ``writer``."""
+    if writer is not None:
+        writer.result(result)
+        return
+    report_mode_result(result, mode)
+    if baseline is not None:
+        report_baseline(baseline.suppressed, baseline.skipped_files)
+
+
+def _watch(
+    mode: str,
+    spec_dir: Path | None,
+    config: ContractConfig | None,
+    polling: bool,
+    metrics: MetricsFile | None = None,
+    baseline: Baseline | None = None,
+) -> bool:
+    """Validate once, then revalidate on every change until interrupted.
+
+    After the first full report only new and resolved issues are printed, and
+    ``metrics`` (if given) is rewritten after every validation.
+    Returns whether the last validation passed.
+    """
+    # Deferred: only --watch needs the watcher (ctypes, select) machinery.
+    from pb_spec.watch import (
+        IssueIndex,
+        Revalidator,
+        create_watcher,
+        relevant_changes,
+        wait_for_changes,
+    )
+
+    revalidator = Revalidator(mode, spec_dir, Path("."), config, baseline)
+    if mode == "plan" and spec_dir is not None:
+        report_format_result(run_rumdl_format(spec_dir))
+    started = time.perf_counter()
+    result = revalidator.validate()
+    if metrics is not None:
+        metrics.record(mode, spec_dir, result, time.perf_counter() - started)
+    report_mode_result(result, mode)
+    if spec_dir is not None:
+        record_validation_outcome(spec_dir, mode, result.is_valid)
+    index = IssueIndex()
+    index.update(result)
+
+    if spec_dir is None:
+        root = Path(".")
+    else:
+        root = spec_dir if mode == "plan" else project_root_for(spec_dir)
+    watcher = create_watcher(root.resolve(), polling=polling)
+    print_info(f"Watching {root} for changes (Ctrl+C to stop)")
+    try:
+        while True:
+            changed = relevant_changes(wait_for_changes(watcher))
+            if not changed:
+                continue
+            started = time.perf_counter()
+            revalidated = revalidator.revalidate(changed)
+            if revalidated is None:
+                continue
+            result = revalidated
+            elapsed = time.perf_counter() - started
+            if metrics is not None:
+                metrics.record(mode, spec_dir, result, elapsed)
+            report_issue_delta(index.update(result), result, elapsed)
+            if spec_dir is not None:
+                record_validation_outcome(spec_dir, mode, result.is_valid)
+    except KeyboardInterrupt:
+        return result.is_valid
+    finally:
+        watcher.close()
+
+
+def run_validation(
+    ctx: click.Context,
+    *,
+    mode: str | None,
+    specs_dir: Path | None,
+    config_path: Path | None,
+    watch: bool,
+    poll: bool,
+    profile: bool,
+    trace_path: Path | None,
+    cprofile_path: Path | None,
+    tracemalloc_path: Path | None,
+    show_scan_stats: bool,
+    metrics_file: Path | None,
+    baseline_path: Path | None,
+    rev: str | None,
+    staged: bool,
+    output_format: str,
+    budget: int,
+) -> None:
+    """Run ``pb-spec validate`` in this process, profiled if asked, and exit with its status."""
+    scan_stats = ScanStats() if show_scan_stats else None
+    profiled = profile or any(
+        path is not None for path in (trace_path, cprofile_path, tracemalloc_path)
+    )
+    metrics = None
+    if metrics_file is not None:
+        from pb_spec.metrics import MetricsFile
+
+        metrics = MetricsFile(metrics_file)
+
+    def run() -> None:
+        _validate(
+            ctx,
+            mode=mode,
+            specs_dir=specs_dir,
+            config_path=config_path,
+            watch=watch,
+            poll=poll,
+            scan_stats=scan_stats,
+            metrics=metrics,
+            baseline_path=baseline_path,
+            rev=rev,
+            staged=staged,
+            output_format=output_format,
+            budget=budget,
+        )
+
+    try:
+        if not profiled:
+            run()
+            return
+        with profiling_session(profile, trace_path, cprofile_path, tracemalloc_path) as recorder:
+            try:
+                run()
+            finally:
+                if profile and recorder is not None:
+                    report_profile(recorder.summary())
+    finally:
+        if scan_stats is not None and scan_stats.patterns:
+            report_scan_stats(scan_stats)
+
+
+def _validate(
+    ctx: click.Context,
+    *,
+    mode: str | None,
+    specs_dir: Path | None,
+    config_path: Path | None,
+    watch: bool,
+    poll: bool,
+    scan_stats: ScanStats | None,
+    metrics: MetricsFile | None,
+    baseline_path: Path | None,
+    rev: str | None,
+    staged: bool,
+    output_format: str,
+    budget: int,
+) -> None:
+    """Run the selected validation and exit with its status."""
+    config = None
+    if config_path is not None:
+        try:
+            config = load_contract_config(config_path)
+        except ContractConfigError as e:
+            print_error(str(e))
+            ctx.exit(1)
+    baseline = None
+    if baseline_path is not None:
+        try:
+            baseline = load_baseline(baseline_path)
+        except BaselineError as e:
+            print_error(str(e))
+            ctx.exit(1)
+    if mode is None:
+        print_error("Must specify one of --plan, --build, or --task")
+        click.echo("Run 'pb-spec validate --help' for usage information.")
+        ctx.exit(1)
+
+    if watch and output_format != "text":
+        print_error("--watch only supports --format text")
+        ctx.exit(1)
+    if rev is not None or staged:
+        if rev is not None and staged:
+            print_error("--rev and --staged are mutually exclusive")
+            ctx.exit(1)
+        if watch or mode == "plan":
+            print_error("--rev and --staged only apply to --build and --task without --watch")
+            ctx.exit(1)
+
+    all_passed = True
+    writer: JsonlWriter | AgentReport | None = None
+    if output_format == "jsonl":
+        writer = JsonlWriter()
+    elif output_format == "agent":
+        writer = AgentReport(budget)
+    on_error = writer.error if writer is not None else None
+    phase_timings: dict[str, float] | None = None
+    if metrics is not None:
+        phase_timings = {}
+        scan_stats = scan_stats or ScanStats(count_patterns=False)
+
+    if mode in ("plan", "build"):
+        try:
+            latest_spec = get_latest_spec_dir(specs_dir)
+        except SpecNotFoundError as e:
+            print_error(str(e))
+            ctx.exit(1)
+        if watch:
+            ctx.exit(0 if _watch(mode, latest_spec, config, poll, metrics, baseline) else 1)
+
+        started = time.perf_counter()
+        if mode == "plan":
+            format_result = run_rumdl_format(latest_spec)
+            result = validate_plan(latest_spec, config, phase_timings)
+            duration = time.perf_counter() - started
+            if writer is None:
+                report_format_result(format_result)
+            _report(result, mode, writer)
+            if metrics is not None:
+                metrics.record(mode, latest_spec, result, duration, None, phase_timings)
+
+        elif mode == "build":
+            blobs = _revision_blobs(ctx, project_root_for(latest_spec), rev, staged)
+            with blobs or nullcontext():
+                result = validate_build(
+                    latest_spec,
+                    scan_stats=scan_stats,
+                    phase_timings=phase_timings,
+                    on_error=on_error,
+                    baseline=baseline,
+                    blobs=blobs,
+                )
+            duration = time.perf_counter() - started
+            _report(result, mode, writer, baseline)
+            if metrics is not None:
+                metrics.record(
+                    mode,
+                    latest_spec,
+                    result,
+                    duration,
+                    scan_stats,
+                    phase_timings,
+                    error_counts=writer.severity_counts if writer is not None else None,
+                )
+        all_passed = result.is_valid
+        record_validation_outcome(latest_spec, mode, all_passed)
+
+    elif mode == "task":
+        if watch:
+            ctx.exit(0 if _watch(mode, None, None, poll, metrics, baseline) else 1)
+        started = time.perf_counter()
+        blobs = _revision_blobs(ctx, Path("."), rev, staged)
+        with blobs or nullcontext():
+            result = validate_task(
+                scan_stats=scan_stats, on_error=on_error, baseline=baseline, blobs=blobs
+            )
+        duration = time.perf_counter() - started
+        _report(result, mode, writer, baseline)
+        if metrics is not None:
+            metrics.record(
+                mode,
+                None,
+                result,
+                duration,
+                scan_stats,
+                error_counts=writer.severity_counts if writer is not None else None,
+            )
+        all_passed = result.is_valid
+
+    if writer is not None:
+        writer.close(mode, all_passed)
+        ctx.exit(0 if all_passed else 1)
+    report_outcome(all_passed)
+    ctx.exit(0 if all_passed else 1)
@@ -0,0 +1,133 @@
+"""Verify command for pb-spec: run task Verification commands in parallel waves."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import click
+
+from pb_spec.commands.discovery import get_latest_spec_dir, project_root_for
+from pb_spec.exceptions import FileReadError, SpecNotFoundError
+from pb_spec.orchestration.verify import FAILING_STATUSES, VerifyStatus, run_verifications
+from pb_spec.orchestration.verify_cache import DEFAULT_CACHE_ENV, DEFAULT_CACHE_PATH, VerifyCache
+from pb_spec.output import print_error, print_info, print_success, print_warning
+from pb_spec.validation.io import read_file_content
+from pb_spec.validation.parser import parse_task_blocks
+
+
+@click.command("verify")
+@click.option(
+    "--specs-dir",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Path to specs directory (default: specs/).",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum concurrent verification commands (default: CPU count).",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Per-command timeout in seconds (default: none).",
+)
+@click.option(
+    "--log-dir",
+    type=click.Path(path_type=Path, file_okay=False),
+    default=None,
+    help="Directory for per-task logs (default: .pb-spec/verify/).",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Run every verification even if its inputs are unchanged.",
+)
+@click.option(
+    "--inputs",
+    "input_globs",
+    multiple=True,
+    metavar="GLOB",
+    help="Extra input files (relative to the project root) hashed into every task's cache key.",
+)
+@click.option(
+    "--cache-env",
+    multiple=True,
+    metavar="NAME",
+    help=f"Environment variable hashed into cache keys (always: {', '.join(DEFAULT_CACHE_ENV)}).",
+)
+@click.option("--json", "as_json", is_flag=True, help="Emit a machine-readable summary.")
+@click.pass_context
+def verify_cmd(
+    ctx: click.Context,
+    specs_dir: Path | None,
+    workers: int | None,
+    timeout: float | None,
+    log_dir: Path | None,
+    no_cache: bool,
+    input_globs: tuple[str, ...],
+    cache_env: tuple[str, ...],
+    as_json: bool,
+) -> None:
+    """Run each task's Verification commands, wave by wave.
+
+    Commands are the code spans (or fenced block lines) in the Verification
+    field. Tasks in the same DependsOn wave run concurrently; a failure stops
+    all later waves. Output of each task is written to its own log file.
+
+    Results are cached in .pb-spec/verify-cache.json, keyed by the commands,
+    the contents of files named in the task's Context field (plus --inputs)
+    and selected environment variables. Tasks that name no input files are
+    always run.
+    """
+    try:
+        spec_dir = get_latest_spec_dir(specs_dir)
+        task_blocks = parse_task_blocks(read_file_content(spec_dir / "tasks.md"))
+    except (SpecNotFoundError, FileReadError) as e:
+        print_error(str(e))
+        ctx.exit(1)
+
+    root = project_root_for(spec_dir).resolve()
+    cache = None
+    if not no_cache:
+        cache = VerifyCache(
+            root / DEFAULT_CACHE_PATH,
+            root,
+            input_globs=input_globs,
+            env_names=tuple(dict.fromkeys(DEFAULT_CACHE_ENV + cache_env)),
+        )
+
+    try:
+        report = run_verifications(
+            task_blocks,
+            root=root,
+            log_dir=log_dir,
+            max_workers=workers,
+            timeout=timeout,
+            cache=cache,
+        )
+    except ValueError as e:
+        print_error(str(e))
+        ctx.exit(1)
+    if cache is not None:
+        cache.save()
+
+    if as_json:
+        click.echo(json.dumps(report.to_dict(), indent=2))
+    else:
+        for outcome in report.outcomes:
+            timing = "cached" if outcome.cached else f"{outcome.duration:.2f}s"
+            line = f"Task {outcome.task_id}: {outcome.status.value} ({timing})"
+            if outcome.status in FAILING_STATUSES:
+                print_error(f"{line} — see {outcome.log_path}")
+            elif outcome.status is VerifyStatus.PASSED:
+                print_success(line)
+            elif outcome.status is VerifyStatus.NOT_RUN:
+                print_warning(f"Task {outcome.task_id}: not run (an earlier wave failed)")
+            else:
+                print_info(f"Task {outcome.task_id}: {outcome.status.value}")
+
+    ctx.exit(0 if report.passed else 1)
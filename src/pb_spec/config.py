@@ -22,3 +22,7 @@ def _int_env(name: str, default: int) -> int:
 GIT_TIMEOUT: int = _int_env("PB_SPEC_GIT_TIMEOUT", 60)
 RUMDL_CHECK_TIMEOUT: int = _int_env("PB_SPEC_RUMDL_CHECK_TIMEOUT", 10)
 RUMDL_FORMAT_TIMEOUT: int = _int_env("PB_SPEC_RUMDL_FORMAT_TIMEOUT", 30)
+DAEMON_CLIENT_TIMEOUT: int = _int_env("PB_SPEC_DAEMON_TIMEOUT", 120)
+DAEMON_IDLE_TIMEOUT: int = _int_env("PB_SPEC_DAEMON_IDLE_TIMEOUT", 1800)
+METRICS_INTERVAL: int = _int_env("PB_SPEC_METRICS_INTERVAL", 15)
+AGENT_TOKEN_BUDGET: int = _int_env("PB_SPEC_AGENT_BUDGET", 2000)
@@ -0,0 +1,258 @@
+"""Long-lived validation daemon, speaking JSON lines over a Unix socket.
+
+The daemon keeps a warm :class:`ScanCache` so a repeat ``validate --task`` only
+re-reads files that changed. The client half lives in :mod:`pb_spec.daemon_client`,
+which falls back to in-process validation whenever the daemon is missing,
+refuses the connection, or runs a different pb-spec version.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pb_spec import get_version
+from pb_spec.commands.discovery import project_root_for
+from pb_spec.config import DAEMON_IDLE_TIMEOUT, METRICS_INTERVAL
+from pb_spec.daemon_client import PROTOCOL_VERSION, SOCKET_MODE, send_request
+from pb_spec.validation.build import validate_build, validate_task
+from pb_spec.validation.contract_config import load_contract_config
+from pb_spec.validation.plan import validate_plan
+from pb_spec.validation.rumdl import run_rumdl_format
+from pb_spec.validation.scanner import ScanCache, ScanStats
+
+if TYPE_CHECKING:
+    from pb_spec.metrics import MetricsFile
+
+logger = logging.getLogger(__name__)
+
+STARTUP_TIMEOUT = 5.0
+
+
+class DaemonState:
+    """Warm state shared by all daemon connections."""
+
+    def __init__(self, metrics: MetricsFile | None = None) -> None:
+        self.scan_cache = ScanCache()
+        self.metrics = metrics
+        self.version = get_version()
+        self.started = time.monotonic()
+        self.last_request = self.started
+        self.requests = 0
+        self._root_locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def lock_for(self, root: str) -> threading.Lock:
+        """Return the lock serialising validations of one project root."""
+        with self._locks_guard:
+            return self._root_locks.setdefault(root, threading.Lock())
+
+    def stats(self) -> dict[str, Any]:
+        """Return counters describing the daemon's warm state."""
+        return {
+            "pid": os.getpid(),
+            "version": self.version,
+            "uptime": round(time.monotonic() - self.started, 3),
+            "requests": self.requests,
+            "scan_cache": {
+                "entries": len(self.scan_cache),
+                "hits": self.scan_cache.hits,
+                "misses": self.scan_cache.misses,
+            },
+        }
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Dispatch one decoded request and return the reply."""
+        self.requests += 1
+        self.last_request = time.monotonic()
+        match request.get("command"):
+            case "ping" | "stats":
+                return {"ok": True, "protocol": PROTOCOL_VERSION, **self.stats()}
+            case "validate":
+                if request.get("version") != self.version:
+                    return {"ok": False, "error": f"daemon runs pb-spec {self.version}"}
+                return self._validate(request)
+            case command:
+                return {"ok": False, "error": f"unknown command {command!r}"}
+
+    def _validate(self, request: dict[str, Any]) -> dict[str, Any]:
+        mode = request.get("mode")
+        started = time.perf_counter()
+        scan_stats = ScanStats(count_patterns=False) if self.metrics is not None else None
+        phase_timings: dict[str, float] | None = {} if self.metrics is not None else None
+        spec_dir = None
+        # Loaded for every mode so a broken config is declined and reported in-process.
+        config_path = request.get("config")
+        config = load_contract_config(Path(config_path)) if config_path else None
+        reply: dict[str, Any]
+        if mode == "task":
+            root = str(request["root"])
+            with self.lock_for(root):
+                result = validate_task(root, scan_cache=self.scan_cache, scan_stats=scan_stats)
+            reply = {"result": result.to_dict()}
+        elif mode in ("plan", "build"):
+            spec_dir = Path(request["spec_dir"])
+            with self.lock_for(str(project_root_for(spec_dir))):
+                if mode == "build":
+                    result = validate_build(
+                        spec_dir,
+                        self.scan_cache,
+                        scan_stats=scan_stats,
+                        phase_timings=phase_timings,
+                    )
+                    reply = {"result": result.to_dict()}
+                else:
+                    scan_stats = None
+                    format_result = run_rumdl_format(spec_dir)
+                    result = validate_plan(spec_dir, config, phase_timings)
+                    reply = {
+                        "format": {
+                            "success": format_result.success,
+                            "messages": format_result.messages,
+                        },
+                        "result": result.to_dict(),
+                    }
+        else:
+            return {"ok": False, "error": f"unknown validation mode {mode!r}"}
+        elapsed = time.perf_counter() - started
+        if self.metrics is not None:
+            # Written by serve()'s flush thread, so requests never wait on disk.
+            self.metrics.record(
+                mode, spec_dir, result, elapsed, scan_stats, phase_timings, write=False
+            )
+        reply.update(ok=True, elapsed=round(elapsed, 6))
+        return reply
+
+
+def serve(
+    socket_path: Path,
+    idle_timeout: float = DAEMON_IDLE_TIMEOUT,
+    metrics_file: Path | None = None,
+    metrics_interval: float = METRICS_INTERVAL,
+) -> None:
+    """Serve requests on ``socket_path`` until shut down or idle for ``idle_timeout`` seconds.
+
+    With ``metrics_file``, validation metrics are rewritten every
+    ``metrics_interval`` seconds when something changed, and once on exit.
+    """
+    metrics = None
+    if metrics_file is not None:
+        from pb_spec.metrics import MetricsFile
+
+        metrics = MetricsFile(metrics_file)
+    state = DaemonState(metrics)
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            line = self.rfile.readline()
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as e:
+                reply: dict[str, Any] = {"ok": False, "error": f"bad request: {e}"}
+            else:
+                if request.get("command") == "shutdown":
+                    reply = {"ok": True}
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                else:
+                    try:
+                        reply = state.handle(request)
+                    except Exception as e:
+                        logger.exception("pb-spec daemon request failed")
+                        reply = {"ok": False, "error": str(e)}
+            self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+    class Server(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+    if socket_path.exists():
+        if send_request({"command": "ping"}, socket_path, timeout=1.0) is not None:
+            raise RuntimeError(f"A pb-spec daemon is already listening on {socket_path}")
+        socket_path.unlink()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    previous_umask = os.umask(0o077)
+    try:
+        server = Server(str(socket_path), Handler)
+        # Clients refuse sockets other users could open; don't rely on the umask alone.
+        os.chmod(socket_path, SOCKET_MODE)
+    finally:
+        os.umask(previous_umask)
+
+    def shutdown_when_idle() -> None:
+        while True:
+            time.sleep(min(idle_timeout, 5.0))
+            if time.monotonic() - state.last_request >= idle_timeout:
+                server.shutdown()
+                return
+
+    def flush_metrics(metrics: MetricsFile) -> None:
+        while True:
+            time.sleep(metrics_interval)
+            try:
+                metrics.flush()
+            except OSError:
+                logger.exception("pb-spec daemon could not write %s", metrics.path)
+
+    if idle_timeout > 0:
+        threading.Thread(target=shutdown_when_idle, daemon=True).start()
+    if metrics is not None:
+        threading.Thread(target=flush_metrics, args=(metrics,), daemon=True).start()
+    try:
+        with server:
+            server.serve_forever()
+    finally:
+        socket_path.unlink(missing_ok=True)
+        if metrics is not None:
+            metrics.flush()
+
+
+def spawn_daemon(
+    socket_path: Path,
+    idle_timeout: float = DAEMON_IDLE_TIMEOUT,
+    metrics_file: Path | None = None,
+) -> int | None:
+    """Start a detached daemon process and wait until it answers; return its pid."""
+    command = [
+        sys.executable,
+        "-m",
+        "pb_spec.cli",
+        "daemon",
+        "run",
+        "--socket",
+        str(socket_path),
+        "--idle-timeout",
+        str(idle_timeout),
+    ]
+    if metrics_file is not None:
+        command += ["--metrics-file", str(metrics_file.resolve())]
+    env = None
+    package_root = Path(__file__).resolve().parent.parent
+    if package_root.is_file():
+        # Running from a zipapp: the child needs the archive on its import path.
+        paths = [str(package_root), os.environ.get("PYTHONPATH", "")]
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(p for p in paths if p)}
+    subprocess.Popen(
+        command,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        reply = send_request({"command": "ping"}, socket_path, timeout=1.0)
+        if reply is not None:
+            return reply.get("pid")
+        time.sleep(0.05)
+    return None
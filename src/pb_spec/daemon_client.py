@@ -0,0 +1,102 @@
+"""Client side of the validation daemon protocol.
+
+Kept free of the validation stack so ``validate`` can forward a request to a
+warm daemon without first importing everything it would run in-process.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import stat
+from pathlib import Path
+from typing import Any
+
+from pb_spec import get_version
+from pb_spec.config import DAEMON_CLIENT_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = 1
+SOCKET_ENV = "PB_SPEC_DAEMON_SOCKET"
+DISABLE_ENV = "PB_SPEC_NO_DAEMON"
+SOCKET_MODE = 0o600
+
+
+def default_socket_path() -> Path:
+    """Return the daemon socket path ($PB_SPEC_DAEMON_SOCKET, else a per-user runtime file)."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not (runtime_dir and os.path.isdir(runtime_dir)):
+        runtime_dir = next(
+            (value for name in ("TMPDIR", "TEMP", "TMP") if (value := os.environ.get(name))),
+            "/tmp",
+        )
+    return Path(runtime_dir) / f"pb-spec-{os.getuid()}.sock"
+
+
+def is_trusted_socket(path: Path) -> bool:
+    """Return whether ``path`` is a socket owned by this user and closed to everyone else.
+
+    The default path lives in a shared temp directory, so any local user could
+    create it first and answer every request with a passing result.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        logger.debug("ignoring pb-spec daemon socket %s: not a socket owned by us", path)
+        return False
+    if stat.S_IMODE(st.st_mode) & ~SOCKET_MODE:
+        logger.debug("ignoring pb-spec daemon socket %s: mode %o", path, stat.S_IMODE(st.st_mode))
+        return False
+    return True
+
+
+def send_request(
+    payload: dict[str, Any],
+    socket_path: Path | None = None,
+    timeout: float = DAEMON_CLIENT_TIMEOUT,
+) -> dict[str, Any] | None:
+    """Send one request to the daemon and return its reply.
+
+    Returns None when no trusted socket exists, the connection fails, or the
+    reply is malformed.
+    """
+    path = socket_path or default_socket_path()
+    if not is_trusted_socket(path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(str(path))
+            client.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with client.makefile("rb") as reader:
+                line = reader.readline()
+        reply = json.loads(line)
+    except OSError, ValueError:
+        logger.debug("pb-spec daemon at %s unavailable", path)
+        return None
+    return reply if isinstance(reply, dict) else None
+
+
+def request_validation(payload: dict[str, Any]) -> dict[str, Any] | None:
+    """Forward a validate request; return the reply only if the daemon handled it.
+
+    Returns None, so the caller validates in-process, when ``$PB_SPEC_NO_DAEMON``
+    is set or the daemon is unavailable or declines the request.
+    """
+    if os.environ.get(DISABLE_ENV):
+        return None
+    request = {"command": "validate", "version": get_version(), **payload}
+    reply = send_request(request)
+    if reply is None or not reply.get("ok"):
+        if reply is not None:
+            logger.debug("pb-spec daemon declined request: %s", reply.get("error"))
+        return None
+    return reply
@@ -9,3 +9,15 @@ class SpecNotFoundError(Exception):
 
 class FileReadError(Exception):
     """Raised when spec files cannot be read."""
+
+
+class ContractConfigError(Exception):
+    """Raised when a contract configuration file cannot be loaded."""
+
+
+class BaselineError(Exception):
+    """Raised when an issue baseline file cannot be read or parsed."""
+
+
+class GitError(Exception):
+    """Raised when a git command needed for validation fails."""
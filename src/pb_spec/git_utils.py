@@ -3,14 +3,44 @@
 from __future__ import annotations
 
 import logging
+import os
 import subprocess
+import threading
 from pathlib import Path
 
 from pb_spec.config import GIT_TIMEOUT
+from pb_spec.exceptions import GitError
+from pb_spec.profiling import traced
 
 logger = logging.getLogger(__name__)
 
 
+GIT_STATUS_ARGS: tuple[str, ...] = (
+    "git",
+    "-c",
+    "core.quotePath=false",
+    "status",
+    "--porcelain",
+    "-uall",
+)
+
+
+def parse_porcelain_status(output: str, root: Path) -> set[Path]:
+    """Parse ``git status --porcelain`` output into resolved absolute paths under ``root``."""
+    files: set[Path] = set()
+    for line in output.splitlines():
+        if len(line) < 4:
+            continue
+        path_str = line[3:].strip()
+        if " -> " in path_str:
+            path_str = path_str.split(" -> ", 1)[1].strip()
+        if path_str.startswith('"') and path_str.endswith('"'):
+            path_str = path_str[1:-1]
+        files.add((root / path_str).resolve())
+    return files
+
+
+@traced("git status")
 def get_git_modified_files(root_dir: Path | str = ".") -> set[Path]:
     """Get files with staged, unstaged, or untracked changes.
 
@@ -21,27 +51,17 @@ def get_git_modified_files(root_dir: Path | str = ".") -> set[Path]:
     Returns resolved absolute paths for consistent comparison.
     """
     root = Path(root_dir).resolve()
-    files: set[Path] = set()
 
     try:
         result = subprocess.run(
-            ["git", "-c", "core.quotePath=false", "status", "--porcelain", "-uall"],
+            list(GIT_STATUS_ARGS),
             capture_output=True,
             text=True,
             cwd=root,
             encoding="utf-8",
             timeout=GIT_TIMEOUT,
         )
-        for line in result.stdout.splitlines():
-            if len(line) < 4:
-                continue
-            path_str = line[3:].strip()
-            if " -> " in path_str:
-                path_str = path_str.split(" -> ", 1)[1].strip()
-            if path_str.startswith('"') and path_str.endswith('"'):
-                path_str = path_str[1:-1]
-            file_path = (root / path_str).resolve()
-            files.add(file_path)
+        return parse_porcelain_status(result.stdout, root)
     except subprocess.TimeoutExpired:
         logger.warning("git status timed out in %s", root)
     except subprocess.CalledProcessError as e:
@@ -49,4 +69,204 @@ def get_git_modified_files(root_dir: Path | str = ".") -> set[Path]:
     except FileNotFoundError:
         logger.debug("git not found, returning empty set")
 
-    return files
+    return set()
+
+
+async def get_git_modified_files_async(root_dir: Path | str = ".") -> set[Path]:
+    """Async variant of :func:`get_git_modified_files` using an asyncio subprocess."""
+    import asyncio  # deferred: asyncio is slow to import and the CLI never needs it
+
+    root = Path(root_dir).resolve()
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *GIT_STATUS_ARGS,
+            cwd=root,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        logger.debug("git not found, returning empty set")
+        return set()
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), GIT_TIMEOUT)
+    except TimeoutError:
+        process.kill()
+        await process.wait()
+        logger.warning("git status timed out in %s", root)
+        return set()
+    return parse_porcelain_status(stdout.decode("utf-8"), root)
+
+
+def _run_git_z(args: list[str], root: Path) -> list[str]:
+    """Run a ``-z`` git command in ``root`` and split its NUL-separated output.
+
+    Raises:
+        GitError: If git is missing, fails or times out.
+    """
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            cwd=root,
+            check=True,
+            timeout=GIT_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired as e:
+        raise GitError(f"git {args[0]} timed out in {root}") from e
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr.decode("utf-8", "replace").strip()
+        raise GitError(f"git {args[0]} failed in {root}: {stderr}") from e
+    except FileNotFoundError as e:
+        raise GitError("git not found") from e
+    return [entry for entry in result.stdout.decode("utf-8").split("\0") if entry]
+
+
+def _git_z_output(args: list[str], root: Path) -> list[str] | None:
+    """Like :func:`_run_git_z`, but return None on failure."""
+    try:
+        return _run_git_z(args, root)
+    except GitError as e:
+        logger.debug("%s", e)
+        return None
+
+
+@traced("git ls-files -s")
+def get_clean_index_blobs(root_dir: Path | str = ".") -> dict[str, str]:
+    """Map tracked paths whose working-tree file matches the index to their blob ids.
+
+    Paths are relative to ``root_dir``. Git decides "unchanged" from its stat
+    cache, so no file contents are read. Returns an empty dict outside git.
+    """
+    root = Path(root_dir)
+    staged = _git_z_output(["ls-files", "-s", "-z"], root)
+    modified = _git_z_output(["ls-files", "-m", "-z"], root)
+    if staged is None or modified is None:
+        return {}
+    blobs: dict[str, str] = {}
+    for entry in staged:
+        info, _, path = entry.partition("\t")
+        _mode, oid, stage = info.split(" ")
+        if stage == "0":
+            blobs[path] = oid
+    for path in modified:
+        blobs.pop(path, None)
+    return blobs
+
+
+class GitBlobs:
+    """The files of a git revision, or of the index, read without a checkout.
+
+    Paths and blob ids come from one ``git ls-tree -r -z <rev>`` (``git ls-files
+    -s -z`` for the index), relative to ``root_dir``; symlinks, submodules and
+    unmerged entries are left out. Contents stream through a single long-lived
+    ``git cat-file --batch`` process started on first read. Use as a context
+    manager so that process is shut down.
+
+    Raises:
+        GitError: If the revision or index cannot be listed.
+    """
+
+    def __init__(self, root_dir: Path | str = ".", rev: str | None = None) -> None:
+        if rev is not None and (not rev or rev.startswith("-")):
+            raise GitError(f"Invalid revision {rev!r}")
+        self.root = Path(root_dir)
+        self.rev = rev
+        self._abs_root = os.path.abspath(self.root)
+        self._process: subprocess.Popen[bytes] | None = None
+        self._lock = threading.Lock()
+        self.oids = self._list_blobs()
+
+    def __enter__(self) -> GitBlobs:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    @property
+    def label(self) -> str:
+        """Describe the source, e.g. ``HEAD~1`` or ``the index``."""
+        return self.rev if self.rev is not None else "the index"
+
+    def _list_blobs(self) -> dict[str, str]:
+        oids: dict[str, str] = {}
+        if self.rev is None:
+            for entry in _run_git_z(["ls-files", "-s", "-z"], self.root):
+                info, _, path = entry.partition("\t")
+                mode, oid, stage = info.split(" ")
+                if stage == "0" and mode != "120000" and mode != "160000":
+                    oids[path] = oid
+        else:
+            for entry in _run_git_z(["ls-tree", "-r", "-z", self.rev], self.root):
+                info, _, path = entry.partition("\t")
+                mode, kind, oid = info.split(" ")
+                if kind == "blob" and mode != "120000":
+                    oids[path] = oid
+        return oids
+
+    def changed_files(self) -> set[Path]:
+        """Return files the revision changed (or that are staged), under ``root_dir``.
+
+        For a revision this is the diff against its first parent (everything
+        for a root commit); for the index, the diff against HEAD.
+        """
+        if self.rev is None:
+            args = ["diff", "--cached", "--relative", "--name-only", "-z"]
+        else:
+            args = ["diff-tree", "-r", "--root", "--no-commit-id", "--relative"]
+            args += ["--name-only", "-z", self.rev]
+        return {self.root / path for path in _run_git_z(args, self.root)}
+
+    def oid(self, file_path: Path) -> str | None:
+        """Return the blob id of ``file_path`` in this revision, or None if absent."""
+        relative = os.path.relpath(os.path.abspath(file_path), self._abs_root)
+        return self.oids.get(Path(relative).as_posix())
+
+    @traced("git cat-file")
+    def read(self, oid: str) -> bytes | None:
+        """Return a blob's contents, or None if it is missing.
+
+        Raises:
+            GitError: If the ``git cat-file`` process cannot be started or dies.
+        """
+        with self._lock:
+            if self._process is None:
+                try:
+                    self._process = subprocess.Popen(
+                        ["git", "cat-file", "--batch"],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        cwd=self.root,
+                    )
+                except OSError as e:
+                    raise GitError(f"Cannot start git cat-file: {e}") from e
+            stdin, stdout = self._process.stdin, self._process.stdout
+            if stdin is None or stdout is None:
+                raise GitError("git cat-file has no pipes")
+            try:
+                stdin.write(oid.encode("ascii") + b"\n")
+                stdin.flush()
+            except BrokenPipeError as e:
+                raise GitError("git cat-file exited unexpectedly") from e
+            header = stdout.readline().split()
+            if len(header) != 3:
+                if not header:
+                    raise GitError("git cat-file exited unexpectedly")
+                return None  # "<oid> missing"
+            data = stdout.read(int(header[2]) + 1)[:-1]
+            return data if header[1] == b"blob" else None
+
+    def close(self) -> None:
+        """Stop the ``git cat-file`` process, if one was started."""
+        with self._lock:
+            process, self._process = self._process, None
+        if process is None:
+            return
+        if process.stdin is not None:
+            process.stdin.close()
+        try:
+            process.wait(timeout=GIT_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        if process.stdout is not None:
+            process.stdout.close()
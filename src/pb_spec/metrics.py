@@ -0,0 +1,254 @@
+"""OpenMetrics/Prometheus textfile export of validation metrics for node_exporter.
+
+A MetricsCollector accumulates one series set per (mode, spec) label pair:
+last-run gauges (files, bytes, issues, tasks), a run counter by outcome, and
+phase-duration histograms. ``write`` renders everything and atomically
+replaces the target file, so a scraper never reads a partial file. Family
+names match their samples (``..._total`` for the counter) as node_exporter's
+text parser expects; the trailing ``# EOF`` is a comment to that parser.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pb_spec.exceptions import FileReadError
+from pb_spec.validation.io import read_file_content
+from pb_spec.validation.parser import parse_task_blocks
+from pb_spec.validation.result import ErrorSeverity, ValidationResult
+from pb_spec.validation.scanner import IssueType, ScanStats
+
+# Histogram upper bounds in seconds; +Inf is implicit.
+DURATION_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+_STATUS_MARKER_RE = re.compile(r"^[^\w]+")
+
+
+@dataclass
+class Histogram:
+    """Cumulative duration histogram with fixed buckets."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(DURATION_BUCKETS) + 1))
+    total: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Add one observation."""
+        self.counts[bisect.bisect_left(DURATION_BUCKETS, seconds)] += 1
+        self.total += seconds
+
+    @property
+    def count(self) -> int:
+        """Return the number of observations."""
+        return sum(self.counts)
+
+
+@dataclass
+class _Series:
+    """Metrics for one (mode, spec) label pair."""
+
+    runs: dict[str, int] = field(default_factory=dict)
+    last_run: float = 0.0
+    gauges: dict[str, float] = field(default_factory=dict)
+    issues: dict[str, int] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+    tasks: dict[str, int] = field(default_factory=dict)
+    phases: dict[str, Histogram] = field(default_factory=dict)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def task_status_counts(spec_dir: Path) -> dict[str, int]:
+    """Count tasks in ``spec_dir``/tasks.md by Status, without the emoji marker."""
+    try:
+        content = read_file_content(spec_dir / "tasks.md")
+    except FileReadError:
+        return {}
+    counts: dict[str, int] = {}
+    for block in parse_task_blocks(content):
+        status = _STATUS_MARKER_RE.sub("", block.fields.get("Status:", "")) or "unknown"
+        counts[status] = counts.get(status, 0) + 1
+    return counts
+
+
+class MetricsCollector:
+    """Thread-safe accumulator of validation metrics, rendered as OpenMetrics text."""
+
+    def __init__(self) -> None:
+        self._series: dict[tuple[str, str], _Series] = {}
+        self._lock = threading.Lock()
+        self.dirty = False
+
+    def observe(
+        self,
+        mode: str,
+        spec: str,
+        result: ValidationResult,
+        duration: float,
+        scan_stats: ScanStats | None = None,
+        phase_timings: Mapping[str, float] | None = None,
+        task_statuses: Mapping[str, int] | None = None,
+        error_counts: Mapping[ErrorSeverity, int] | None = None,
+    ) -> None:
+        """Record one validation run.
+
+        Gauges are replaced by this run's values; the run counter and the
+        duration histograms (``total`` plus each phase) accumulate.
+        ``error_counts`` replaces counting ``result.errors`` when the errors
+        were streamed rather than collected.
+        """
+        with self._lock:
+            series = self._series.setdefault((mode, spec), _Series())
+            outcome = "pass" if result.is_valid else "fail"
+            series.runs[outcome] = series.runs.get(outcome, 0) + 1
+            series.last_run = time.time()
+            if error_counts is None:
+                error_counts = Counter(error.severity for error in result.errors)
+            series.errors = {
+                severity.value: error_counts.get(severity, 0) for severity in ErrorSeverity
+            }
+            if scan_stats is not None:
+                series.gauges = {
+                    "files_enumerated": scan_stats.files_enumerated,
+                    "files_scanned": len(scan_stats.files),
+                    "read_bytes": scan_stats.bytes_read,
+                }
+                series.issues = {
+                    issue_type.value: scan_stats.issues_by_type.get(issue_type, 0)
+                    for issue_type in IssueType
+                }
+            if task_statuses is not None:
+                series.tasks = dict(task_statuses)
+            timings = {"total": duration, **(phase_timings or {})}
+            for phase, seconds in timings.items():
+                series.phases.setdefault(phase, Histogram()).observe(seconds)
+            self.dirty = True
+
+    def render(self) -> str:
+        """Return all series in OpenMetrics text format."""
+        with self._lock:
+            return "".join(self._render_lines()) + "# EOF\n"
+
+    def write(self, path: Path) -> None:
+        """Atomically replace ``path`` with the rendered metrics."""
+        text = self.render()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.dirty = False
+
+    def _render_lines(self) -> Iterator[str]:
+        items = sorted(self._series.items())
+
+        def family(name: str, kind: str, help_text: str) -> Iterator[str]:
+            yield f"# HELP {name} {help_text}\n# TYPE {name} {kind}\n"
+
+        yield from family("pb_spec_validation_runs_total", "counter", "Validation runs by outcome.")
+        for (mode, spec), series in items:
+            for outcome, count in sorted(series.runs.items()):
+                labels = _labels(mode=mode, spec=spec, result=outcome)
+                yield f"pb_spec_validation_runs_total{labels} {count}\n"
+
+        yield from family(
+            "pb_spec_last_run_timestamp_seconds", "gauge", "Unix time of the last run."
+        )
+        for (mode, spec), series in items:
+            yield f"pb_spec_last_run_timestamp_seconds{_labels(mode=mode, spec=spec)} "
+            yield f"{series.last_run:.3f}\n"
+
+        gauges = {
+            "files_enumerated": "Files selected for scanning in the last run.",
+            "files_scanned": "Files read and matched in the last run (cache misses).",
+            "read_bytes": "Bytes of source read by the scanner in the last run.",
+        }
+        for gauge, help_text in gauges.items():
+            yield from family(f"pb_spec_{gauge}", "gauge", help_text)
+            for (mode, spec), series in items:
+                if gauge in series.gauges:
+                    labels = _labels(mode=mode, spec=spec)
+                    yield f"pb_spec_{gauge}{labels} {series.gauges[gauge]}\n"
+
+        breakdowns = (
+            ("scan_issues", "issues", "type", "Scanner issues by type in the last run."),
+            ("errors", "errors", "severity", "Validation errors by severity in the last run."),
+            ("tasks", "tasks", "status", "Tasks in tasks.md by Status in the last run."),
+        )
+        for metric, attribute, label, help_text in breakdowns:
+            yield from family(f"pb_spec_{metric}", "gauge", help_text)
+            for (mode, spec), series in items:
+                for value, count in sorted(getattr(series, attribute).items()):
+                    labels = _labels(mode=mode, spec=spec, **{label: value})
+                    yield f"pb_spec_{metric}{labels} {count}\n"
+
+        name = "pb_spec_phase_duration_seconds"
+        yield from family(name, "histogram", "Wall time of validation phases.")
+        for (mode, spec), series in items:
+            for phase, histogram in sorted(series.phases.items()):
+                cumulative = 0
+                bounds = [*(repr(float(b)) for b in DURATION_BUCKETS), "+Inf"]
+                for bound, count in zip(bounds, histogram.counts, strict=True):
+                    cumulative += count
+                    labels = _labels(mode=mode, spec=spec, phase=phase, le=bound)
+                    yield f"{name}_bucket{labels} {cumulative}\n"
+                labels = _labels(mode=mode, spec=spec, phase=phase)
+                yield f"{name}_sum{labels} {histogram.total}\n"
+                yield f"{name}_count{labels} {histogram.count}\n"
+
+
+class MetricsFile:
+    """A MetricsCollector bound to the textfile it is exported to."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.collector = MetricsCollector()
+
+    def record(
+        self,
+        mode: str,
+        spec_dir: Path | None,
+        result: ValidationResult,
+        duration: float,
+        scan_stats: ScanStats | None = None,
+        phase_timings: Mapping[str, float] | None = None,
+        write: bool = True,
+        error_counts: Mapping[ErrorSeverity, int] | None = None,
+    ) -> None:
+        """Observe one run labelled with the spec directory's name; write unless deferred."""
+        self.collector.observe(
+            mode,
+            spec_dir.name if spec_dir is not None else "",
+            result,
+            duration,
+            scan_stats=scan_stats,
+            phase_timings=phase_timings,
+            task_statuses=task_status_counts(spec_dir) if spec_dir is not None else None,
+            error_counts=error_counts,
+        )
+        if write:
+            self.collector.write(self.path)
+
+    def flush(self) -> None:
+        """Write the file if anything was observed since the last write."""
+        if self.collector.dirty:
+            self.collector.write(self.path)
@@ -0,0 +1,3 @@
+"""Task orchestration utilities for pb-spec (scheduling and verification)."""
+
+from __future__ import annotations
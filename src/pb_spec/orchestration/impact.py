@@ -0,0 +1,256 @@
+"""Test impact analysis from a cached Python import graph."""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+GRAPH_CACHE_VERSION = 1
+DEFAULT_GRAPH_CACHE_PATH = Path(".pb-spec") / "import-graph.json"
+
+_IGNORED_DIRS = frozenset(
+    {".git", ".hg", ".pb-spec", ".venv", "venv", "__pycache__", "node_modules", "build", "dist"}
+)
+_BEHAVE_SUPPORT_FILES = frozenset({"environment.py"})
+
+# One import statement: (relative level, module or "", imported names).
+type ImportRecord = tuple[int, str, tuple[str, ...]]
+
+
+@dataclass
+class ImpactSelection:
+    """Tests and features affected by a set of changed files (paths relative to root)."""
+
+    changed: list[str] = field(default_factory=list)
+    impacted_modules: list[str] = field(default_factory=list)
+    test_files: list[str] = field(default_factory=list)
+    feature_files: list[str] = field(default_factory=list)
+    unmapped: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serialisable summary."""
+        return {
+            "changed": self.changed,
+            "impacted_modules": self.impacted_modules,
+            "tests": self.test_files,
+            "features": self.feature_files,
+            "unmapped": self.unmapped,
+        }
+
+
+def is_test_file(relative: str) -> bool:
+    """Return True for pytest-style test modules (``test_*.py`` / ``*_test.py``)."""
+    name = relative.rsplit("/", 1)[-1]
+    return name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py"))
+
+
+def iter_python_files(root: Path) -> list[str]:
+    """Return root-relative POSIX paths of Python files, skipping vendored/cache dirs."""
+    files: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _IGNORED_DIRS and not d.startswith(".")]
+        relative_dir = Path(dirpath).relative_to(root).as_posix()
+        prefix = "" if relative_dir == "." else f"{relative_dir}/"
+        files.extend(f"{prefix}{name}" for name in filenames if name.endswith(".py"))
+    files.sort()
+    return files
+
+
+def module_names(relative: str, source_roots: tuple[str, ...]) -> list[str]:
+    """Return the dotted module names a file is importable as from each source root."""
+    names: list[str] = []
+    for source_root in source_roots:
+        if source_root and not relative.startswith(f"{source_root}/"):
+            continue
+        parts = relative[len(source_root) + 1 if source_root else 0 : -3].split("/")
+        if parts[-1] == "__init__":
+            parts.pop()
+        if parts and all(part.isidentifier() for part in parts):
+            names.append(".".join(parts))
+    return names
+
+
+def parse_imports(source: str | bytes) -> list[ImportRecord]:
+    """Return the import statements of a module; unparsable sources yield none."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError, ValueError:
+        return []
+    records: list[ImportRecord] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            records.extend((0, alias.name, ()) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            names = tuple(alias.name for alias in node.names if alias.name != "*")
+            records.append((node.level, node.module or "", names))
+    return records
+
+
+def resolve_imports(records: list[ImportRecord], importer: str, is_package: bool) -> set[str]:
+    """Resolve import records of module ``importer`` to absolute dotted names.
+
+    Every enclosing package is included, since importing ``a.b.c`` runs
+    ``a/__init__.py`` and ``a/b/__init__.py`` too. ``from m import x`` adds
+    ``m.x`` in case ``x`` is a submodule.
+    """
+    package = importer if is_package else importer.rpartition(".")[0]
+    resolved: set[str] = set()
+    for level, module, names in records:
+        if level:
+            base_parts = package.split(".") if package else []
+            if level - 1 > len(base_parts):
+                continue
+            base = ".".join(base_parts[: len(base_parts) - (level - 1)])
+            module = f"{base}.{module}" if base and module else base or module
+        if not module:
+            continue
+        parts = module.split(".")
+        resolved.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+        resolved.update(f"{module}.{name}" for name in names)
+    return resolved
+
+
+class ImportGraph:
+    """Module import graph of a project, cached per file by content hash.
+
+    The cache stores each file's parsed import statements; a file is re-parsed
+    only when its SHA-256 changes (``mtime``/``size`` short-circuit the hash).
+    """
+
+    def __init__(self, root: Path, cache_path: Path | None = None) -> None:
+        self.root = root
+        self.cache_path = cache_path
+        self.source_roots: tuple[str, ...] = ("src", "") if (root / "src").is_dir() else ("",)
+        self.files: list[str] = []
+        self.imports: dict[str, list[ImportRecord]] = {}
+        self.modules_by_file: dict[str, list[str]] = {}
+        self.importers: dict[str, set[str]] = {}
+        self.parsed = 0
+        self._entries: dict[str, dict] = {}
+
+    def _load_cache(self) -> None:
+        if self.cache_path is None:
+            return
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except OSError, ValueError:
+            return
+        if isinstance(data, dict) and data.get("version") == GRAPH_CACHE_VERSION:
+            self._entries = data.get("files", {})
+
+    def _save_cache(self) -> None:
+        if self.cache_path is None:
+            return
+        payload = {"version": GRAPH_CACHE_VERSION, "files": self._entries}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.tmp")
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        tmp_path.replace(self.cache_path)
+
+    def _file_imports(self, relative: str) -> list[ImportRecord]:
+        path = self.root / relative
+        stat = path.stat()
+        entry = self._entries.get(relative)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return [(level, module, tuple(names)) for level, module, names in entry["imports"]]
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if entry and entry["sha256"] == digest:
+            records = [(level, module, tuple(names)) for level, module, names in entry["imports"]]
+        else:
+            records = parse_imports(data)
+            self.parsed += 1
+        self._entries[relative] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "imports": [[level, module, list(names)] for level, module, names in records],
+        }
+        return records
+
+    def build(self) -> ImportGraph:
+        """Scan the project, refresh the cache and index importers by module name."""
+        self._load_cache()
+        self.files = iter_python_files(self.root)
+        current = set(self.files)
+        self._entries = {k: v for k, v in self._entries.items() if k in current}
+        for relative in self.files:
+            try:
+                self.imports[relative] = self._file_imports(relative)
+            except OSError:
+                self.imports[relative] = []
+            self.modules_by_file[relative] = module_names(relative, self.source_roots)
+        self._save_cache()
+
+        for relative, records in self.imports.items():
+            is_package = relative.endswith("/__init__.py") or relative == "__init__.py"
+            targets: set[str] = set()
+            for name in self.modules_by_file[relative] or [relative[:-3].replace("/", ".")]:
+                targets |= resolve_imports(records, name, is_package)
+            for target in targets:
+                self.importers.setdefault(target, set()).add(relative)
+        return self
+
+    def dependents(self, changed: list[str]) -> set[str]:
+        """Return files that transitively import any changed Python file (changed included)."""
+        queue = deque(name for rel in changed for name in module_names(rel, self.source_roots))
+        seen_modules = set(queue)
+        impacted = {rel for rel in changed if rel in self.imports}
+        while queue:
+            for importer in self.importers.get(queue.popleft(), ()):
+                if importer in impacted:
+                    continue
+                impacted.add(importer)
+                for name in self.modules_by_file[importer]:
+                    if name not in seen_modules:
+                        seen_modules.add(name)
+                        queue.append(name)
+        return impacted
+
+
+def _features_for_steps(root: Path, steps_files: set[str]) -> set[str]:
+    """Return feature files in every features dir whose step/support code is impacted."""
+    features: set[str] = set()
+    for relative in steps_files:
+        parts = relative.split("/")
+        features_dir = "/".join(parts[: parts.index("steps")] if "steps" in parts else parts[:-1])
+        base = root / features_dir
+        features.update(p.relative_to(root).as_posix() for p in base.rglob("*.feature"))
+    return features
+
+
+def select_impacted(root: Path, graph: ImportGraph, changed: list[str]) -> ImpactSelection:
+    """Select pytest files and behave features affected by ``changed`` root-relative paths."""
+    python_changed = [rel for rel in changed if rel.endswith(".py")]
+    impacted = graph.dependents(python_changed)
+
+    tests = {rel for rel in impacted if is_test_file(rel)}
+    behave_code = {
+        rel
+        for rel in impacted
+        if "/steps/" in f"/{rel}" or rel.rsplit("/", 1)[-1] in _BEHAVE_SUPPORT_FILES
+    }
+    features = {rel for rel in changed if rel.endswith(".feature")}
+    features |= _features_for_steps(root, behave_code)
+
+    unmapped: list[str] = []
+    for rel in changed:
+        name = rel.rsplit("/", 1)[-1]
+        if name == "conftest.py":
+            prefix = rel[: -len(name)]
+            tests.update(f for f in graph.files if f.startswith(prefix) and is_test_file(f))
+        elif not rel.endswith((".py", ".feature")):
+            unmapped.append(rel)
+
+    return ImpactSelection(
+        changed=sorted(changed),
+        impacted_modules=sorted(impacted),
+        test_files=sorted(tests),
+        feature_files=sorted(features),
+        unmapped=sorted(unmapped),
+    )
@@ -0,0 +1,218 @@
+"""Build-time simulator: list scheduling of the DependsOn task DAG over N workers."""
+
+from __future__ import annotations
+
+import heapq
+import json
+import math
+from dataclasses import dataclass
+from pathlib import Path
+
+from pb_spec.validation.dag import TaskGraph, compute_waves
+from pb_spec.validation.parser import TaskBlock
+
+COMPLEXITY_FIELD = "Complexity:"
+
+# Relative durations per Complexity value; tasks without one count as "low".
+DEFAULT_COMPLEXITY_WEIGHTS: dict[str, float] = {"low": 1.0, "high": 3.0}
+
+# Makespans within this relative tolerance of the best one count as "no further gain".
+SATURATION_TOLERANCE = 0.01
+
+# History record statuses whose duration reflects a task that actually ran.
+_RAN_STATUSES = frozenset({"passed", "failed"})
+
+
+@dataclass(frozen=True)
+class SimulationPoint:
+    """Predicted schedule for one worker count."""
+
+    workers: int
+    makespan: float
+    utilization: float
+    speedup: float
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """Predicted schedules for a range of worker counts."""
+
+    points: list[SimulationPoint]
+    total_work: float
+    critical_path_time: float
+    saturation_workers: int
+
+
+def task_complexity(task_block: TaskBlock) -> str:
+    """Return the normalised Complexity value of a task ("low" when absent)."""
+    value = task_block.fields.get(COMPLEXITY_FIELD, "").strip().strip("`").lower()
+    return value or "low"
+
+
+def task_durations(task_blocks: list[TaskBlock], weights: dict[str, float]) -> dict[str, float]:
+    """Map task IDs to predicted durations from their Complexity weight."""
+    fallback = weights.get("low", DEFAULT_COMPLEXITY_WEIGHTS["low"])
+    durations: dict[str, float] = {}
+    for task_block in task_blocks:
+        durations.setdefault(task_block.id, weights.get(task_complexity(task_block), fallback))
+    return durations
+
+
+def _history_records(path: Path) -> list[dict]:
+    text = path.read_text(encoding="utf-8")
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+    if isinstance(data, dict) and isinstance(data.get("tasks"), list):
+        return data["tasks"]
+    if isinstance(data, list):
+        return data
+    raise ValueError(f"{path}: expected a list of records or an object with a 'tasks' list")
+
+
+def _record_duration(record: dict) -> float | None:
+    """Return a record's positive duration in seconds, or None if it has none."""
+    duration = record.get("duration", record.get("seconds"))
+    if isinstance(duration, bool) or not isinstance(duration, int | float | str):
+        return None
+    try:
+        seconds = float(duration)
+    except ValueError:
+        return None
+    return seconds if 0 < seconds < math.inf else None
+
+
+def calibrate_weights(
+    history_path: Path,
+    task_blocks: list[TaskBlock],
+    weights: dict[str, float],
+) -> dict[str, float]:
+    """Replace weights with mean recorded durations per complexity, in seconds.
+
+    Complexities without history keep their relative weight, scaled by the
+    seconds per weight unit measured across the calibrated ones, so every
+    weight ends up in seconds.
+
+    History is JSON (a list, or an object with a ``tasks`` list) or JSON Lines of
+    records carrying ``duration`` (or ``seconds``) and either ``complexity`` or the
+    task ``id``. Records with a ``status`` other than passed/failed, without a
+    positive numeric duration, or with a non-string complexity are ignored.
+
+    Raises:
+        OSError: If the history file cannot be read.
+        ValueError: If the history file is not valid JSON or not a list of records.
+    """
+    complexity_by_id = {tb.id: task_complexity(tb) for tb in task_blocks}
+    totals: dict[str, tuple[float, int]] = {}
+    for record in _history_records(history_path):
+        if not isinstance(record, dict) or record.get("status", "passed") not in _RAN_STATUSES:
+            continue
+        duration = _record_duration(record)
+        complexity = record.get("complexity") or complexity_by_id.get(str(record.get("id")))
+        if duration is None or not isinstance(complexity, str):
+            continue
+        total, count = totals.get(complexity.lower(), (0.0, 0))
+        totals[complexity.lower()] = (total + duration, count + 1)
+
+    if not totals:
+        return dict(weights)
+    fallback = weights.get("low", DEFAULT_COMPLEXITY_WEIGHTS["low"])
+    units = sum(count * weights.get(c, fallback) for c, (_, count) in totals.items())
+    seconds_per_unit = sum(total for total, _ in totals.values()) / units
+    calibrated = {complexity: weight * seconds_per_unit for complexity, weight in weights.items()}
+    for complexity, (total, count) in totals.items():
+        calibrated[complexity] = total / count
+    return calibrated
+
+
+def _bottom_levels(
+    graph: TaskGraph, durations: dict[str, float], order: list[str]
+) -> dict[str, float]:
+    """Longest remaining path (own duration included) from each task to a sink."""
+    dependents = graph.dependents()
+    bottom: dict[str, float] = {}
+    for task_id in reversed(order):
+        tail = max((bottom[d] for d in dependents[task_id]), default=0.0)
+        bottom[task_id] = durations[task_id] + tail
+    return bottom
+
+
+def list_schedule(
+    graph: TaskGraph,
+    durations: dict[str, float],
+    workers: int,
+    priorities: dict[str, float],
+) -> float:
+    """Simulate greedy list scheduling and return the makespan.
+
+    Whenever a worker is free, the ready task with the longest remaining path
+    starts next (ties broken by file order).
+    """
+    position = {task_id: i for i, task_id in enumerate(graph.task_ids)}
+    remaining = {task_id: len(graph.dependencies[task_id]) for task_id in graph.task_ids}
+    dependents = graph.dependents()
+
+    ready = [(-priorities[t], position[t], t) for t in graph.task_ids if remaining[t] == 0]
+    heapq.heapify(ready)
+    running: list[tuple[float, int, str]] = []
+    now = 0.0
+
+    while ready or running:
+        while ready and len(running) < workers:
+            _, order, task_id = heapq.heappop(ready)
+            heapq.heappush(running, (now + durations[task_id], order, task_id))
+        now, _, finished = heapq.heappop(running)
+        for dependent in dependents[finished]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                heapq.heappush(ready, (-priorities[dependent], position[dependent], dependent))
+
+    return now
+
+
+def simulate_build(
+    graph: TaskGraph,
+    durations: dict[str, float],
+    max_workers: int,
+    min_workers: int = 1,
+) -> SimulationResult:
+    """Predict makespan and utilization for each worker count in the range.
+
+    Raises:
+        ValueError: If the graph has dependency cycles or the range is empty.
+    """
+    if min_workers < 1 or max_workers < min_workers:
+        raise ValueError(f"Invalid worker range {min_workers}..{max_workers}")
+    schedule = compute_waves(graph)
+    if schedule.cyclic:
+        raise ValueError(f"Dependency cycle blocks tasks: {', '.join(schedule.cyclic)}")
+
+    order = [task_id for wave in schedule.waves for task_id in wave]
+    priorities = _bottom_levels(graph, durations, order)
+    total_work = sum(durations[task_id] for task_id in graph.task_ids)
+    critical_path_time = max(priorities.values(), default=0.0)
+
+    points: list[SimulationPoint] = []
+    for workers in range(min_workers, max_workers + 1):
+        makespan = list_schedule(graph, durations, workers, priorities)
+        points.append(
+            SimulationPoint(
+                workers=workers,
+                makespan=makespan,
+                utilization=total_work / (workers * makespan) if makespan else 0.0,
+                speedup=total_work / makespan if makespan else 0.0,
+            )
+        )
+
+    best = min((p.makespan for p in points), default=0.0)
+    saturation = next(
+        (p.workers for p in points if p.makespan <= best * (1 + SATURATION_TOLERANCE)),
+        min_workers,
+    )
+    return SimulationResult(
+        points=points,
+        total_work=total_work,
+        critical_path_time=critical_path_time,
+        saturation_workers=saturation,
+    )
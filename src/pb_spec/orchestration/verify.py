@@ -0,0 +1,273 @@
+"""Parallel wave executor for task ``Verification:`` commands."""
+
+from __future__ import annotations
+
+import os
+import re
+import signal
+import subprocess
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import TextIO
+
+from pb_spec.orchestration.simulate import task_complexity
+from pb_spec.orchestration.verify_cache import CACHED_STATUSES, CachedResult, VerifyCache
+from pb_spec.validation.dag import build_task_graph, compute_waves
+from pb_spec.validation.parser import TaskBlock
+
+VERIFICATION_FIELD = "Verification:"
+DEFAULT_LOG_DIR = Path(".pb-spec") / "verify"
+
+_FENCED_BLOCK_RE = re.compile(r"```[\w-]*\n(.*?)```", re.DOTALL)
+_INLINE_CODE_RE = re.compile(r"`([^`\n]+)`")
+_INACTIVE_STATUSES = ("⏭️ SKIPPED", "⛔ OBSOLETE")
+
+
+class VerifyStatus(Enum):
+    """Outcome of verifying a single task."""
+
+    PASSED = "passed"
+    FAILED = "failed"
+    TIMEOUT = "timeout"
+    NO_COMMAND = "no_command"
+    SKIPPED = "skipped"
+    NOT_RUN = "not_run"
+
+
+FAILING_STATUSES = frozenset({VerifyStatus.FAILED, VerifyStatus.TIMEOUT})
+
+
+@dataclass(frozen=True)
+class VerifyOutcome:
+    """Result of running one task's verification commands."""
+
+    task_id: str
+    status: VerifyStatus
+    complexity: str
+    commands: tuple[str, ...] = ()
+    returncode: int | None = None
+    duration: float = 0.0
+    log_path: str | None = None
+    cached: bool = False
+
+
+# Only definitive results are reused; timeouts may be transient.
+_CACHEABLE_STATUSES = frozenset(VerifyStatus(status) for status in CACHED_STATUSES)
+
+
+@dataclass
+class VerifyReport:
+    """Outcomes of a verification run, in wave order."""
+
+    outcomes: list[VerifyOutcome] = field(default_factory=list)
+    waves: list[list[str]] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        """Return True if no verification failed or timed out."""
+        return not any(o.status in FAILING_STATUSES for o in self.outcomes)
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serialisable summary."""
+        counts: dict[str, int] = {}
+        for outcome in self.outcomes:
+            counts[outcome.status.value] = counts.get(outcome.status.value, 0) + 1
+        return {
+            "passed": self.passed,
+            "counts": counts,
+            "cached": sum(o.cached for o in self.outcomes),
+            "waves": self.waves,
+            "tasks": [
+                {
+                    "id": o.task_id,
+                    "status": o.status.value,
+                    "complexity": o.complexity,
+                    "commands": list(o.commands),
+                    "returncode": o.returncode,
+                    "duration": round(o.duration, 3),
+                    "log": o.log_path,
+                    "cached": o.cached,
+                }
+                for o in self.outcomes
+            ],
+        }
+
+
+def extract_verification_commands(value: str) -> list[str]:
+    """Return shell commands quoted in a Verification value.
+
+    Fenced code blocks contribute one command per non-empty line; otherwise each
+    inline code span is a command. Unquoted prose yields no commands.
+    """
+    fenced = _FENCED_BLOCK_RE.findall(value)
+    if fenced:
+        return [line.strip() for block in fenced for line in block.splitlines() if line.strip()]
+    return [span.strip() for span in _INLINE_CODE_RE.findall(value) if span.strip()]
+
+
+def _run_command(command: str, cwd: Path, log: TextIO, timeout: float | None) -> int | None:
+    """Run ``command`` with output streamed to ``log``; return None on timeout."""
+    log.write(f"$ {command}\n")
+    log.flush()
+    process = subprocess.Popen(
+        command,
+        shell=True,
+        cwd=cwd,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+        start_new_session=True,
+    )
+    try:
+        return process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        # The shell may have spawned children; kill the whole session.
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+        log.write(f"\n[pb-spec] timed out after {timeout}s\n")
+        return None
+
+
+def _verify_task(
+    task_block: TaskBlock,
+    commands: list[str],
+    root: Path,
+    log_dir: Path,
+    timeout: float | None,
+) -> VerifyOutcome:
+    log_path = log_dir / f"task-{task_block.id}.log"
+    started = time.perf_counter()
+    status = VerifyStatus.PASSED
+    returncode: int | None = 0
+    with log_path.open("w", encoding="utf-8") as log:
+        for command in commands:
+            returncode = _run_command(command, root, log, timeout)
+            if returncode is None:
+                status = VerifyStatus.TIMEOUT
+                break
+            if returncode != 0:
+                status = VerifyStatus.FAILED
+                break
+    return VerifyOutcome(
+        task_id=task_block.id,
+        status=status,
+        complexity=task_complexity(task_block),
+        commands=tuple(commands),
+        returncode=returncode,
+        duration=time.perf_counter() - started,
+        log_path=str(log_path),
+    )
+
+
+def _cache_hit(
+    cache: VerifyCache | None,
+    task_block: TaskBlock,
+    commands: list[str],
+    keys: dict[str, str],
+) -> VerifyOutcome | None:
+    """Return the cached outcome for a task, recording its key in ``keys``."""
+    if cache is None:
+        return None
+    key = cache.key_for(task_block, commands)
+    if key is None:
+        return None
+    keys[task_block.id] = key
+    cached = cache.lookup(task_block.id, key)
+    if cached is None:
+        return None
+    return VerifyOutcome(
+        task_id=task_block.id,
+        status=VerifyStatus(cached.status),
+        complexity=task_complexity(task_block),
+        commands=tuple(commands),
+        returncode=cached.returncode,
+        duration=cached.duration,
+        log_path=cached.log_path,
+        cached=True,
+    )
+
+
+def run_verifications(
+    task_blocks: list[TaskBlock],
+    root: Path,
+    log_dir: Path | None = None,
+    max_workers: int | None = None,
+    timeout: float | None = None,
+    cache: VerifyCache | None = None,
+) -> VerifyReport:
+    """Run Verification commands wave by wave on a bounded pool of processes.
+
+    Tasks in the same DependsOn wave run concurrently (at most ``max_workers``
+    commands at a time). Once a wave contains a failure, later waves are not run.
+    With a ``cache``, tasks whose commands and inputs are unchanged reuse their
+    last pass/fail result instead of running; new results are stored back
+    (the caller saves the cache).
+
+    Raises:
+        ValueError: If DependsOn metadata contains a cycle.
+    """
+    graph = build_task_graph(task_blocks)
+    schedule = compute_waves(graph)
+    if schedule.cyclic:
+        raise ValueError(f"Dependency cycle blocks tasks: {', '.join(schedule.cyclic)}")
+
+    blocks: dict[str, TaskBlock] = {}
+    for task_block in task_blocks:
+        blocks.setdefault(task_block.id, task_block)
+    log_dir = log_dir or root / DEFAULT_LOG_DIR
+    log_dir.mkdir(parents=True, exist_ok=True)
+    workers = max_workers or os.process_cpu_count() or 1
+
+    report = VerifyReport(waves=schedule.waves)
+    halted = False
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for wave in schedule.waves:
+            resolved: dict[str, VerifyOutcome] = {}
+            running: dict[str, Future[VerifyOutcome]] = {}
+            keys: dict[str, str] = {}
+            for task_id in wave:
+                task_block = blocks[task_id]
+                complexity = task_complexity(task_block)
+                commands = extract_verification_commands(
+                    task_block.fields.get(VERIFICATION_FIELD, "")
+                )
+                status = task_block.fields.get("Status:", "")
+                if halted:
+                    resolved[task_id] = VerifyOutcome(
+                        task_id, VerifyStatus.NOT_RUN, complexity, tuple(commands)
+                    )
+                elif any(marker in status for marker in _INACTIVE_STATUSES):
+                    resolved[task_id] = VerifyOutcome(task_id, VerifyStatus.SKIPPED, complexity)
+                elif not commands:
+                    resolved[task_id] = VerifyOutcome(task_id, VerifyStatus.NO_COMMAND, complexity)
+                elif (hit := _cache_hit(cache, task_block, commands, keys)) is not None:
+                    resolved[task_id] = hit
+                else:
+                    running[task_id] = pool.submit(
+                        _verify_task, task_block, commands, root, log_dir, timeout
+                    )
+            for task_id in wave:
+                future = running.get(task_id)
+                outcome = future.result() if future is not None else resolved[task_id]
+                report.outcomes.append(outcome)
+                halted = halted or outcome.status in FAILING_STATUSES
+                if (
+                    cache is not None
+                    and outcome.task_id in keys
+                    and not outcome.cached
+                    and outcome.status in _CACHEABLE_STATUSES
+                ):
+                    cache.store(
+                        outcome.task_id,
+                        CachedResult(
+                            key=keys[outcome.task_id],
+                            status=outcome.status.value,
+                            returncode=outcome.returncode,
+                            duration=outcome.duration,
+                            log_path=outcome.log_path,
+                        ),
+                    )
+
+    return report
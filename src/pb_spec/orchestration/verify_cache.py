@@ -0,0 +1,182 @@
+"""Input-hash cache for task verification results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from pb_spec.validation.parser import TaskBlock
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_PATH = Path(".pb-spec") / "verify-cache.json"
+CONTEXT_FIELD = "Context:"
+
+# Verification statuses worth reusing; anything else in a cache file is dropped.
+CACHED_STATUSES = frozenset({"passed", "failed"})
+
+# Environment that commonly changes what a test command does.
+DEFAULT_CACHE_ENV = ("PATH", "VIRTUAL_ENV", "PYTHONPATH")
+
+_INLINE_CODE_RE = re.compile(r"`([^`\n]+)`")
+_PATH_TOKEN_RE = re.compile(r"(?<![\w/.-])((?:[\w.-]+/)*[\w-]+\.[A-Za-z0-9]+|(?:[\w.-]+/)+)")
+_IGNORED_DIRS = frozenset({".git", ".pb-spec", "__pycache__", ".venv", "node_modules"})
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    """Last recorded verification result for a task."""
+
+    key: str
+    status: str
+    returncode: int | None
+    duration: float
+    log_path: str | None
+
+
+def context_paths(task_block: TaskBlock, root: Path) -> list[str]:
+    """Return existing paths (relative to root) named in a task's Context field.
+
+    Code spans are considered first; bare tokens that look like paths
+    (``src/app.py``, ``docs/``) are also accepted when they exist.
+    """
+    value = task_block.fields.get(CONTEXT_FIELD, "")
+    candidates = _INLINE_CODE_RE.findall(value) + _PATH_TOKEN_RE.findall(value)
+    paths: list[str] = []
+    for candidate in dict.fromkeys(c.strip().rstrip(".,;:") for c in candidates):
+        if candidate and not Path(candidate).is_absolute() and (root / candidate).exists():
+            paths.append(candidate.rstrip("/"))
+    return paths
+
+
+def _expand(root: Path, relative: str) -> list[Path]:
+    path = root / relative
+    if path.is_file():
+        return [path]
+    files: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = sorted(d for d in dirnames if d not in _IGNORED_DIRS)
+        files.extend(Path(dirpath) / name for name in sorted(filenames))
+    return files
+
+
+class VerifyCache:
+    """Verification results keyed by command, input file hashes and environment.
+
+    File digests are memoised by ``(mtime_ns, size)`` so unchanged inputs are not
+    re-read on every run.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        root: Path,
+        input_globs: tuple[str, ...] = (),
+        env_names: tuple[str, ...] = DEFAULT_CACHE_ENV,
+    ) -> None:
+        self.path = path
+        self.root = root
+        self.input_globs = input_globs
+        self.env_names = env_names
+        self._results: dict[str, CachedResult] = {}
+        self._digests: dict[str, tuple[int, int, str]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except OSError, ValueError:
+            return
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return
+        try:
+            results = {
+                task_id: CachedResult(**entry) for task_id, entry in data.get("results", {}).items()
+            }
+            digests = {
+                name: (mtime_ns, size, digest)
+                for name, (mtime_ns, size, digest) in data.get("files", {}).items()
+            }
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.debug("Discarding malformed verify cache %s: %s", self.path, e)
+            return
+        for task_id, result in list(results.items()):
+            if not isinstance(result.status, str) or result.status not in CACHED_STATUSES:
+                logger.debug("Dropping verify cache entry %s: status %r", task_id, result.status)
+                del results[task_id]
+        self._results = results
+        self._digests = digests
+
+    def save(self) -> None:
+        """Write the cache atomically."""
+        payload = {
+            "version": CACHE_VERSION,
+            "results": {
+                task_id: {
+                    "key": r.key,
+                    "status": r.status,
+                    "returncode": r.returncode,
+                    "duration": r.duration,
+                    "log_path": r.log_path,
+                }
+                for task_id, r in sorted(self._results.items())
+            },
+            "files": {name: list(entry) for name, entry in sorted(self._digests.items())},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+    def _file_digest(self, path: Path) -> str:
+        name = path.relative_to(self.root).as_posix()
+        stat = path.stat()
+        cached = self._digests.get(name)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self._digests[name] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def input_files(self, task_block: TaskBlock) -> list[Path]:
+        """Return the files whose contents a task's result depends on."""
+        files: dict[Path, None] = {}
+        for relative in context_paths(task_block, self.root):
+            files.update(dict.fromkeys(_expand(self.root, relative)))
+        for pattern in self.input_globs:
+            files.update(dict.fromkeys(p for p in sorted(self.root.glob(pattern)) if p.is_file()))
+        return list(files)
+
+    def key_for(self, task_block: TaskBlock, commands: list[str]) -> str | None:
+        """Return the cache key for a task, or None if it declares no inputs.
+
+        Tasks without declared inputs are never cached: nothing would tell a
+        stale result apart from a fresh one.
+        """
+        files = self.input_files(task_block)
+        if not files:
+            return None
+        hasher = hashlib.sha256()
+        for command in commands:
+            hasher.update(f"cmd\0{command}\0".encode())
+        for path in files:
+            relative = path.relative_to(self.root).as_posix()
+            hasher.update(f"file\0{relative}\0{self._file_digest(path)}\0".encode())
+        for name in self.env_names:
+            hasher.update(f"env\0{name}\0{os.environ.get(name, '')}\0".encode())
+        return hasher.hexdigest()
+
+    def lookup(self, task_id: str, key: str) -> CachedResult | None:
+        """Return the stored result for a task if its key still matches."""
+        cached = self._results.get(task_id)
+        return cached if cached is not None and cached.key == key else None
+
+    def store(self, task_id: str, result: CachedResult) -> None:
+        """Record the latest result for a task."""
+        self._results[task_id] = result
@@ -0,0 +1,195 @@
+"""Opt-in timing spans, Chrome trace export, and cProfile/tracemalloc dumps.
+
+Instrumented code calls ``span(name)`` or decorates functions with
+``traced(name)``. Until ``enable()`` installs a Recorder both are no-ops:
+``span`` returns a shared null context and ``traced`` calls straight through,
+so disabled profiling adds no allocation and no clock reads.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+_NULL_SPAN: AbstractContextManager[None] = nullcontext()
+_recorder: Recorder | None = None
+
+
+@dataclass(frozen=True)
+class SpanEvent:
+    """One completed span."""
+
+    name: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    detail: str | None = None
+
+
+@dataclass(frozen=True)
+class SpanSummary:
+    """Aggregate timings of every span with the same name."""
+
+    name: str
+    calls: int
+    total_ms: float
+    max_ms: float
+
+
+@dataclass
+class Recorder:
+    """Collects span events from every thread."""
+
+    events: list[SpanEvent] = field(default_factory=list)
+    thread_names: dict[int, str] = field(default_factory=dict)
+    origin_ns: int = field(default_factory=time.perf_counter_ns)
+
+    @contextmanager
+    def span(self, name: str, detail: str | None = None) -> Generator[None]:
+        """Record the wall time of the enclosed block as ``name``."""
+        thread_id = threading.get_native_id()
+        if thread_id not in self.thread_names:
+            self.thread_names[thread_id] = threading.current_thread().name
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter_ns() - started
+            # list.append is atomic, so worker threads need no lock.
+            self.events.append(SpanEvent(name, started, duration, thread_id, detail))
+
+    def summary(self) -> list[SpanSummary]:
+        """Return per-name totals, slowest first."""
+        totals: dict[str, list[int]] = {}
+        for event in self.events:
+            totals.setdefault(event.name, []).append(event.duration_ns)
+        summaries = [
+            SpanSummary(name, len(durations), sum(durations) / 1e6, max(durations) / 1e6)
+            for name, durations in totals.items()
+        ]
+        return sorted(summaries, key=lambda s: s.total_ms, reverse=True)
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Return the events in Chrome trace-event format (viewable in Perfetto)."""
+        pid = os.getpid()
+        trace: list[dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self.thread_names.items()
+        ]
+        for event in self.events:
+            record: dict[str, Any] = {
+                "name": event.name,
+                "cat": "pb-spec",
+                "ph": "X",
+                "ts": (event.start_ns - self.origin_ns) / 1000,
+                "dur": event.duration_ns / 1000,
+                "pid": pid,
+                "tid": event.thread_id,
+            }
+            if event.detail is not None:
+                record["args"] = {"detail": event.detail}
+            trace.append(record)
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: Path) -> None:
+        """Write the Chrome trace JSON to ``path``."""
+        import json
+
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+
+
+def enable() -> Recorder:
+    """Install and return a fresh Recorder; spans are recorded from now on."""
+    global _recorder
+    _recorder = Recorder()
+    return _recorder
+
+
+def disable() -> None:
+    """Stop recording spans."""
+    global _recorder
+    _recorder = None
+
+
+def is_enabled() -> bool:
+    """Return whether spans are being recorded."""
+    return _recorder is not None
+
+
+def span(name: str, detail: str | None = None) -> AbstractContextManager[None]:
+    """Time the enclosed block as ``name`` when profiling is enabled."""
+    if _recorder is None:
+        return _NULL_SPAN
+    return _recorder.span(name, detail)
+
+
+def traced[**P, R](name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorate a function so each call is recorded as a span named ``name``."""
+
+    def decorator(function: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _recorder is None:
+                return function(*args, **kwargs)
+            with _recorder.span(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def profiling_session(
+    summary: bool = False,
+    trace_path: Path | None = None,
+    cprofile_path: Path | None = None,
+    tracemalloc_path: Path | None = None,
+) -> Generator[Recorder | None]:
+    """Collect the requested profiles for the enclosed block and write them on exit.
+
+    Yields the Recorder when ``summary`` or ``trace_path`` asks for spans, else
+    None. The cProfile dump is pstats-loadable; the tracemalloc dump lists the
+    top allocation sites and the peak traced memory.
+    """
+    recorder = enable() if summary or trace_path is not None else None
+    profiler = None
+    if cprofile_path is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    if tracemalloc_path is not None:
+        import tracemalloc
+
+        tracemalloc.start()
+    try:
+        yield recorder
+    finally:
+        if profiler is not None and cprofile_path is not None:
+            profiler.disable()
+            profiler.dump_stats(cprofile_path)
+        if tracemalloc_path is not None:
+            _write_tracemalloc(tracemalloc_path)
+        if recorder is not None:
+            disable()
+            if trace_path is not None:
+                recorder.write_trace(trace_path)
+
+
+def _write_tracemalloc(path: Path, limit: int = 25) -> None:
+    import tracemalloc
+
+    snapshot = tracemalloc.take_snapshot()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    lines = [f"current: {current / 1024:.1f} KiB", f"peak: {peak / 1024:.1f} KiB", ""]
+    lines += [str(stat) for stat in snapshot.statistics("lineno")[:limit]]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
@@ -0,0 +1,242 @@
+"""Maintained ``specs/.index`` manifest for fast spec discovery and listing.
+
+The manifest caches one entry per spec directory (name, date prefix, mtimes,
+task status counts, last validation outcome) plus the name of the latest spec.
+It is refreshed incrementally: only spec directories whose ``tasks.md`` changed
+are re-parsed. Freshness is decided by comparing the ``specs/`` mtime, which
+changes whenever a spec directory is added, removed or renamed, with the
+manifest's own mtime: after writing, the manifest's mtime is set to the
+directory mtime read after the rename.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import time
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+
+from pb_spec.exceptions import FileReadError
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = ".index"
+INDEX_VERSION = 2
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+
+@dataclass(frozen=True)
+class ValidationOutcome:
+    """Outcome of the last ``pb-spec validate`` run recorded for a spec."""
+
+    mode: str
+    passed: bool
+    timestamp: float
+
+
+@dataclass(frozen=True)
+class SpecIndexEntry:
+    """Cached metadata for a single spec directory."""
+
+    name: str
+    date: str | None
+    mtime_ns: int
+    tasks_mtime_ns: int | None = None
+    status_counts: dict[str, int] = field(default_factory=dict)
+    last_validation: ValidationOutcome | None = None
+
+
+@dataclass
+class SpecIndex:
+    """In-memory view of the ``specs/.index`` manifest."""
+
+    dir_mtime_ns: int
+    latest: str | None
+    entries: dict[str, SpecIndexEntry] = field(default_factory=dict)
+
+
+def spec_sort_key(name: str) -> tuple[int, str]:
+    """Order date-prefixed spec names after undated ones, then by name."""
+    if _DATE_RE.match(name):
+        return (1, name)
+    return (0, name)
+
+
+def _date_prefix(name: str) -> str | None:
+    match = _DATE_RE.match(name)
+    return match.group(0) if match else None
+
+
+def _index_path(specs_dir: Path) -> Path:
+    return specs_dir / INDEX_FILE_NAME
+
+
+def _entry_from_json(raw: dict) -> SpecIndexEntry:
+    outcome = raw.get("last_validation")
+    return SpecIndexEntry(
+        name=raw["name"],
+        date=raw.get("date"),
+        mtime_ns=raw["mtime_ns"],
+        tasks_mtime_ns=raw.get("tasks_mtime_ns"),
+        status_counts=dict(raw.get("status_counts", {})),
+        last_validation=ValidationOutcome(**outcome) if outcome else None,
+    )
+
+
+def load_spec_index(specs_dir: Path) -> SpecIndex | None:
+    """Load the manifest, returning None when it is missing or unreadable."""
+    try:
+        with _index_path(specs_dir).open(encoding="utf-8") as f:
+            mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            raw = json.loads(f.read())
+        if raw.get("version") != INDEX_VERSION:
+            return None
+        return SpecIndex(
+            dir_mtime_ns=mtime_ns,
+            latest=raw.get("latest"),
+            entries={name: _entry_from_json(e) for name, e in raw["specs"].items()},
+        )
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug("Ignoring unreadable spec index in %s: %s", specs_dir, e)
+        return None
+
+
+def is_index_fresh(specs_dir: Path, index: SpecIndex) -> bool:
+    """Return True if no spec directory was added, removed or renamed since the write."""
+    try:
+        return specs_dir.stat().st_mtime_ns == index.dir_mtime_ns
+    except OSError:
+        return False
+
+
+def _spec_dir_names(specs_dir: Path) -> set[str]:
+    with os.scandir(specs_dir) as it:
+        return {entry.name for entry in it if entry.is_dir()}
+
+
+def _write_spec_index(specs_dir: Path, index: SpecIndex) -> None:
+    """Atomically replace the manifest and mark it fresh for the current directory mtime.
+
+    The manifest's mtime is set to the ``specs/`` mtime read after the rename,
+    unless the spec directories no longer match ``index``; a directory added
+    or removed meanwhile stamps it with mtime 0, so the next lookup rescans.
+    The ``specs/`` timestamps themselves are never modified.
+    """
+    payload = {
+        "version": INDEX_VERSION,
+        "latest": index.latest,
+        "specs": {name: asdict(entry) for name, entry in sorted(index.entries.items())},
+    }
+    path = _index_path(specs_dir)
+    tmp_path = path.with_name(f"{INDEX_FILE_NAME}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, path)
+        dir_mtime_ns = specs_dir.stat().st_mtime_ns
+        if _spec_dir_names(specs_dir) != index.entries.keys():
+            # Stamp an mtime no directory has, even if both fell in one clock tick.
+            dir_mtime_ns = 0
+        os.utime(path, ns=(dir_mtime_ns, dir_mtime_ns))
+        index.dir_mtime_ns = dir_mtime_ns
+    except OSError as e:
+        logger.debug("Cannot write spec index in %s: %s", specs_dir, e)
+        tmp_path.unlink(missing_ok=True)
+
+
+def _task_status_counts(tasks_file: Path) -> dict[str, int]:
+    # Deferred: resolving the latest spec must not pull in the markdown parser.
+    from pb_spec.validation.io import read_file_content
+    from pb_spec.validation.parser import parse_task_blocks
+
+    try:
+        content = read_file_content(tasks_file)
+    except FileReadError as e:
+        logger.warning("Cannot read %s: %s", tasks_file, e)
+        return {}
+    counts: dict[str, int] = {}
+    for task_block in parse_task_blocks(content):
+        status = task_block.fields.get("Status:", "").strip() or "(missing)"
+        counts[status] = counts.get(status, 0) + 1
+    return counts
+
+
+def _build_entry(entry: os.DirEntry[str], previous: SpecIndexEntry | None) -> SpecIndexEntry:
+    """Build an index entry, reusing the previous one when tasks.md is unchanged."""
+    tasks_file = Path(entry.path) / "tasks.md"
+    try:
+        tasks_mtime_ns: int | None = tasks_file.stat().st_mtime_ns
+    except OSError:
+        tasks_mtime_ns = None
+
+    mtime_ns = entry.stat().st_mtime_ns
+    if previous is not None and previous.tasks_mtime_ns == tasks_mtime_ns:
+        return replace(previous, mtime_ns=mtime_ns)
+
+    return SpecIndexEntry(
+        name=entry.name,
+        date=_date_prefix(entry.name),
+        mtime_ns=mtime_ns,
+        tasks_mtime_ns=tasks_mtime_ns,
+        status_counts=_task_status_counts(tasks_file) if tasks_mtime_ns is not None else {},
+        last_validation=previous.last_validation if previous else None,
+    )
+
+
+def _rebuild_index(specs_dir: Path) -> SpecIndex:
+    previous = load_spec_index(specs_dir)
+    previous_entries = previous.entries if previous else {}
+
+    entries: dict[str, SpecIndexEntry] = {}
+    with os.scandir(specs_dir) as it:
+        for entry in it:
+            if entry.is_dir():
+                entries[entry.name] = _build_entry(entry, previous_entries.get(entry.name))
+
+    latest = max(entries, key=spec_sort_key) if entries else None
+    return SpecIndex(dir_mtime_ns=0, latest=latest, entries=entries)
+
+
+def refresh_spec_index(specs_dir: Path) -> SpecIndex:
+    """Bring the manifest up to date with a single ``os.scandir`` pass and persist it."""
+    index = _rebuild_index(specs_dir)
+    _write_spec_index(specs_dir, index)
+    return index
+
+
+def scan_latest_spec_name(specs_dir: Path) -> str | None:
+    """Return the latest spec directory name with a single ``os.scandir`` max-scan."""
+    latest: str | None = None
+    latest_key: tuple[int, str] | None = None
+    with os.scandir(specs_dir) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            key = spec_sort_key(entry.name)
+            if latest_key is None or key > latest_key:
+                latest, latest_key = entry.name, key
+    return latest
+
+
+def latest_spec_name(specs_dir: Path) -> str | None:
+    """Resolve the latest spec name from the manifest, scanning when it is stale."""
+    index = load_spec_index(specs_dir)
+    if index is not None and is_index_fresh(specs_dir, index):
+        return index.latest
+    return scan_latest_spec_name(specs_dir)
+
+
+def record_validation_outcome(spec_dir: Path, mode: str, passed: bool) -> None:
+    """Refresh the manifest and store the outcome of a validation run for ``spec_dir``."""
+    specs_dir = spec_dir.parent
+    if not specs_dir.is_dir():
+        return
+    index = _rebuild_index(specs_dir)
+    entry = index.entries.get(spec_dir.name)
+    if entry is not None:
+        outcome = ValidationOutcome(mode=mode, passed=passed, timestamp=time.time())
+        index.entries[spec_dir.name] = replace(entry, last_validation=outcome)
+    _write_spec_index(specs_dir, index)
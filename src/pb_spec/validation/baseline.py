@@ -0,0 +1,129 @@
+"""Issue baselines: suppress pre-existing scan issues by fingerprint.
+
+A fingerprint hashes an issue's path, type and whitespace-normalised line
+content, so it survives line-number shifts but not edits to the line itself.
+The baseline file is plain text: a header, ``blob <oid> <path>`` lines for the
+files that matched the git index when it was created, then one fingerprint per
+line, each section sorted so the file diffs cleanly. A file whose index blob
+still matches and that git reports unmodified is skipped without being read:
+every issue it holds is already in the baseline.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pb_spec.exceptions import BaselineError
+from pb_spec.git_utils import get_clean_index_blobs
+from pb_spec.validation.scanner import CodeScanner, IssueType, ScanIssue
+
+BASELINE_FILE_NAME = ".pb-spec-baseline"
+_HEADER = "# pb-spec baseline v1"
+
+
+def issue_fingerprint(path: str, issue_type: IssueType, line_content: str) -> str:
+    """Return the 64-bit hex fingerprint of an issue, independent of its line number."""
+    normalized = " ".join(line_content.split())
+    data = f"{path}\0{issue_type.value}\0{normalized}".encode()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+@dataclass
+class Baseline:
+    """Known issue fingerprints plus the git blob id of each baselined file.
+
+    ``suppressed`` and ``skipped_files`` count what scans using this baseline
+    left out.
+    """
+
+    fingerprints: frozenset[str] = frozenset()
+    blobs: dict[str, str] = field(default_factory=dict)
+    suppressed: int = 0
+    skipped_files: int = 0
+
+    @staticmethod
+    def path_key(root: Path, file_path: Path) -> str:
+        """Return ``file_path`` relative to the resolved scan ``root``, in POSIX form."""
+        try:
+            return file_path.resolve().relative_to(root).as_posix()
+        except ValueError:
+            return file_path.as_posix()
+
+    def is_known(self, path: str, issue: ScanIssue) -> bool:
+        """Return True if ``issue`` in the file keyed ``path`` is in the baseline."""
+        fingerprint = issue_fingerprint(path, issue.issue_type, issue.line_content)
+        return fingerprint in self.fingerprints
+
+    def unchanged_files(self, root_dir: Path, current: Mapping[str, str] | None = None) -> set[str]:
+        """Return keys of baselined files whose blob id is unchanged.
+
+        ``current`` maps paths to the blob ids being scanned (a revision or the
+        index); by default the working tree is compared through git's index.
+        """
+        if not self.blobs:
+            return set()
+        if current is None:
+            current = get_clean_index_blobs(root_dir)
+        return {path for path, oid in self.blobs.items() if current.get(path) == oid}
+
+    def dumps(self) -> str:
+        """Render the baseline file."""
+        lines = [_HEADER]
+        lines.extend(f"blob {oid} {path}" for path, oid in sorted(self.blobs.items()))
+        lines.extend(sorted(self.fingerprints))
+        return "\n".join(lines) + "\n"
+
+
+def load_baseline(path: Path) -> Baseline:
+    """Read a baseline file written by :func:`create_baseline`.
+
+    Raises:
+        BaselineError: If the file cannot be read, is not a baseline, or has a
+            malformed ``blob`` line.
+    """
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError) as e:
+        raise BaselineError(f"Cannot read baseline {path}: {e}") from e
+    if not lines or lines[0] != _HEADER:
+        raise BaselineError(f"{path} is not a pb-spec baseline (expected '{_HEADER}')")
+    fingerprints: set[str] = set()
+    blobs: dict[str, str] = {}
+    for lineno, line in enumerate(lines[1:], start=2):
+        if line.startswith("blob "):
+            try:
+                _, oid, file_path = line.split(" ", 2)
+            except ValueError:
+                oid = file_path = ""
+            if not oid or not file_path:
+                raise BaselineError(f"{path}:{lineno}: malformed blob line {line!r}")
+            blobs[file_path] = oid
+        elif line:
+            fingerprints.add(line)
+    return Baseline(frozenset(fingerprints), blobs)
+
+
+def create_baseline(root_dir: Path | str = ".") -> Baseline:
+    """Scan the codebase under ``root_dir`` and record every current issue."""
+    root = Path(root_dir)
+    resolved = root.resolve()
+    scanner = CodeScanner(root_dir=root)
+    files = scanner.files_to_scan()
+    clean = get_clean_index_blobs(root)
+    blobs: dict[str, str] = {}
+    for file_path in files:
+        key = Baseline.path_key(resolved, file_path)
+        if key in clean and "\n" not in key:
+            blobs[key] = clean[key]
+
+    keys: dict[str, str] = {}
+    fingerprints: set[str] = set()
+    for issue in scanner.iter_issues(files):
+        key = keys.get(issue.file_path)
+        if key is None:
+            key = keys[issue.file_path] = Baseline.path_key(resolved, root / issue.file_path)
+        fingerprints.add(issue_fingerprint(key, issue.issue_type, issue.line_content))
+    return Baseline(frozenset(fingerprints), blobs)
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Iterable, Mapping
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+from pb_spec.commands.discovery import project_root_for
 from pb_spec.exceptions import FileReadError
 from pb_spec.git_utils import get_git_modified_files
+from pb_spec.profiling import traced
+from pb_spec.validation.gherkin import find_files_without_scenarios
 from pb_spec.validation.io import read_file_content
 from pb_spec.validation.parser import (
     TASK_CHECKBOX_RE,
@@ -15,33 +20,66 @@ from pb_spec.validation.parser import (
     parse_task_blocks,
     task_display_name,
 )
+from pb_spec.validation.pipeline import Phase, merge_results, run_phases
 from pb_spec.validation.result import (
     ErrorSeverity,
     ValidationError,
     ValidationResult,
 )
-from pb_spec.validation.scanner import CodeScanner, IssueType, ScanResult
+from pb_spec.validation.scanner import (
+    CodeScanner,
+    IssueType,
+    ScanCache,
+    ScanIssue,
+    ScanResult,
+    ScanStats,
+)
+from pb_spec.validation.steps import check_steps
+
+if TYPE_CHECKING:
+    from pb_spec.git_utils import GitBlobs
+    from pb_spec.validation.baseline import Baseline
 
 logger = logging.getLogger(__name__)
 
 
+_SCAN_FAILED = ValidationError(
+    message="Codebase scan failed - found issues that need to be addressed.",
+    severity=ErrorSeverity.HIGH,
+)
+
+_SCAN_SEVERITY: dict[IssueType, ErrorSeverity] = {
+    IssueType.SKIPPED_TEST: ErrorSeverity.HIGH,
+    IssueType.NOT_IMPLEMENTED: ErrorSeverity.HIGH,
+    IssueType.TODO: ErrorSeverity.LOW,
+    IssueType.DEBUG_ARTIFACT: ErrorSeverity.MEDIUM,
+}
+
+
+def _scan_issue_to_error(issue: ScanIssue) -> ValidationError:
+    """Convert one ScanIssue to a structured ValidationError."""
+    return ValidationError(
+        message=issue.message,
+        file_path=issue.file_path,
+        line_number=issue.line_number,
+        severity=_SCAN_SEVERITY.get(issue.issue_type, ErrorSeverity.MEDIUM),
+    )
+
+
 def _scan_result_to_errors(scan_result: ScanResult) -> list[ValidationError]:
     """Convert ScanResult issues to structured ValidationErrors."""
-    severity_map = {
-        IssueType.SKIPPED_TEST: ErrorSeverity.HIGH,
-        IssueType.NOT_IMPLEMENTED: ErrorSeverity.HIGH,
-        IssueType.TODO: ErrorSeverity.LOW,
-        IssueType.DEBUG_ARTIFACT: ErrorSeverity.MEDIUM,
-    }
-    return [
-        ValidationError(
-            message=issue.message,
-            file_path=issue.file_path,
-            line_number=issue.line_number,
-            severity=severity_map.get(issue.issue_type, ErrorSeverity.MEDIUM),
-        )
-        for issue in scan_result.issues
-    ]
+    return [_scan_issue_to_error(issue) for issue in scan_result.issues]
+
+
+def _stream_scan_errors(
+    issues: Iterable[ScanIssue], on_error: Callable[[ValidationError], None]
+) -> bool:
+    """Pass each issue to ``on_error`` as it is found; return whether there were any."""
+    found = False
+    for issue in issues:
+        on_error(_scan_issue_to_error(issue))
+        found = True
+    return found
 
 
 def _validate_task_completion(task_blocks: list[TaskBlock], content: str) -> list[ValidationError]:
@@ -125,64 +163,159 @@ def _validate_task_completion_warnings(task_blocks: list[TaskBlock]) -> list[str
     ]
 
 
-def _run_codebase_scan(git_only: bool = False, root_dir: Path | str = ".") -> ScanResult:
-    """Scan codebase for code quality issues."""
-    target_files: set[Path] | None = None
-    if git_only:
+def _codebase_scanner(
+    git_only: bool = False,
+    root_dir: Path | str = ".",
+    scan_cache: ScanCache | None = None,
+    target_files: set[Path] | None = None,
+    scan_stats: ScanStats | None = None,
+    baseline: Baseline | None = None,
+    blobs: GitBlobs | None = None,
+) -> CodeScanner:
+    """Create a scanner, limited to git-modified files when ``git_only`` is set.
+
+    With ``blobs``, the modified files are those the revision or index changes.
+    """
+    if git_only and target_files is None and blobs is not None:
+        target_files = blobs.changed_files()
+    elif git_only and target_files is None:
         target_files = get_git_modified_files(root_dir)
-    scanner = CodeScanner(root_dir=root_dir, target_files=target_files)
-    return scanner.scan()
+    return CodeScanner(
+        root_dir=root_dir,
+        target_files=target_files,
+        cache=scan_cache,
+        stats=scan_stats,
+        baseline=baseline,
+        blobs=blobs,
+    )
 
 
-def _validate_codebase_scan(root_dir: Path | str = ".") -> list[ValidationError]:
-    """Run codebase scan and return errors."""
-    scan_result = _run_codebase_scan(git_only=False, root_dir=root_dir)
+def _codebase_scan_errors(scan_result: ScanResult) -> list[ValidationError]:
+    """Return errors for a full codebase scan, headed by a summary error."""
     if not scan_result.has_issues:
         return []
-
-    errors = [
-        ValidationError(
-            message="Codebase scan failed - found issues that need to be addressed.",
-            severity=ErrorSeverity.HIGH,
-        ),
-    ]
-    errors.extend(_scan_result_to_errors(scan_result))
-    return errors
+    return [_SCAN_FAILED, *_scan_result_to_errors(scan_result)]
 
 
 def _validate_feature_scenarios(spec_dir: Path) -> list[ValidationError]:
-    """Validate that .feature files contain at least one Scenario."""
+    """Validate that .feature files contain at least one Scenario heading."""
     errors: list[ValidationError] = []
     features_dir = spec_dir / "features"
     if not features_dir.exists():
         return errors
 
-    for feature_file in features_dir.glob("*.feature"):
-        try:
-            content = read_file_content(feature_file)
-        except FileReadError as e:
-            logger.warning("Cannot read %s: %s", feature_file, e)
+    for feature_file, read_error in find_files_without_scenarios(features_dir.glob("*.feature")):
+        if read_error is not None:
+            logger.warning("Cannot read %s: %s", feature_file, read_error)
             continue
-        if "Scenario" not in content:
-            errors.append(
-                ValidationError(
-                    message=f"{feature_file.name} contains no Scenario definition",
-                    file_path=str(feature_file),
-                    severity=ErrorSeverity.HIGH,
-                )
+        errors.append(
+            ValidationError(
+                message=f"{feature_file.name} contains no Scenario definition",
+                file_path=str(feature_file),
+                severity=ErrorSeverity.HIGH,
             )
+        )
 
     return errors
 
 
-def validate_build(spec_dir: Path) -> ValidationResult:
+def _step_directories(spec_dir: Path, project_root: Path) -> list[Path]:
+    """Return behave steps/ directories for the spec and the project, without duplicates."""
+    candidates = [spec_dir / "features" / "steps", project_root / "features" / "steps"]
+    unique = {d.resolve(): d for d in candidates if d.is_dir()}
+    return list(unique.values())
+
+
+def _validate_step_definitions(
+    spec_dir: Path, project_root: Path
+) -> tuple[list[ValidationError], list[str]]:
+    """Match feature steps against statically indexed behave step definitions.
+
+    Only runs when a features/steps/ directory with Python modules exists.
+    Undefined and ambiguous steps are errors; unused definitions are warnings.
+    """
+    step_dirs = _step_directories(spec_dir, project_root)
+    step_files = [path for d in step_dirs for path in d.rglob("*.py")]
+    if not step_files:
+        return [], []
+
+    feature_dirs = {(spec_dir / "features").resolve()} | {d.parent.resolve() for d in step_dirs}
+    feature_files = {path for d in feature_dirs for path in d.rglob("*.feature")}
+    report = check_steps(step_files, feature_files)
+
+    errors = [
+        ValidationError(
+            message=f"Undefined step: {step.step_type.capitalize()} {step.text}",
+            file_path=step.file_path,
+            line_number=step.line_number,
+            severity=ErrorSeverity.HIGH,
+        )
+        for step in report.undefined
+    ]
+    for step, definitions in report.ambiguous:
+        locations = ", ".join(f"{d.file_path}:{d.line_number}" for d in definitions)
+        errors.append(
+            ValidationError(
+                message=f"Ambiguous step: {step.text!r} matches {locations}",
+                file_path=step.file_path,
+                line_number=step.line_number,
+                severity=ErrorSeverity.MEDIUM,
+            )
+        )
+    warnings = [
+        f"Unused step definition {d.pattern!r} ({d.file_path}:{d.line_number})"
+        for d in report.unused
+    ]
+    return errors, warnings
+
+
+def _check_task_completion(tasks_file: Path) -> ValidationResult:
+    """Parse tasks.md and check every task is finished.
+
+    Raises:
+        FileReadError: If tasks.md cannot be read.
+    """
+    content = read_file_content(tasks_file)
+    task_blocks = parse_task_blocks(content)
+    errors = _validate_task_completion(task_blocks, content)
+    return ValidationResult(
+        is_valid=not errors,
+        errors=errors,
+        warnings=_validate_task_completion_warnings(task_blocks),
+    )
+
+
+def _check_step_definitions(spec_dir: Path, project_root: Path) -> ValidationResult:
+    errors, warnings = _validate_step_definitions(spec_dir, project_root)
+    return ValidationResult(is_valid=not errors, errors=errors, warnings=warnings)
+
+
+@traced("validate_build")
+def validate_build(
+    spec_dir: Path,
+    scan_cache: ScanCache | None = None,
+    scan_files: list[Path] | None = None,
+    scan_stats: ScanStats | None = None,
+    phase_timings: dict[str, float] | None = None,
+    on_error: Callable[[ValidationError], None] | None = None,
+    baseline: Baseline | None = None,
+    blobs: GitBlobs | None = None,
+) -> ValidationResult:
     """Validate pb-build task completion (Orchestrator level).
 
+    Task parsing, file enumeration, the codebase scan and the feature and step
+    checks run as concurrent phases; results are merged in a fixed order.
     Returns a ValidationResult; callers are responsible for presenting results.
+    Long-lived callers may pass a ``scan_cache`` to skip re-scanning unchanged files,
+    and ``scan_files`` when they already listed the project's files.
+    Pass ``scan_stats`` to record per-pattern and per-file scan costs, and
+    ``phase_timings`` to collect each phase's wall time.
+    With ``on_error``, codebase scan errors are passed to it from the scan
+    phase's thread as they are found instead of being collected in the result.
+    Scan issues recorded in ``baseline`` are not reported. With ``blobs`` the
+    codebase scan reads that git revision or the index; tasks and features are
+    still read from the working tree.
     """
-    errors: list[ValidationError] = []
-    warnings: list[str] = []
-
     tasks_file = spec_dir / "tasks.md"
     if not tasks_file.exists():
         return ValidationResult(
@@ -196,8 +329,36 @@ def validate_build(spec_dir: Path) -> ValidationResult:
             ],
         )
 
+    project_root = project_root_for(spec_dir)
+    scanner = CodeScanner(
+        root_dir=project_root,
+        cache=scan_cache,
+        stats=scan_stats,
+        baseline=baseline,
+        blobs=blobs,
+    )
+
+    def scan(inputs: Mapping[str, Any]) -> ValidationResult:
+        if on_error is None:
+            errors = _codebase_scan_errors(scanner.scan(inputs["files"]))
+        else:
+            found = _stream_scan_errors(scanner.iter_issues(inputs["files"]), on_error)
+            errors = [_SCAN_FAILED] if found else []
+        return ValidationResult(is_valid=not errors, errors=errors)
+
+    def feature_scenarios(_: Mapping[str, Any]) -> ValidationResult:
+        errors = _validate_feature_scenarios(spec_dir)
+        return ValidationResult(is_valid=not errors, errors=errors)
+
+    phases = [
+        Phase("tasks", lambda _: _check_task_completion(tasks_file)),
+        Phase("files", lambda _: scanner.files_to_scan() if scan_files is None else scan_files),
+        Phase("scan", scan, depends_on=("files",)),
+        Phase("features", feature_scenarios),
+        Phase("steps", lambda _: _check_step_definitions(spec_dir, project_root)),
+    ]
     try:
-        content = read_file_content(tasks_file)
+        results = run_phases(phases, timings=phase_timings)
     except FileReadError as e:
         return ValidationResult(
             is_valid=False,
@@ -209,26 +370,42 @@ def validate_build(spec_dir: Path) -> ValidationResult:
                 )
             ],
         )
-
-    task_blocks = parse_task_blocks(content)
-    warnings.extend(_validate_task_completion_warnings(task_blocks))
-    errors.extend(_validate_task_completion(task_blocks, content))
-
-    # Determine project root: spec_dir is typically specs/xxx, so root is two levels up
-    project_root = spec_dir.parent.parent if spec_dir.parent.name == "specs" else spec_dir.parent
-    errors.extend(_validate_codebase_scan(root_dir=project_root))
-
-    errors.extend(_validate_feature_scenarios(spec_dir))
-
-    return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
-
-
-def validate_task(root_dir: Path | str = ".") -> ValidationResult:
+    return merge_results([results[name] for name in ("tasks", "scan", "features", "steps")])
+
+
+@traced("validate_task")
+def validate_task(
+    root_dir: Path | str = ".",
+    scan_cache: ScanCache | None = None,
+    modified_files: set[Path] | None = None,
+    scan_stats: ScanStats | None = None,
+    on_error: Callable[[ValidationError], None] | None = None,
+    baseline: Baseline | None = None,
+    blobs: GitBlobs | None = None,
+) -> ValidationResult:
     """Subagent self-check before signaling READY_FOR_EVAL.
 
     Returns a pure ValidationResult without side effects.
+    Long-lived callers may pass a ``scan_cache`` to skip re-scanning unchanged files,
+    and ``modified_files`` when they already queried git for them.
+    Pass ``scan_stats`` to record per-pattern and per-file scan costs.
+    With ``on_error``, errors are passed to it as they are found and the
+    returned result carries only the outcome. Issues recorded in
+    ``baseline`` are not reported. With ``blobs``, the files changed by that
+    git revision (or staged in the index) are scanned as stored there.
     """
-    scan_result = _run_codebase_scan(git_only=True, root_dir=root_dir)
+    scanner = _codebase_scanner(
+        git_only=True,
+        root_dir=root_dir,
+        scan_cache=scan_cache,
+        target_files=modified_files,
+        scan_stats=scan_stats,
+        baseline=baseline,
+        blobs=blobs,
+    )
+    if on_error is not None:
+        return ValidationResult(is_valid=not _stream_scan_errors(scanner.iter_issues(), on_error))
+    scan_result = scanner.scan()
     if not scan_result.has_issues:
         return ValidationResult(is_valid=True)
 
@@ -0,0 +1,80 @@
+"""Immutable contract configuration loaded from ``contract_sections.toml``."""
+
+from __future__ import annotations
+
+import hashlib
+import pkgutil
+import threading
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pb_spec.exceptions import ContractConfigError
+
+DEFAULT_CONTRACT_CONFIG_PATH = Path(__file__).parent / "contract_sections.toml"
+
+
+@dataclass(frozen=True)
+class ContractConfig:
+    """Required design sections, task fields and packet sections for one contract."""
+
+    design_required_sections: tuple[str, ...]
+    design_optional_sections: tuple[str, ...]
+    task_required_fields: tuple[str, ...]
+    build_blocked_required_fields: frozenset[str]
+    dcr_required_fields: frozenset[str]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ContractConfig:
+        """Build a config from parsed TOML.
+
+        Raises:
+            KeyError: If a required table or key is missing.
+        """
+        return cls(
+            design_required_sections=tuple(data["design"]["required_sections"]),
+            design_optional_sections=tuple(data["design"]["optional_sections"]),
+            task_required_fields=tuple(data["tasks"]["required_fields"]),
+            build_blocked_required_fields=frozenset(data["build_blocked"]["required_fields"]),
+            dcr_required_fields=frozenset(data["dcr"]["required_fields"]),
+        )
+
+
+_cache: dict[tuple[Path, str], ContractConfig] = {}
+_cache_lock = threading.Lock()
+
+
+def load_contract_config(config_path: Path | None = None) -> ContractConfig:
+    """Load a contract config, defaulting to the bundled ``contract_sections.toml``.
+
+    Results are memoised by resolved path and content hash, so repeat loads
+    only re-read the file and an edited file is parsed again. Safe to call
+    from several threads.
+
+    Raises:
+        ContractConfigError: If the file cannot be read or is not a valid config.
+    """
+    path = (config_path or DEFAULT_CONTRACT_CONFIG_PATH).resolve()
+    try:
+        if config_path is None:
+            # Read through the package loader so the default also works from a zipapp.
+            data = pkgutil.get_data(__package__ or "", DEFAULT_CONTRACT_CONFIG_PATH.name) or b""
+        else:
+            data = path.read_bytes()
+    except OSError as e:
+        raise ContractConfigError(f"Cannot read contract config {path}: {e}") from e
+    key = (path, hashlib.sha256(data).hexdigest())
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        config = ContractConfig.from_dict(tomllib.loads(data.decode("utf-8")))
+    except (UnicodeDecodeError, tomllib.TOMLDecodeError) as e:
+        raise ContractConfigError(f"Invalid contract config {path}: {e}") from e
+    except (KeyError, TypeError) as e:
+        raise ContractConfigError(f"Invalid contract config {path}: missing {e}") from e
+    with _cache_lock:
+        return _cache.setdefault(key, config)
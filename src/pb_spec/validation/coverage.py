@@ -0,0 +1,125 @@
+"""Scenario Coverage cross-reference engine for tasks.md and features/*.feature.
+
+Each task's ``Scenario Coverage:`` tags are resolved through the catalog's tag
+index and folded into a bitset row (one bit per scenario). Dangling references,
+uncovered scenarios and per-task coverage all fall out of a single linear pass.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+from pb_spec.validation.gherkin import Scenario, ScenarioCatalog
+from pb_spec.validation.parser import TaskBlock
+
+SCENARIO_COVERAGE_FIELD = "Scenario Coverage:"
+
+_SCENARIO_TAG_RE = re.compile(r"(?<![\w@])@\w(?:[\w.:-]*\w)?")
+
+
+@dataclass(frozen=True)
+class DanglingReference:
+    """A ``Scenario Coverage:`` tag that matches no scenario."""
+
+    task_id: str
+    tag: str
+
+
+@dataclass
+class CoverageReport:
+    """Task × scenario coverage matrix stored as one integer bitset per task."""
+
+    scenarios: list[Scenario]
+    task_ids: list[str] = field(default_factory=list)
+    task_bits: dict[str, int] = field(default_factory=dict)
+    task_references: dict[str, list[str]] = field(default_factory=dict)
+    dangling: list[DanglingReference] = field(default_factory=list)
+    covered_bits: int = 0
+
+    def covered_by(self, task_id: str) -> list[Scenario]:
+        """Return the scenarios covered by ``task_id``."""
+        return [self.scenarios[i] for i in _iter_bits(self.task_bits.get(task_id, 0))]
+
+    def uncovered_positions(self) -> list[int]:
+        """Return catalog positions of scenarios not covered by any task."""
+        uncovered = ~self.covered_bits & ((1 << len(self.scenarios)) - 1)
+        return _iter_bits(uncovered)
+
+    @property
+    def uncovered(self) -> list[Scenario]:
+        """Return scenarios not covered by any task."""
+        return [self.scenarios[i] for i in self.uncovered_positions()]
+
+    def summary(self) -> dict[str, int]:
+        """Return task, scenario, covered and dangling counts."""
+        return {
+            "tasks": len(self.task_ids),
+            "scenarios": len(self.scenarios),
+            "covered": self.covered_bits.bit_count(),
+            "dangling": len(self.dangling),
+        }
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serialisable view of the matrix."""
+        return {
+            "scenarios": [
+                {
+                    "index": i,
+                    "name": s.name,
+                    "file": s.file_path,
+                    "line": s.line_number,
+                    "tags": list(s.tags),
+                }
+                for i, s in enumerate(self.scenarios)
+            ],
+            "tasks": [
+                {
+                    "id": task_id,
+                    "references": self.task_references[task_id],
+                    "covered": _iter_bits(self.task_bits[task_id]),
+                }
+                for task_id in self.task_ids
+            ],
+            "dangling": [{"task": d.task_id, "tag": d.tag} for d in self.dangling],
+            "uncovered": self.uncovered_positions(),
+            "summary": self.summary(),
+        }
+
+
+def _iter_bits(bits: int) -> list[int]:
+    """Return the positions of set bits in ascending order."""
+    return [i for i, bit in enumerate(reversed(f"{bits:b}")) if bit == "1"] if bits else []
+
+
+def extract_scenario_tags(coverage_value: str) -> list[str]:
+    """Return the ``@scenario-id`` tags named in a Scenario Coverage value, in order."""
+    return list(dict.fromkeys(_SCENARIO_TAG_RE.findall(coverage_value)))
+
+
+def compute_coverage(task_blocks: list[TaskBlock], catalog: ScenarioCatalog) -> CoverageReport:
+    """Resolve every task's Scenario Coverage tags against the catalog."""
+    report = CoverageReport(scenarios=catalog.scenarios)
+    tag_bits: dict[str, int] = {}
+
+    for task_block in task_blocks:
+        references = extract_scenario_tags(task_block.fields.get(SCENARIO_COVERAGE_FIELD, ""))
+        bits = 0
+        for tag in references:
+            mask = tag_bits.get(tag)
+            if mask is None:
+                mask = 0
+                for position in catalog.by_tag.get(tag, ()):
+                    mask |= 1 << position
+                tag_bits[tag] = mask
+            if not mask:
+                report.dangling.append(DanglingReference(task_id=task_block.id, tag=tag))
+            bits |= mask
+
+        if task_block.id not in report.task_bits:
+            report.task_ids.append(task_block.id)
+        report.task_bits[task_block.id] = report.task_bits.get(task_block.id, 0) | bits
+        report.task_references.setdefault(task_block.id, []).extend(references)
+        report.covered_bits |= bits
+
+    return report
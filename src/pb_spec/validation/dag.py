@@ -0,0 +1,138 @@
+"""DependsOn task graph: dependency resolution, cycle detection and wave scheduling."""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass, field
+
+from pb_spec.validation.parser import TaskBlock
+
+DEPENDS_ON_FIELD = "DependsOn:"
+TASK_ID_FIELD = "TaskID:"
+
+_NO_DEPENDENCY_TOKENS = frozenset({"none", "n/a", "-", "—"})
+_DEPENDENCY_SPLIT_RE = re.compile(r"[,;\s]+")
+_FILLER_TOKENS = frozenset({"task", "tasks", "and"})
+
+
+@dataclass(frozen=True)
+class DanglingDependency:
+    """A DependsOn entry that names no task in tasks.md."""
+
+    task_id: str
+    reference: str
+
+
+@dataclass
+class TaskGraph:
+    """Tasks in file order with their resolved prerequisites."""
+
+    task_ids: list[str] = field(default_factory=list)
+    dependencies: dict[str, list[str]] = field(default_factory=dict)
+    dangling: list[DanglingDependency] = field(default_factory=list)
+
+    def dependents(self) -> dict[str, list[str]]:
+        """Return the reverse adjacency: tasks that list each task as a prerequisite."""
+        dependents: dict[str, list[str]] = {task_id: [] for task_id in self.task_ids}
+        for task_id in self.task_ids:
+            for prerequisite in self.dependencies[task_id]:
+                dependents[prerequisite].append(task_id)
+        return dependents
+
+
+@dataclass(frozen=True)
+class WaveSchedule:
+    """Topological levels of a task graph.
+
+    ``waves[n]`` holds tasks whose prerequisites all sit in earlier waves.
+    Tasks on a dependency cycle, or downstream of one, never become ready and are
+    listed in ``cyclic``.
+    """
+
+    waves: list[list[str]]
+    cyclic: list[str]
+    critical_path: list[str]
+
+    @property
+    def max_parallelism(self) -> int:
+        """Return the size of the widest wave."""
+        return max((len(w) for w in self.waves), default=0)
+
+
+def parse_dependency_references(value: str) -> list[str]:
+    """Split a DependsOn value into raw task references ("1.1", "T1", ...)."""
+    tokens = [t.strip("`*()[].") for t in _DEPENDENCY_SPLIT_RE.split(value.strip())]
+    references = [t for t in tokens if t and t.lower() not in _FILLER_TOKENS]
+    if all(t.lower() in _NO_DEPENDENCY_TOKENS for t in references):
+        return []
+    return list(dict.fromkeys(references))
+
+
+def build_task_graph(task_blocks: list[TaskBlock]) -> TaskGraph:
+    """Resolve DependsOn references by task ID or TaskID alias."""
+    graph = TaskGraph()
+    aliases: dict[str, str] = {}
+    for task_block in task_blocks:
+        if task_block.id in graph.dependencies:
+            continue
+        graph.task_ids.append(task_block.id)
+        graph.dependencies[task_block.id] = []
+        alias = task_block.fields.get(TASK_ID_FIELD, "").strip().strip("`")
+        if alias:
+            aliases.setdefault(alias, task_block.id)
+
+    seen: set[str] = set()
+    for task_block in task_blocks:
+        if task_block.id in seen:
+            continue
+        seen.add(task_block.id)
+        resolved = graph.dependencies[task_block.id]
+        for reference in parse_dependency_references(task_block.fields.get(DEPENDS_ON_FIELD, "")):
+            target = reference if reference in graph.dependencies else aliases.get(reference)
+            if target is None:
+                graph.dangling.append(DanglingDependency(task_block.id, reference))
+            elif target not in resolved:
+                resolved.append(target)
+
+    return graph
+
+
+def compute_waves(graph: TaskGraph) -> WaveSchedule:
+    """Compute topological waves and the critical path with Kahn's algorithm in O(V + E)."""
+    dependents = graph.dependents()
+    remaining = {task_id: len(graph.dependencies[task_id]) for task_id in graph.task_ids}
+
+    level: dict[str, int] = {}
+    longest_via: dict[str, str | None] = {}
+    ready = deque(task_id for task_id in graph.task_ids if remaining[task_id] == 0)
+    for task_id in ready:
+        level[task_id] = 0
+        longest_via[task_id] = None
+
+    waves: list[list[str]] = []
+    while ready:
+        task_id = ready.popleft()
+        task_level = level[task_id]
+        if task_level == len(waves):
+            waves.append([])
+        waves[task_level].append(task_id)
+        for dependent in dependents[task_id]:
+            if task_level + 1 > level.get(dependent, -1):
+                level[dependent] = task_level + 1
+                longest_via[dependent] = task_id
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+
+    cyclic = [task_id for task_id in graph.task_ids if remaining[task_id] > 0]
+
+    critical_path: list[str] = []
+    if waves:
+        current: str | None = waves[-1][0]
+        while current is not None:
+            critical_path.append(current)
+            current = longest_via[current]
+        critical_path.reverse()
+
+    return WaveSchedule(waves=waves, cyclic=cyclic, critical_path=critical_path)
@@ -0,0 +1,238 @@
+"""Streaming Gherkin lexer and hash-indexed scenario catalog for features/."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from enum import Enum
+from pathlib import Path
+
+from pb_spec.exceptions import FileReadError
+
+# Files are parsed on a thread pool once there are at least this many of them.
+PARALLEL_FILE_THRESHOLD = 16
+
+
+class TokenKind(Enum):
+    """Structural Gherkin elements recognised by the lexer."""
+
+    FEATURE = "feature"
+    RULE = "rule"
+    BACKGROUND = "background"
+    SCENARIO = "scenario"
+    SCENARIO_OUTLINE = "scenario_outline"
+    EXAMPLES = "examples"
+    TAGS = "tags"
+    STEP = "step"
+    TABLE_ROW = "table_row"
+
+
+_KEYWORDS: tuple[tuple[str, TokenKind], ...] = (
+    ("Feature:", TokenKind.FEATURE),
+    ("Business Need:", TokenKind.FEATURE),
+    ("Ability:", TokenKind.FEATURE),
+    ("Rule:", TokenKind.RULE),
+    ("Background:", TokenKind.BACKGROUND),
+    ("Scenario Outline:", TokenKind.SCENARIO_OUTLINE),
+    ("Scenario Template:", TokenKind.SCENARIO_OUTLINE),
+    ("Scenario:", TokenKind.SCENARIO),
+    ("Example:", TokenKind.SCENARIO),
+    ("Examples:", TokenKind.EXAMPLES),
+    ("Scenarios:", TokenKind.EXAMPLES),
+)
+
+SCENARIO_KINDS = frozenset({TokenKind.SCENARIO, TokenKind.SCENARIO_OUTLINE})
+
+STEP_KEYWORDS = ("Given", "When", "Then", "And", "But", "*")
+
+_DOCSTRING_DELIMITERS = ('"""', "```")
+
+
+@dataclass(frozen=True)
+class GherkinToken:
+    """A single lexed Gherkin element."""
+
+    kind: TokenKind
+    line_number: int
+    text: str = ""
+    tags: tuple[str, ...] = ()
+    keyword: str = ""
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A scenario or scenario outline entry in the catalog."""
+
+    name: str
+    file_path: str
+    line_number: int
+    feature: str
+    is_outline: bool = False
+    rule: str | None = None
+    tags: tuple[str, ...] = ()
+
+
+@dataclass
+class ScenarioCatalog:
+    """Scenarios from a set of .feature files, indexed by tag and by name."""
+
+    scenarios: list[Scenario] = field(default_factory=list)
+    scenario_counts: dict[str, int] = field(default_factory=dict)
+    by_tag: dict[str, list[int]] = field(default_factory=dict)
+    by_name: dict[str, list[int]] = field(default_factory=dict)
+
+    def add(self, scenario: Scenario) -> None:
+        """Append a scenario and index it by its own tags and name."""
+        position = len(self.scenarios)
+        self.scenarios.append(scenario)
+        for tag in scenario.tags:
+            self.by_tag.setdefault(tag, []).append(position)
+        self.by_name.setdefault(scenario.name, []).append(position)
+
+    def find_by_tag(self, tag: str) -> list[Scenario]:
+        """Return scenarios tagged with ``tag`` (with or without the leading '@')."""
+        key = tag if tag.startswith("@") else f"@{tag}"
+        return [self.scenarios[i] for i in self.by_tag.get(key, [])]
+
+    def find_by_name(self, name: str) -> list[Scenario]:
+        """Return scenarios whose name matches exactly."""
+        return [self.scenarios[i] for i in self.by_name.get(name, [])]
+
+
+def _step_keyword(line: str) -> str | None:
+    keyword, _, rest = line.partition(" ")
+    return keyword if keyword in STEP_KEYWORDS and rest.strip() else None
+
+
+def iter_gherkin_tokens(lines: Iterable[str], steps: bool = False) -> Iterator[GherkinToken]:
+    """Lex Gherkin lines lazily, skipping comments and doc strings.
+
+    Step lines and table rows are only emitted when ``steps`` is true, so
+    structural scans do not pay for them.
+    """
+    docstring_delimiter: str | None = None
+
+    for line_number, raw_line in enumerate(lines, start=1):
+        line = raw_line.strip()
+        if docstring_delimiter is not None:
+            if line.startswith(docstring_delimiter):
+                docstring_delimiter = None
+            continue
+        if not line or line[0] == "#":
+            continue
+        if line[0] == "|":
+            if steps:
+                yield GherkinToken(TokenKind.TABLE_ROW, line_number, text=line)
+            continue
+        if line.startswith(_DOCSTRING_DELIMITERS):
+            docstring_delimiter = line[:3]
+            continue
+        if line[0] == "@":
+            tags = tuple(t for t in line.split("#", 1)[0].split() if t.startswith("@"))
+            yield GherkinToken(TokenKind.TAGS, line_number, tags=tags)
+            continue
+        for keyword, kind in _KEYWORDS:
+            if line.startswith(keyword):
+                yield GherkinToken(kind, line_number, text=line[len(keyword) :].strip())
+                break
+        else:
+            if steps and (step_keyword := _step_keyword(line)) is not None:
+                text = line[len(step_keyword) :].strip()
+                yield GherkinToken(TokenKind.STEP, line_number, text=text, keyword=step_keyword)
+
+
+def iter_file_lines(path: Path) -> Iterator[str]:
+    """Yield the lines of a UTF-8 file, raising FileReadError on failure."""
+    try:
+        with path.open(encoding="utf-8") as f:
+            yield from f
+    except (OSError, UnicodeDecodeError) as e:
+        raise FileReadError(f"Cannot read file {path}: {e}") from e
+
+
+def has_scenario(path: Path) -> bool:
+    """Return True as soon as a real Scenario heading is seen in ``path``.
+
+    Raises:
+        FileReadError: If the file cannot be read.
+    """
+    return any(token.kind in SCENARIO_KINDS for token in iter_gherkin_tokens(iter_file_lines(path)))
+
+
+def parse_feature_scenarios(tokens: Iterable[GherkinToken], file_path: str) -> list[Scenario]:
+    """Fold a token stream into scenarios, attaching pending and Examples tags."""
+    scenarios: list[Scenario] = []
+    feature = ""
+    rule: str | None = None
+    pending_tags: tuple[str, ...] = ()
+
+    for token in tokens:
+        match token.kind:
+            case TokenKind.TAGS:
+                pending_tags += token.tags
+                continue
+            case TokenKind.FEATURE:
+                feature = token.text
+            case TokenKind.RULE:
+                rule = token.text
+            case TokenKind.SCENARIO | TokenKind.SCENARIO_OUTLINE:
+                scenarios.append(
+                    Scenario(
+                        name=token.text,
+                        file_path=file_path,
+                        line_number=token.line_number,
+                        feature=feature,
+                        is_outline=token.kind is TokenKind.SCENARIO_OUTLINE,
+                        rule=rule,
+                        tags=pending_tags,
+                    )
+                )
+            case TokenKind.EXAMPLES if scenarios and pending_tags:
+                last = scenarios[-1]
+                new_tags = tuple(t for t in pending_tags if t not in last.tags)
+                scenarios[-1] = replace(last, tags=last.tags + new_tags)
+        pending_tags = ()
+
+    return scenarios
+
+
+def _parse_feature_file(path: Path) -> list[Scenario]:
+    return parse_feature_scenarios(iter_gherkin_tokens(iter_file_lines(path)), str(path))
+
+
+def map_files[T](func: Callable[[Path], T], paths: list[Path]) -> list[T]:
+    """Apply ``func`` to every path, on a thread pool when there are many files."""
+    if len(paths) < PARALLEL_FILE_THRESHOLD:
+        return [func(path) for path in paths]
+    with ThreadPoolExecutor() as pool:
+        return list(pool.map(func, paths))
+
+
+def build_scenario_catalog(feature_files: Iterable[Path]) -> ScenarioCatalog:
+    """Parse feature files into a catalog; unreadable files raise FileReadError."""
+    paths = sorted(feature_files)
+    catalog = ScenarioCatalog()
+    for path, scenarios in zip(paths, map_files(_parse_feature_file, paths), strict=True):
+        catalog.scenario_counts[str(path)] = len(scenarios)
+        for scenario in scenarios:
+            catalog.add(scenario)
+    return catalog
+
+
+def find_files_without_scenarios(
+    feature_files: Iterable[Path],
+) -> list[tuple[Path, FileReadError | None]]:
+    """Return files with no Scenario heading, paired with the read error if any.
+
+    Each file is read only up to its first Scenario heading.
+    """
+
+    def check(path: Path) -> tuple[Path, FileReadError | None] | None:
+        try:
+            return None if has_scenario(path) else (path, None)
+        except FileReadError as e:
+            return (path, e)
+
+    paths = sorted(feature_files)
+    return [outcome for outcome in map_files(check, paths) if outcome is not None]
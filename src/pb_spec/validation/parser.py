@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import bisect
 import re
 from dataclasses import dataclass
 
+from pb_spec.profiling import traced
+
 TASK_HEADING_RE = re.compile(r"^(#{2,3})\s+Task\s+(\d+\.\d+):\s*(.*)$", re.MULTILINE)
 TASK_CHECKBOX_RE = re.compile(r"^[ \t]*- \[[ xX]\].*", re.MULTILINE)
 UNCHECKED_TASK_CHECKBOX_RE = re.compile(r"^[ \t]*- \[ \].*", re.MULTILINE)
@@ -29,17 +32,15 @@ BUILD_BLOCKED_REQUIRED_SECTIONS = frozenset({"Reason", "Requested Change", "Impa
 DCR_REQUIRED_SECTIONS = frozenset({"Reason", "Requested Change", "Impact"})
 CONTRACT_SECTION_NAMES = BUILD_BLOCKED_REQUIRED_SECTIONS | DCR_REQUIRED_SECTIONS
 
-_CONTRACT_REQUIRED_SECTIONS: dict[str, frozenset[str]] = {
-    "🛑 Build Blocked": BUILD_BLOCKED_REQUIRED_SECTIONS,
-    "🔄 Design Change Request": DCR_REQUIRED_SECTIONS,
-}
-
 KNOWN_TASK_FIELDS = frozenset(
     {
         "Context:",
         "Verification:",
         "Status:",
         "Scenario Coverage:",
+        "TaskID:",
+        "DependsOn:",
+        "Complexity:",
     }
 )
 
@@ -74,6 +75,7 @@ def _is_continuation_line(line: str) -> bool:
     return not FIELD_RE.match(line)
 
 
+@traced("parse_task_blocks")
 def parse_task_blocks(content: str) -> list[TaskBlock]:
     """Parse markdown content and extract task blocks."""
     lines = content.split("\n")
@@ -131,12 +133,9 @@ def parse_task_blocks(content: str) -> list[TaskBlock]:
                 current_field = candidate_name
                 current_field_content = [field_value] if field_value else []
                 task_fields[current_field] = field_value
-            elif _is_continuation_line(line) and current_field:
-                current_field_content.append(line)
-                task_fields[current_field] = "\n".join(current_field_content).strip()
         elif _is_continuation_line(line) and current_field:
+            # Joined once by _flush_field; re-joining per line is quadratic in field length.
             current_field_content.append(line)
-            task_fields[current_field] = "\n".join(current_field_content).strip()
 
     _flush_field()
     _flush_task()
@@ -173,9 +172,15 @@ def parse_contract_sections(block_body: str) -> dict[str, str]:
     return {name: "\n".join(lines).strip() for name, lines in sections.items()}
 
 
+@traced("parse_contract_blocks")
 def parse_contract_blocks(content: str) -> list[ContractBlock]:
     """Parse markdown-carried DCR and build-blocked packets from tasks.md."""
     matches = list(CONTRACT_BLOCK_HEADER_RE.finditer(content))
+    if not matches:
+        return []
+    # One pass over the task headings; searching from every packet header rescans
+    # the whole tail of the file when packets follow the last task.
+    task_starts = [heading.start() for heading in TASK_HEADING_RE.finditer(content)]
     blocks: list[ContractBlock] = []
 
     for index, match in enumerate(matches):
@@ -185,9 +190,9 @@ def parse_contract_blocks(content: str) -> list[ContractBlock]:
         if index + 1 < len(matches):
             end_candidates.append(matches[index + 1].start())
 
-        next_task = TASK_HEADING_RE.search(content, match.end())
-        if next_task:
-            end_candidates.append(next_task.start())
+        next_task = bisect.bisect_left(task_starts, match.end())
+        if next_task < len(task_starts):
+            end_candidates.append(task_starts[next_task])
 
         block_body = content[match.end() : min(end_candidates)]
         blocks.append(
@@ -202,16 +207,24 @@ def parse_contract_blocks(content: str) -> list[ContractBlock]:
     return blocks
 
 
-def validate_contract_blocks(content: str) -> list[str]:
+def validate_contract_blocks(
+    content: str,
+    build_blocked_required: frozenset[str] = BUILD_BLOCKED_REQUIRED_SECTIONS,
+    dcr_required: frozenset[str] = DCR_REQUIRED_SECTIONS,
+) -> list[str]:
     """Validate required sections for markdown workflow contract blocks.
 
-    Both Build Blocked and DCR packets require the same three sections:
-    Reason, Requested Change, Impact.
+    By default both Build Blocked and DCR packets require the same three
+    sections: Reason, Requested Change, Impact.
     """
     errors: list[str] = []
+    required_by_kind = {
+        "🛑 Build Blocked": build_blocked_required,
+        "🔄 Design Change Request": dcr_required,
+    }
 
     for block in parse_contract_blocks(content):
-        required = _CONTRACT_REQUIRED_SECTIONS.get(block.kind, DCR_REQUIRED_SECTIONS)
+        required = required_by_kind.get(block.kind, dcr_required)
         missing_sections = [
             section for section in required if not block.sections.get(section, "").strip()
         ]
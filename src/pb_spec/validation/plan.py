@@ -3,63 +3,38 @@
 from __future__ import annotations
 
 import re
-import tomllib
 from pathlib import Path
 
 from pb_spec.exceptions import FileReadError
+from pb_spec.profiling import traced
+from pb_spec.validation.contract_config import ContractConfig, load_contract_config
+from pb_spec.validation.coverage import SCENARIO_COVERAGE_FIELD, CoverageReport, compute_coverage
+from pb_spec.validation.dag import DEPENDS_ON_FIELD, build_task_graph, compute_waves
+from pb_spec.validation.gherkin import build_scenario_catalog
 from pb_spec.validation.io import read_file_content
 from pb_spec.validation.parser import (
     ALLOWED_TASK_STATUSES,
     TASK_CHECKBOX_RE,
+    TaskBlock,
     parse_task_blocks,
     task_display_name,
     validate_contract_blocks,
 )
+from pb_spec.validation.pipeline import Phase, merge_results, run_phases
 from pb_spec.validation.result import (
     ErrorSeverity,
     ValidationError,
     ValidationResult,
 )
 
-_DEFAULT_CONTRACT_CONFIG_PATH = Path(__file__).parent / "contract_sections.toml"
-
 _HEADING_RE = re.compile(r"^##\s+(.+)$", re.MULTILINE)
 
-_DESIGN_REQUIRED_SECTIONS: list[str] = []
-_DESIGN_OPTIONAL_SECTIONS: list[str] = []
-_TASK_REQUIRED_FIELDS: list[str] = []
-_BUILD_BLOCKED_REQUIRED_FIELDS: frozenset[str] = frozenset()
-_DCR_REQUIRED_FIELDS: frozenset[str] = frozenset()
-
-
-def _load_config(config_path: Path | None = None) -> None:
-    """Load contract configuration from TOML file into module globals."""
-    global _DESIGN_REQUIRED_SECTIONS, _DESIGN_OPTIONAL_SECTIONS
-    global _TASK_REQUIRED_FIELDS
-    global _BUILD_BLOCKED_REQUIRED_FIELDS, _DCR_REQUIRED_FIELDS
-
-    path = config_path or _DEFAULT_CONTRACT_CONFIG_PATH
-    with path.open("rb") as f:
-        config = tomllib.load(f)
-
-    _DESIGN_REQUIRED_SECTIONS = list(config["design"]["required_sections"])
-    _DESIGN_OPTIONAL_SECTIONS = list(config["design"]["optional_sections"])
-    _TASK_REQUIRED_FIELDS = list(config["tasks"]["required_fields"])
-    _BUILD_BLOCKED_REQUIRED_FIELDS = frozenset(config["build_blocked"]["required_fields"])
-    _DCR_REQUIRED_FIELDS = frozenset(config["dcr"]["required_fields"])
-
-
-# Eager load at import time; module path is static.
-_load_config()
 
-
-def load_contract_config(config_path: Path | None = None) -> None:
-    """Reload contract configuration (used by CLI --config override)."""
-    _load_config(config_path)
-
-
-def validate_design_structure(spec_dir: Path) -> ValidationResult:
-    """Validate design.md contains all required sections."""
+def validate_design_structure(
+    spec_dir: Path, config: ContractConfig | None = None
+) -> ValidationResult:
+    """Validate design.md contains all required sections (default contract if no config)."""
+    config = config or load_contract_config()
     errors: list[ValidationError] = []
     warnings: list[str] = []
     design_file = spec_dir / "design.md"
@@ -91,7 +66,7 @@ def validate_design_structure(spec_dir: Path) -> ValidationResult:
 
     headings = {m.group(1).strip() for m in _HEADING_RE.finditer(content)}
 
-    for sec in _DESIGN_REQUIRED_SECTIONS:
+    for sec in config.design_required_sections:
         if sec not in headings:
             errors.append(
                 ValidationError(
@@ -107,8 +82,43 @@ def validate_design_structure(spec_dir: Path) -> ValidationResult:
     return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
 
 
-def validate_tasks_structure(spec_dir: Path) -> ValidationResult:
-    """Validate tasks.md structure and required fields."""
+def _validate_task_dependencies(task_blocks: list[TaskBlock]) -> list[ValidationError]:
+    """Validate that DependsOn references resolve and form an acyclic graph."""
+    errors: list[ValidationError] = []
+    graph = build_task_graph(task_blocks)
+
+    for dangling in graph.dangling:
+        errors.append(
+            ValidationError(
+                message=(f"Task {dangling.task_id} depends on unknown task '{dangling.reference}'"),
+                file_path="tasks.md",
+                field_name=DEPENDS_ON_FIELD,
+                severity=ErrorSeverity.HIGH,
+            )
+        )
+
+    schedule = compute_waves(graph)
+    if schedule.cyclic:
+        errors.append(
+            ValidationError(
+                message=(
+                    "DependsOn cycle detected; these tasks can never become ready: "
+                    + ", ".join(f"Task {task_id}" for task_id in schedule.cyclic)
+                ),
+                file_path="tasks.md",
+                field_name=DEPENDS_ON_FIELD,
+                severity=ErrorSeverity.HIGH,
+            )
+        )
+
+    return errors
+
+
+def validate_tasks_structure(
+    spec_dir: Path, config: ContractConfig | None = None
+) -> ValidationResult:
+    """Validate tasks.md structure and required fields (default contract if no config)."""
+    config = config or load_contract_config()
     errors: list[ValidationError] = []
     warnings: list[str] = []
     tasks_file = spec_dir / "tasks.md"
@@ -155,7 +165,11 @@ def validate_tasks_structure(spec_dir: Path) -> ValidationResult:
             ],
         )
 
-    contract_errors = validate_contract_blocks(content)
+    contract_errors = validate_contract_blocks(
+        content,
+        build_blocked_required=config.build_blocked_required_fields,
+        dcr_required=config.dcr_required_fields,
+    )
     for msg in contract_errors:
         errors.append(ValidationError(message=msg, file_path="tasks.md"))
 
@@ -174,7 +188,7 @@ def validate_tasks_structure(spec_dir: Path) -> ValidationResult:
             )
         seen_task_ids.add(task_block.id)
 
-        for required_field in _TASK_REQUIRED_FIELDS:
+        for required_field in config.task_required_fields:
             if required_field not in task_block.fields:
                 errors.append(
                     ValidationError(
@@ -216,6 +230,8 @@ def validate_tasks_structure(spec_dir: Path) -> ValidationResult:
                 )
             )
 
+    errors.extend(_validate_task_dependencies(task_blocks))
+
     if not errors:
         warnings.append("tasks.md structural checks passed.")
 
@@ -227,7 +243,7 @@ def validate_features_directory(spec_dir: Path) -> ValidationResult:
     errors: list[ValidationError] = []
     warnings: list[str] = []
     features_dir = spec_dir / "features"
-    has_features = features_dir.exists() and list(features_dir.glob("*.feature"))
+    has_features = features_dir.is_dir() and next(features_dir.glob("*.feature"), None)
 
     if not has_features:
         errors.append(
@@ -243,14 +259,72 @@ def validate_features_directory(spec_dir: Path) -> ValidationResult:
     return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
 
 
-def validate_plan(spec_dir: Path) -> ValidationResult:
-    """Validate pb-plan generated documents.
+def compute_spec_coverage(spec_dir: Path) -> CoverageReport:
+    """Build the Scenario Coverage matrix for a spec directory.
 
-    Returns a ValidationResult; callers are responsible for presenting results.
+    Raises:
+        FileReadError: If tasks.md or a feature file cannot be read.
     """
+    task_blocks = parse_task_blocks(read_file_content(spec_dir / "tasks.md"))
+    features_dir = spec_dir / "features"
+    feature_files = features_dir.glob("*.feature") if features_dir.is_dir() else []
+    return compute_coverage(task_blocks, build_scenario_catalog(feature_files))
+
+
+def validate_scenario_coverage(spec_dir: Path) -> ValidationResult:
+    """Validate that Scenario Coverage tags resolve to tagged scenarios in features/."""
     errors: list[ValidationError] = []
     warnings: list[str] = []
+    try:
+        report = compute_spec_coverage(spec_dir)
+    except FileReadError as e:
+        return ValidationResult(
+            is_valid=False,
+            errors=[ValidationError(message=str(e), severity=ErrorSeverity.CRITICAL)],
+        )
+
+    for dangling in report.dangling:
+        errors.append(
+            ValidationError(
+                message=(
+                    f"Task {dangling.task_id} references unknown scenario {dangling.tag} "
+                    "in Scenario Coverage (no scenario in features/ carries this tag)"
+                ),
+                file_path="tasks.md",
+                field_name=SCENARIO_COVERAGE_FIELD,
+                severity=ErrorSeverity.HIGH,
+            )
+        )
+
+    untagged = 0
+    for scenario in report.uncovered:
+        if not scenario.tags:
+            untagged += 1
+            continue
+        warnings.append(
+            f"Scenario '{scenario.name}' ({scenario.file_path}:{scenario.line_number}) "
+            "is not covered by any task."
+        )
+    if untagged:
+        warnings.append(
+            f"{untagged} scenario(s) have no tags and cannot be referenced by Scenario Coverage."
+        )
+
+    return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
+
 
+@traced("validate_plan")
+def validate_plan(
+    spec_dir: Path,
+    config: ContractConfig | None = None,
+    phase_timings: dict[str, float] | None = None,
+) -> ValidationResult:
+    """Validate pb-plan generated documents against ``config`` (default contract if None).
+
+    The structure, features and coverage checks run concurrently and are merged
+    in that order. Returns a ValidationResult; callers are responsible for
+    presenting results. Pass ``phase_timings`` to collect each phase's wall time.
+    """
     # Check required files exist
     for f in [spec_dir / "design.md", spec_dir / "tasks.md"]:
         if not f.exists():
@@ -265,16 +339,12 @@ def validate_plan(spec_dir: Path) -> ValidationResult:
                 ],
             )
 
-    design_result = validate_design_structure(spec_dir)
-    errors.extend(design_result.errors)
-    warnings.extend(design_result.warnings)
-
-    tasks_result = validate_tasks_structure(spec_dir)
-    errors.extend(tasks_result.errors)
-    warnings.extend(tasks_result.warnings)
-
-    features_result = validate_features_directory(spec_dir)
-    errors.extend(features_result.errors)
-    warnings.extend(features_result.warnings)
-
-    return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
+    config = config or load_contract_config()
+    phases = [
+        Phase("design", lambda _: validate_design_structure(spec_dir, config)),
+        Phase("tasks", lambda _: validate_tasks_structure(spec_dir, config)),
+        Phase("features", lambda _: validate_features_directory(spec_dir)),
+        Phase("coverage", lambda _: validate_scenario_coverage(spec_dir)),
+    ]
+    results = run_phases(phases, timings=phase_timings)
+    return merge_results([results[phase.name] for phase in phases])
@@ -25,6 +25,27 @@ class ValidationError:
     line_number: int | None = None
     field_name: str | None = None
 
+    def to_dict(self) -> dict:
+        """Return a JSON-serialisable representation."""
+        return {
+            "message": self.message,
+            "severity": self.severity.value,
+            "file_path": self.file_path,
+            "line_number": self.line_number,
+            "field_name": self.field_name,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ValidationError:
+        """Rebuild an error from :meth:`to_dict` output."""
+        return cls(
+            message=data["message"],
+            severity=ErrorSeverity(data.get("severity", ErrorSeverity.MEDIUM.value)),
+            file_path=data.get("file_path"),
+            line_number=data.get("line_number"),
+            field_name=data.get("field_name"),
+        )
+
 
 @dataclass
 class ValidationResult:
@@ -33,3 +54,20 @@ class ValidationResult:
     is_valid: bool
     errors: list[ValidationError] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serialisable representation."""
+        return {
+            "is_valid": self.is_valid,
+            "errors": [error.to_dict() for error in self.errors],
+            "warnings": list(self.warnings),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ValidationResult:
+        """Rebuild a result from :meth:`to_dict` output."""
+        return cls(
+            is_valid=data["is_valid"],
+            errors=[ValidationError.from_dict(error) for error in data.get("errors", [])],
+            warnings=list(data.get("warnings", [])),
+        )
@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from pb_spec.config import RUMDL_CHECK_TIMEOUT, RUMDL_FORMAT_TIMEOUT
+from pb_spec.profiling import traced
 
 MAX_RUMDL_TIMEOUT = 120
 
@@ -21,6 +22,53 @@ class FormatResult:
     has_warnings: bool = False
 
 
+_RUMDL_MISSING = FormatResult(
+    success=True,
+    messages=[
+        "Command 'rumdl' not found — skipping markdown auto-format. "
+        "Install it with: cargo install rumdl  (or: pip install rumdl) "
+        "to enable automatic markdown formatting."
+    ],
+    has_warnings=True,
+)
+
+
+def _format_timeout(file_count: int) -> float:
+    return min(RUMDL_FORMAT_TIMEOUT * file_count, MAX_RUMDL_TIMEOUT)
+
+
+def _formatted(file_count: int) -> FormatResult:
+    return FormatResult(
+        success=True,
+        messages=[f"Formatted {file_count} file(s)"],
+        formatted_count=file_count,
+    )
+
+
+def _format_timed_out(file_count: int) -> FormatResult:
+    return FormatResult(
+        success=False,
+        messages=[f"rumdl timed out formatting {file_count} files"],
+        has_warnings=True,
+    )
+
+
+def _format_failed(stderr: str) -> FormatResult:
+    return FormatResult(
+        success=False,
+        messages=[f"rumdl failed: {stderr.strip()}"],
+        has_warnings=True,
+    )
+
+
+def _format_error(error: OSError) -> FormatResult:
+    return FormatResult(
+        success=False,
+        messages=[f"Unexpected error formatting files: {error}"],
+        has_warnings=True,
+    )
+
+
 def is_rumdl_available() -> bool:
     """Check if rumdl is available and working."""
     try:
@@ -32,6 +80,28 @@ def is_rumdl_available() -> bool:
         return False
 
 
+async def is_rumdl_available_async() -> bool:
+    """Check if rumdl is available without blocking the event loop."""
+    import asyncio  # deferred: asyncio is slow to import and the CLI never needs it
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "rumdl",
+            "--version",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        return False
+    try:
+        return await asyncio.wait_for(process.wait(), RUMDL_CHECK_TIMEOUT) == 0
+    except TimeoutError:
+        process.kill()
+        await process.wait()
+        return False
+
+
+@traced("run_rumdl_format")
 def run_rumdl_format(spec_dir: Path) -> FormatResult:
     """Format markdown files using rumdl.
 
@@ -44,15 +114,7 @@ def run_rumdl_format(spec_dir: Path) -> FormatResult:
         return FormatResult(success=True)
 
     if not is_rumdl_available():
-        return FormatResult(
-            success=True,
-            messages=[
-                "Command 'rumdl' not found — skipping markdown auto-format. "
-                "Install it with: cargo install rumdl  (or: pip install rumdl) "
-                "to enable automatic markdown formatting."
-            ],
-            has_warnings=True,
-        )
+        return _RUMDL_MISSING
 
     try:
         file_args = [str(f) for f in md_files]
@@ -60,29 +122,52 @@ def run_rumdl_format(spec_dir: Path) -> FormatResult:
             ["rumdl", "fmt", *file_args],
             capture_output=True,
             text=True,
-            timeout=min(RUMDL_FORMAT_TIMEOUT * len(md_files), MAX_RUMDL_TIMEOUT),
+            timeout=_format_timeout(len(md_files)),
             check=True,
         )
-        return FormatResult(
-            success=True,
-            messages=[f"Formatted {len(md_files)} file(s)"],
-            formatted_count=len(md_files),
-        )
+        return _formatted(len(md_files))
     except subprocess.TimeoutExpired:
-        return FormatResult(
-            success=False,
-            messages=[f"rumdl timed out formatting {len(md_files)} files"],
-            has_warnings=True,
-        )
+        return _format_timed_out(len(md_files))
     except subprocess.CalledProcessError as e:
-        return FormatResult(
-            success=False,
-            messages=[f"rumdl failed: {e.stderr.strip()}"],
-            has_warnings=True,
-        )
+        return _format_failed(e.stderr)
     except OSError as e:
-        return FormatResult(
-            success=False,
-            messages=[f"Unexpected error formatting files: {e}"],
-            has_warnings=True,
+        return _format_error(e)
+
+
+async def run_rumdl_format_async(
+    spec_dir: Path, rumdl_available: bool | None = None
+) -> FormatResult:
+    """Async variant of :func:`run_rumdl_format` using an asyncio subprocess.
+
+    Callers that already checked for rumdl may pass ``rumdl_available``.
+    """
+    import asyncio
+
+    md_files = await asyncio.to_thread(lambda: list(spec_dir.rglob("*.md")))
+    if not md_files:
+        return FormatResult(success=True)
+
+    if rumdl_available is None:
+        rumdl_available = await is_rumdl_available_async()
+    if not rumdl_available:
+        return _RUMDL_MISSING
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "rumdl",
+            "fmt",
+            *(str(f) for f in md_files),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
         )
+    except OSError as e:
+        return _format_error(e)
+    try:
+        _, stderr = await asyncio.wait_for(process.communicate(), _format_timeout(len(md_files)))
+    except TimeoutError:
+        process.kill()
+        await process.wait()
+        return _format_timed_out(len(md_files))
+    if process.returncode != 0:
+        return _format_failed(stderr.decode("utf-8", errors="replace"))
+    return _formatted(len(md_files))
@@ -5,11 +5,21 @@ from __future__ import annotations
 import os
 import re
 import subprocess
+import time
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache
 from pathlib import Path
+from stat import S_ISREG
+from typing import TYPE_CHECKING
 
 from pb_spec.config import GIT_TIMEOUT
+from pb_spec.profiling import traced
+
+if TYPE_CHECKING:
+    from pb_spec.git_utils import GitBlobs
+    from pb_spec.validation.baseline import Baseline
 
 
 class IssueType(Enum):
@@ -44,6 +54,176 @@ class ScanResult:
         return bool(self.issues)
 
 
+# A file modified this close to a scan may change again within the same
+# timestamp tick without its mtime moving; 2 s covers the coarsest common
+# filesystem granularity (FAT).
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+
+class ScanCache:
+    """Per-file scan results reused across scans while a file is unchanged.
+
+    Entries are keyed by scan root and file path and validated against the
+    file's ``st_mtime_ns`` and ``st_size``, snapshotted before the file is read.
+    As with git's "racily clean" rule, files modified within
+    ``RACY_MTIME_WINDOW_NS`` of the scan are not cached: a later write in the
+    same timestamp tick would leave mtime and size unchanged. Files scanned from a git revision or
+    the index are keyed by their blob id as well, so those entries never go
+    stale. Long-lived processes (the daemon, watch mode, sessions) share one
+    cache so repeat scans only read edited files.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str], tuple[int, int, tuple[ScanIssue, ...]]] = {}
+        self._blobs: dict[tuple[str, str, str], tuple[ScanIssue, ...]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._blobs)
+
+    def lookup(
+        self, root_dir: Path, file_path: Path, stat: os.stat_result
+    ) -> tuple[ScanIssue, ...] | None:
+        """Return cached issues if ``stat`` matches the file's cached entry, or None."""
+        entry = self._entries.get((str(root_dir), str(file_path)))
+        if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[2]
+
+    def store(
+        self, root_dir: Path, file_path: Path, stat: os.stat_result, issues: list[ScanIssue]
+    ) -> None:
+        """Record the issues found in a file read after ``stat`` was taken.
+
+        Racily clean files, modified too recently to trust their mtime, are skipped.
+        """
+        if time.time_ns() - stat.st_mtime_ns < RACY_MTIME_WINDOW_NS:
+            return
+        key = (str(root_dir), str(file_path))
+        self._entries[key] = (stat.st_mtime_ns, stat.st_size, tuple(issues))
+
+    def lookup_blob(
+        self, root_dir: Path, file_path: Path, oid: str
+    ) -> tuple[ScanIssue, ...] | None:
+        """Return cached issues for ``file_path`` at git blob ``oid``, or None."""
+        issues = self._blobs.get((str(root_dir), str(file_path), oid))
+        if issues is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return issues
+
+    def store_blob(
+        self, root_dir: Path, file_path: Path, oid: str, issues: list[ScanIssue]
+    ) -> None:
+        """Record the issues found in ``file_path`` at git blob ``oid``."""
+        self._blobs[str(root_dir), str(file_path), oid] = tuple(issues)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+        self._blobs.clear()
+
+
+@dataclass
+class PatternStats:
+    """Evaluation count, hit count and cumulative search time of one pattern."""
+
+    issue_type: IssueType
+    pattern: str
+    evaluations: int = 0
+    hits: int = 0
+    time_ns: int = 0
+
+
+@dataclass(frozen=True)
+class FileScanStats:
+    """Size and read-plus-match time of one scanned file."""
+
+    path: str
+    size: int
+    lines: int
+    time_ns: int
+
+
+@dataclass(frozen=True)
+class ExtensionThroughput:
+    """Files, bytes and scan time aggregated per file extension."""
+
+    extension: str
+    files: int
+    size: int
+    time_ns: int
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Return scan throughput, or 0 when no time was recorded."""
+        return self.size / (self.time_ns / 1e9) if self.time_ns else 0.0
+
+
+class ScanStats:
+    """Opt-in cost accounting for CodeScanner.
+
+    Pass an instance as ``CodeScanner(stats=...)`` to record files enumerated,
+    per-file scan times and issues by type, plus per-pattern evaluations, hits
+    and search time unless ``count_patterns`` is False. Scanners without stats
+    keep the uninstrumented fast path. Files served from a ScanCache are not
+    read and so are not in ``files``.
+    """
+
+    def __init__(self, count_patterns: bool = True) -> None:
+        self.count_patterns = count_patterns
+        self.patterns: dict[tuple[IssueType, str], PatternStats] = {}
+        self.files: list[FileScanStats] = []
+        self.files_enumerated = 0
+        self.issues_by_type: dict[IssueType, int] = {}
+
+    @property
+    def bytes_read(self) -> int:
+        """Return the total size of the files read."""
+        return sum(file.size for file in self.files)
+
+    def for_pattern(self, issue_type: IssueType, pattern: str) -> PatternStats:
+        """Return the counters for ``pattern``, creating them on first use."""
+        key = (issue_type, pattern)
+        if key not in self.patterns:
+            self.patterns[key] = PatternStats(issue_type, pattern)
+        return self.patterns[key]
+
+    def patterns_by_time(self) -> list[PatternStats]:
+        """Return pattern counters, most expensive first."""
+        return sorted(self.patterns.values(), key=lambda p: p.time_ns, reverse=True)
+
+    def slowest_files(self, limit: int = 10) -> list[FileScanStats]:
+        """Return the ``limit`` files that took longest to read and match."""
+        return sorted(self.files, key=lambda f: f.time_ns, reverse=True)[:limit]
+
+    def throughput_by_extension(self) -> list[ExtensionThroughput]:
+        """Return per-extension totals, largest first."""
+        totals: dict[str, list[int]] = {}
+        for file in self.files:
+            total = totals.setdefault(Path(file.path).suffix, [0, 0, 0])
+            total[0] += 1
+            total[1] += file.size
+            total[2] += file.time_ns
+        return sorted(
+            (ExtensionThroughput(ext, *total) for ext, total in totals.items()),
+            key=lambda t: t.size,
+            reverse=True,
+        )
+
+
+GIT_LS_FILES_ARGS: tuple[str, ...] = (
+    "git",
+    "ls-files",
+    "--cached",
+    "--others",
+    "--exclude-standard",
+)
+
 VALIDATION_PACKAGE_DIR: Path = Path(__file__).parent
 
 EXCLUDE_DIRS: frozenset[str] = frozenset(
@@ -81,60 +261,71 @@ SCAN_EXTENSIONS: frozenset[str] = frozenset(
     }
 )
 
-SKIP_TEST_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"@pytest\.mark\.skip"),
-    re.compile(r"@unittest\.skip"),
-    re.compile(r"@pytest\.mark\.skipif"),
-    re.compile(r"\.skip\("),
-    re.compile(r"\bxit\("),
-    re.compile(r"\bxtest\("),
-    re.compile(r"\bxit\b"),
-    re.compile(r"\bxtest\b"),
-    re.compile(r"test\.skip"),
-    re.compile(r"it\.skip"),
-    re.compile(r"describe\.skip"),
-    re.compile(r"#\[ignore\]"),
-    re.compile(r"@Ignore"),
-    re.compile(r"t\.Skip\(\)"),
-]
-
-NOT_IMPLEMENTED_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"raise NotImplementedError\b"),
-    re.compile(r"unimplemented!"),
-    re.compile(r"todo!"),
-]
-
-TODO_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"TODO:", re.IGNORECASE),
-    re.compile(r"FIXME:", re.IGNORECASE),
-    re.compile(r"//\s*TODO", re.IGNORECASE),
-    re.compile(r"//\s*FIXME", re.IGNORECASE),
-    re.compile(r"<!--\s*TODO", re.IGNORECASE),
-    re.compile(r"<!--\s*FIXME", re.IGNORECASE),
-    re.compile(r"#\s*TODO", re.IGNORECASE),
-    re.compile(r"#\s*FIXME", re.IGNORECASE),
-]
-
-DEBUG_ARTIFACT_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"console\.log\("),
-    re.compile(r"console\.debug\("),
-    re.compile(r"debugger;"),
-    re.compile(r"pdb\.set_trace\(\)"),
-    re.compile(r"breakpoint\(\)"),
-    re.compile(r"import pdb"),
-    re.compile(r"from pdb import"),
-    re.compile(r"import ipdb"),
-    re.compile(r"binding\.pry"),
-    re.compile(r"byebug"),
-    re.compile(r"import debugpy"),
-]
-
-_ALL_PATTERNS: list[tuple[IssueType, list[re.Pattern[str]]]] = [
-    (IssueType.SKIPPED_TEST, SKIP_TEST_PATTERNS),
-    (IssueType.NOT_IMPLEMENTED, NOT_IMPLEMENTED_PATTERNS),
-    (IssueType.TODO, TODO_PATTERNS),
-    (IssueType.DEBUG_ARTIFACT, DEBUG_ARTIFACT_PATTERNS),
-]
+SKIP_TEST_PATTERNS: tuple[str, ...] = (
+    r"@pytest\.mark\.skip",
+    r"@unittest\.skip",
+    r"@pytest\.mark\.skipif",
+    r"\.skip\(",
+    r"\bxit\(",
+    r"\bxtest\(",
+    r"\bxit\b",
+    r"\bxtest\b",
+    r"test\.skip",
+    r"it\.skip",
+    r"describe\.skip",
+    r"#\[ignore\]",
+    r"@Ignore",
+    r"t\.Skip\(\)",
+)
+
+NOT_IMPLEMENTED_PATTERNS: tuple[str, ...] = (
+    r"raise NotImplementedError\b",
+    r"unimplemented!",
+    r"todo!",
+)
+
+TODO_PATTERNS: tuple[str, ...] = (
+    r"TODO:",
+    r"FIXME:",
+    r"//\s*TODO",
+    r"//\s*FIXME",
+    r"<!--\s*TODO",
+    r"<!--\s*FIXME",
+    r"#\s*TODO",
+    r"#\s*FIXME",
+)
+
+DEBUG_ARTIFACT_PATTERNS: tuple[str, ...] = (
+    r"console\.log\(",
+    r"console\.debug\(",
+    r"debugger;",
+    r"pdb\.set_trace\(\)",
+    r"breakpoint\(\)",
+    r"import pdb",
+    r"from pdb import",
+    r"import ipdb",
+    r"binding\.pry",
+    r"byebug",
+    r"import debugpy",
+)
+
+# (issue type, pattern sources, regex flags), checked in this order; a line
+# yields at most one issue per type.
+_RULE_SOURCES: tuple[tuple[IssueType, tuple[str, ...], re.RegexFlag], ...] = (
+    (IssueType.SKIPPED_TEST, SKIP_TEST_PATTERNS, re.NOFLAG),
+    (IssueType.NOT_IMPLEMENTED, NOT_IMPLEMENTED_PATTERNS, re.NOFLAG),
+    (IssueType.TODO, TODO_PATTERNS, re.IGNORECASE),
+    (IssueType.DEBUG_ARTIFACT, DEBUG_ARTIFACT_PATTERNS, re.NOFLAG),
+)
+
+
+@cache
+def compiled_rules() -> tuple[tuple[IssueType, tuple[re.Pattern[str], ...]], ...]:
+    """Compile the scan rules on first use rather than at import time."""
+    return tuple(
+        (issue_type, tuple(re.compile(source, flags) for source in sources))
+        for issue_type, sources, flags in _RULE_SOURCES
+    )
 
 
 class CodeScanner:
@@ -146,34 +337,59 @@ class CodeScanner:
         exclude_dirs: frozenset[str] | None = None,
         scan_extensions: frozenset[str] | None = None,
         target_files: set[Path] | None = None,
+        cache: ScanCache | None = None,
+        stats: ScanStats | None = None,
+        baseline: Baseline | None = None,
+        blobs: GitBlobs | None = None,
     ) -> None:
         self.root_dir = Path(root_dir)
         self.exclude_dirs = exclude_dirs or EXCLUDE_DIRS
         self.scan_extensions = scan_extensions or SCAN_EXTENSIONS
         self.target_files = target_files
+        self.cache = cache
+        self.stats = stats
+        self.baseline = baseline
+        self.blobs = blobs
+        self._rules = compiled_rules()
+        self._counted_rules = (
+            ()
+            if stats is None or not stats.count_patterns
+            else tuple(
+                (issue_type, tuple((p, stats.for_pattern(issue_type, p.pattern)) for p in patterns))
+                for issue_type, patterns in self._rules
+            )
+        )
 
+    @traced("git ls-files")
     def _get_git_files(self) -> list[Path] | None:
         """Get files managed by git, respecting .gitignore exclusions."""
         try:
             result = subprocess.run(
-                ["git", "ls-files", "--cached", "--others", "--exclude-standard"],
+                list(GIT_LS_FILES_ARGS),
                 capture_output=True,
                 text=True,
                 check=True,
                 cwd=self.root_dir,
                 timeout=GIT_TIMEOUT,
             )
-            files = []
-            for line in result.stdout.splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                file_path = self.root_dir / line
-                if file_path.suffix in self.scan_extensions and self._should_scan_file(file_path):
-                    files.append(file_path)
-            return files
         except subprocess.CalledProcessError, FileNotFoundError:
             return None
+        return self.files_from_git_listing(result.stdout)
+
+    def files_from_git_listing(self, output: str) -> list[Path]:
+        """Select scannable files from ``git ls-files`` output."""
+        return self._select_files(line.strip() for line in output.splitlines())
+
+    def _select_files(self, paths: Iterable[str]) -> list[Path]:
+        """Return the scannable files among ``paths`` relative to the root."""
+        files = []
+        for path in paths:
+            if not path:
+                continue
+            file_path = self.root_dir / path
+            if file_path.suffix in self.scan_extensions and self._should_scan_file(file_path):
+                files.append(file_path)
+        return files
 
     def _should_scan_file(self, file_path: Path) -> bool:
         """Check whether a file should be scanned."""
@@ -196,54 +412,171 @@ class CodeScanner:
                 files.append(file_path)
         return files
 
-    def _get_files_to_scan(self) -> list[Path]:
+    @traced("files_to_scan")
+    def files_to_scan(self) -> list[Path]:
         """Determine which files to scan."""
         if self.target_files is not None:
-            return [f for f in self.target_files if f.suffix in self.scan_extensions and f.exists()]
+            return [
+                f
+                for f in self.target_files
+                if f.suffix in self.scan_extensions
+                and (f.exists() if self.blobs is None else self.blobs.oid(f) is not None)
+            ]
+        if self.blobs is not None:
+            return self._select_files(self.blobs.oids)
 
         git_files = self._get_git_files()
         if git_files is not None:
             return git_files
         return self._get_files_fallback()
 
-    def scan(self) -> ScanResult:
-        """Scan the codebase and return results."""
-        result = ScanResult()
-        for file_path in self._get_files_to_scan():
-            self._scan_file(file_path, result)
-        return result
+    @traced("scan")
+    def scan(self, files: list[Path] | None = None) -> ScanResult:
+        """Scan the codebase and return results.
+
+        ``files`` overrides file discovery for callers that listed them already.
+        """
+        return ScanResult(issues=list(self.iter_issues(files)))
+
+    def iter_issues(self, files: list[Path] | None = None) -> Iterator[ScanIssue]:
+        """Yield issues file by file, holding only the current file's issues in memory.
+
+        With a baseline, files git reports unchanged since it was created are
+        not read and issues whose fingerprint it records are left out.
+        """
+        if files is None:
+            files = self.files_to_scan()
+        counts = self.stats.issues_by_type if self.stats is not None else None
+        baseline = self.baseline
+        root = self.root_dir.resolve()
+        unchanged: set[str] = set()
+        if baseline is not None:
+            current = self.blobs.oids if self.blobs is not None else None
+            unchanged = baseline.unchanged_files(self.root_dir, current)
+        for file_path in files:
+            key = baseline.path_key(root, file_path) if baseline is not None else ""
+            if baseline is not None and key in unchanged:
+                baseline.skipped_files += 1
+                continue
+            found = ScanResult()
+            self._scan_file(file_path, found)
+            for issue in found.issues:
+                if baseline is not None and baseline.is_known(key, issue):
+                    baseline.suppressed += 1
+                    continue
+                if counts is not None:
+                    counts[issue.issue_type] = counts.get(issue.issue_type, 0) + 1
+                yield issue
+        if self.stats is not None:
+            self.stats.files_enumerated += len(files)
 
+    @traced("scan_file")
     def _scan_file(self, file_path: Path, result: ScanResult) -> None:
         """Scan a single file for issues."""
-        if not file_path.exists() or not file_path.is_file():
+        if self.blobs is not None:
+            self._scan_blob(file_path, result)
             return
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return
+        if not S_ISREG(stat.st_mode):
+            return
+        if self.cache is not None:
+            cached = self.cache.lookup(self.root_dir, file_path, stat)
+            if cached is not None:
+                result.issues.extend(cached)
+                return
 
+        started = time.perf_counter_ns() if self.stats is not None else 0
         try:
             content = file_path.read_text(encoding="utf-8")
         except UnicodeDecodeError, OSError:
             return
 
+        first_issue = len(result.issues)
+        self._scan_content(file_path, content, result, started)
+        if self.cache is not None:
+            self.cache.store(self.root_dir, file_path, stat, result.issues[first_issue:])
+
+    def _scan_blob(self, file_path: Path, result: ScanResult) -> None:
+        """Scan ``file_path`` as stored in ``self.blobs`` instead of on disk."""
+        blobs = self.blobs
+        oid = blobs.oid(file_path) if blobs is not None else None
+        if blobs is None or oid is None:
+            return
+        if self.cache is not None:
+            cached = self.cache.lookup_blob(self.root_dir, file_path, oid)
+            if cached is not None:
+                result.issues.extend(cached)
+                return
+
+        started = time.perf_counter_ns() if self.stats is not None else 0
+        data = blobs.read(oid)
+        if data is None:
+            return
+        try:
+            # Newlines translated as read_text() does for files on disk.
+            content = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        except UnicodeDecodeError:
+            return
+
+        first_issue = len(result.issues)
+        self._scan_content(file_path, content, result, started)
+        if self.cache is not None:
+            self.cache.store_blob(self.root_dir, file_path, oid, result.issues[first_issue:])
+
+    def _scan_content(
+        self, file_path: Path, content: str, result: ScanResult, started: int
+    ) -> None:
+        """Match every line of ``content`` and record per-file stats from ``started``."""
         lines = content.split("\n")
         try:
             rel_path = str(file_path.relative_to(self.root_dir))
         except ValueError:
             rel_path = str(file_path)
 
-        for i, line in enumerate(lines, start=1):
-            self._check_line(rel_path, i, line, result)
+        if not self._counted_rules:
+            for i, line in enumerate(lines, start=1):
+                self._check_line(rel_path, i, line, result)
+        else:
+            for i, line in enumerate(lines, start=1):
+                self._check_line_counted(rel_path, i, line, result)
+        if self.stats is not None:
+            elapsed = time.perf_counter_ns() - started
+            size = len(content.encode("utf-8"))
+            self.stats.files.append(FileScanStats(rel_path, size, len(lines), elapsed))
 
     def _check_line(self, file_path: str, line_number: int, line: str, result: ScanResult) -> None:
         """Check a single line for all issue types."""
-        for issue_type, patterns in _ALL_PATTERNS:
+        for issue_type, patterns in self._rules:
             for pattern in patterns:
                 if pattern.search(line):
-                    result.issues.append(
-                        ScanIssue(
-                            issue_type=issue_type,
-                            file_path=file_path,
-                            line_number=line_number,
-                            line_content=line.strip(),
-                            message=f"{issue_type.value.replace('_', ' ').title()} found: {line.strip()}",
-                        )
-                    )
+                    result.issues.append(_issue(issue_type, file_path, line_number, line))
+                    break
+
+    def _check_line_counted(
+        self, file_path: str, line_number: int, line: str, result: ScanResult
+    ) -> None:
+        """Check a line like _check_line, charging each search to its PatternStats."""
+        for issue_type, patterns in self._counted_rules:
+            for pattern, counters in patterns:
+                started = time.perf_counter_ns()
+                matched = pattern.search(line)
+                counters.time_ns += time.perf_counter_ns() - started
+                counters.evaluations += 1
+                if matched:
+                    counters.hits += 1
+                    result.issues.append(_issue(issue_type, file_path, line_number, line))
                     break
+
+
+def _issue(issue_type: IssueType, file_path: str, line_number: int, line: str) -> ScanIssue:
+    content = line.strip()
+    return ScanIssue(
+        issue_type=issue_type,
+        file_path=file_path,
+        line_number=line_number,
+        line_content=content,
+        message=f"{issue_type.value.replace('_', ' ').title()} found: {content}",
+    )
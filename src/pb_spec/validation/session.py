@@ -0,0 +1,128 @@
+"""Async validation API for embedding pb-spec in long-running orchestrators.
+
+A :class:`ValidationSession` runs git and rumdl as asyncio subprocesses and
+moves file parsing and scanning onto a thread pool, so awaiting a validation
+never blocks the event loop. One session keeps its :class:`ScanCache` warm
+across calls; validations of the same project root are serialised while
+different roots run concurrently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from pb_spec.config import GIT_TIMEOUT
+from pb_spec.git_utils import get_git_modified_files_async
+from pb_spec.validation.build import validate_build, validate_task
+from pb_spec.validation.contract_config import ContractConfig
+from pb_spec.validation.plan import validate_plan
+from pb_spec.validation.result import ValidationResult
+from pb_spec.validation.rumdl import (
+    FormatResult,
+    is_rumdl_available_async,
+    run_rumdl_format_async,
+)
+from pb_spec.validation.scanner import GIT_LS_FILES_ARGS, CodeScanner, ScanCache
+
+
+def _project_root(spec_dir: Path) -> Path:
+    return spec_dir.parent.parent if spec_dir.parent.name == "specs" else spec_dir.parent
+
+
+async def _git_file_listing(root: Path) -> str | None:
+    """Return ``git ls-files`` output for ``root``, or None outside a git repository."""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *GIT_LS_FILES_ARGS,
+            cwd=root,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        return None
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), GIT_TIMEOUT)
+    except TimeoutError:
+        process.kill()
+        await process.wait()
+        return None
+    return stdout.decode("utf-8") if process.returncode == 0 else None
+
+
+class ValidationSession:
+    """Reusable, concurrency-safe async front end to pb-spec validation.
+
+    Use as an async context manager, or call :meth:`close` when done::
+
+        async with ValidationSession() as session:
+            result = await session.validate_task(root)
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self.scan_cache = ScanCache()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pb-spec-validate"
+        )
+        self._root_locks: dict[Path, asyncio.Lock] = {}
+        self._rumdl_available: bool | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker threads."""
+        self._executor.shutdown(wait=True)
+
+    def _lock_for(self, root: Path) -> asyncio.Lock:
+        return self._root_locks.setdefault(root.resolve(), asyncio.Lock())
+
+    async def _in_executor[T](self, function: Callable[..., T], *args: object) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(function, *args))
+
+    async def validate_task(self, root_dir: Path | str = ".") -> ValidationResult:
+        """Scan files with git changes under ``root_dir`` (``validate --task``)."""
+        root = Path(root_dir)
+        async with self._lock_for(root):
+            modified = await get_git_modified_files_async(root)
+            return await self._in_executor(
+                functools.partial(validate_task, root, self.scan_cache, modified_files=modified)
+            )
+
+    async def validate_build(self, spec_dir: Path) -> ValidationResult:
+        """Check task completion and scan the whole project (``validate --build``)."""
+        root = _project_root(spec_dir)
+        async with self._lock_for(root):
+            listing = await _git_file_listing(root)
+            files = None
+            if listing is not None:
+                files = CodeScanner(root_dir=root).files_from_git_listing(listing)
+            return await self._in_executor(validate_build, spec_dir, self.scan_cache, files)
+
+    async def validate_plan(
+        self, spec_dir: Path, config: ContractConfig | None = None
+    ) -> ValidationResult:
+        """Check spec document structure and coverage (``validate --plan`` without formatting)."""
+        async with self._lock_for(_project_root(spec_dir)):
+            return await self._in_executor(validate_plan, spec_dir, config)
+
+    async def format_spec(self, spec_dir: Path) -> FormatResult:
+        """Format the spec's markdown with rumdl, as ``validate --plan`` does first."""
+        if self._rumdl_available is None:
+            self._rumdl_available = await is_rumdl_available_async()
+        async with self._lock_for(_project_root(spec_dir)):
+            return await run_rumdl_format_async(spec_dir, self._rumdl_available)
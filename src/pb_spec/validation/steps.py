@@ -0,0 +1,365 @@
+"""Static behave step-definition index and undefined/ambiguous/unused step detection."""
+
+from __future__ import annotations
+
+import ast
+import logging
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pb_spec.exceptions import FileReadError
+from pb_spec.validation.gherkin import (
+    GherkinToken,
+    TokenKind,
+    iter_file_lines,
+    iter_gherkin_tokens,
+    map_files,
+)
+
+logger = logging.getLogger(__name__)
+
+STEP_TYPES = ("given", "when", "then")
+GENERIC_STEP_TYPE = "step"
+
+_DECORATOR_TYPES = {
+    "given": "given",
+    "when": "when",
+    "then": "then",
+    "step": GENERIC_STEP_TYPE,
+    "Given": "given",
+    "When": "when",
+    "Then": "then",
+    "Step": GENERIC_STEP_TYPE,
+}
+_CONTINUATION_KEYWORDS = frozenset({"And", "But", "*"})
+
+# Regex fragments for the parse-module format types behave patterns commonly use;
+# custom types (registered at runtime) fall back to a lazy wildcard.
+_PARSE_TYPE_PATTERNS = {
+    "d": r"[-+]?\d+",
+    "n": r"[-+]?[\d,]+",
+    "f": r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?",
+    "F": r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?",
+    "e": r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?",
+    "g": r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?",
+    "w": r"\w+",
+    "W": r"\W+",
+    "s": r"\s+",
+    "S": r"\S+",
+    "l": r"[a-zA-Z]+",
+}
+_PARSE_FIELD_RE = re.compile(r"\{\{|\}\}|\{([^{}]*)\}")
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+_OUTLINE_PARAM_RE = re.compile(r"<([^<>]+)>")
+
+
+@dataclass(frozen=True)
+class StepDefinition:
+    """A ``@given/@when/@then/@step`` decorated function found by static analysis."""
+
+    step_type: str
+    pattern: str
+    file_path: str
+    line_number: int
+    matcher: str = "parse"
+    regex: re.Pattern[str] = field(default=re.compile(""), compare=False, repr=False)
+    literal_prefix: str = field(default="", compare=False, repr=False)
+
+
+@dataclass(frozen=True)
+class StepUse:
+    """A step line in a feature file (outline steps expanded per Examples row)."""
+
+    step_type: str
+    text: str
+    file_path: str
+    line_number: int
+
+
+@dataclass
+class StepReport:
+    """Steps without a definition, steps matching several, and definitions never used."""
+
+    undefined: list[StepUse] = field(default_factory=list)
+    ambiguous: list[tuple[StepUse, tuple[StepDefinition, ...]]] = field(default_factory=list)
+    unused: list[StepDefinition] = field(default_factory=list)
+    step_count: int = 0
+    definition_count: int = 0
+
+
+def compile_parse_pattern(pattern: str) -> tuple[re.Pattern[str], str]:
+    """Translate a parse-style step pattern to a regex and its literal prefix."""
+    parts: list[str] = []
+    prefix: str | None = None
+    literal: list[str] = []
+    position = 0
+    for match in _PARSE_FIELD_RE.finditer(pattern):
+        literal.append(pattern[position : match.start()])
+        position = match.end()
+        token = match.group(0)
+        if token in ("{{", "}}"):
+            literal.append(token[0])
+            continue
+        text = "".join(literal)
+        parts.append(re.escape(text))
+        if prefix is None:
+            prefix = text
+        literal = []
+        _, _, format_spec = (match.group(1) or "").partition(":")
+        type_char = format_spec[-1:] if format_spec else ""
+        parts.append(f"(?:{_PARSE_TYPE_PATTERNS.get(type_char, '.+?')})")
+    text = "".join(literal) + pattern[position:]
+    parts.append(re.escape(text))
+    if prefix is None:
+        prefix = "".join(literal) + pattern[position:]
+    return re.compile("".join(parts), re.DOTALL), prefix
+
+
+def compile_re_pattern(pattern: str) -> tuple[re.Pattern[str], str]:
+    """Compile a regex step pattern and return the literal text it must start with."""
+    regex = re.compile(pattern)
+    if "|" in pattern:
+        # Alternation can change the leading text; index it as a wildcard.
+        return regex, ""
+    prefix_chars: list[str] = []
+    for char in pattern.removeprefix("^"):
+        if char in _REGEX_METACHARS:
+            # A quantifier makes the preceding character optional.
+            if char in "*?{" and prefix_chars:
+                prefix_chars.pop()
+            break
+        prefix_chars.append(char)
+    return regex, "".join(prefix_chars)
+
+
+def _step_decorator(decorator: ast.expr) -> tuple[str, str] | None:
+    if not isinstance(decorator, ast.Call) or not decorator.args:
+        return None
+    func = decorator.func
+    name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+    step_type = _DECORATOR_TYPES.get(name or "")
+    argument = decorator.args[0]
+    if step_type is None or not isinstance(argument, ast.Constant):
+        return None
+    if not isinstance(argument.value, str):
+        return None
+    return step_type, argument.value
+
+
+def _matcher_call(node: ast.stmt) -> str | None:
+    """Return the matcher name of a module-level ``use_step_matcher("...")`` call."""
+    if not isinstance(node, ast.Expr) or not isinstance(node.value, ast.Call):
+        return None
+    func = node.value.func
+    name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+    if name not in ("use_step_matcher", "step_matcher") or not node.value.args:
+        return None
+    argument = node.value.args[0]
+    if isinstance(argument, ast.Constant) and isinstance(argument.value, str):
+        return argument.value
+    return None
+
+
+def parse_step_module(source: str, file_path: str) -> list[StepDefinition]:
+    """Extract step definitions from module source without importing it.
+
+    Module-level ``use_step_matcher("re")`` calls switch the matcher for the
+    definitions that follow, as they do at runtime.
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError, ValueError:
+        logger.warning("Cannot parse step module %s", file_path)
+        return []
+
+    definitions: list[StepDefinition] = []
+    matcher = "parse"
+    for node in tree.body:
+        if (new_matcher := _matcher_call(node)) is not None:
+            matcher = new_matcher
+            continue
+        if not isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            continue
+        for decorator in node.decorator_list:
+            found = _step_decorator(decorator)
+            if found is None:
+                continue
+            step_type, pattern = found
+            try:
+                if matcher.startswith("re"):
+                    regex, prefix = compile_re_pattern(pattern)
+                else:
+                    regex, prefix = compile_parse_pattern(pattern)
+            except re.error:
+                logger.warning("Invalid step pattern %r in %s", pattern, file_path)
+                continue
+            definitions.append(
+                StepDefinition(
+                    step_type=step_type,
+                    pattern=pattern,
+                    file_path=file_path,
+                    line_number=decorator.lineno,
+                    matcher=matcher,
+                    regex=regex,
+                    literal_prefix=prefix,
+                )
+            )
+    return definitions
+
+
+class StepIndex:
+    """Step definitions bucketed by step type and literal prefix.
+
+    A step is only tried against definitions whose literal prefix (the text
+    before the first placeholder) it starts with: one dict probe per distinct
+    prefix length, so hundreds of patterns sharing a first word stay cheap.
+    Match results are memoised by ``(step type, text)``, since large suites
+    repeat the same steps many times.
+    """
+
+    def __init__(self, definitions: Iterable[StepDefinition] = ()) -> None:
+        self.definitions: list[StepDefinition] = []
+        self._by_prefix: dict[str, dict[str, list[int]]] = {}
+        self._prefix_lengths: dict[str, list[int]] = {}
+        self._memo: dict[tuple[str, str], tuple[int, ...]] = {}
+        for definition in definitions:
+            self.add(definition)
+
+    def add(self, definition: StepDefinition) -> None:
+        """Index a definition."""
+        position = len(self.definitions)
+        self.definitions.append(definition)
+        prefix = definition.literal_prefix
+        buckets = self._by_prefix.setdefault(definition.step_type, {})
+        if prefix not in buckets:
+            lengths = self._prefix_lengths.setdefault(definition.step_type, [])
+            if len(prefix) not in lengths:
+                lengths.append(len(prefix))
+        buckets.setdefault(prefix, []).append(position)
+        self._memo.clear()
+
+    def _candidates(self, step_type: str, text: str) -> list[int]:
+        candidates: list[int] = []
+        for bucket_type in (step_type, GENERIC_STEP_TYPE):
+            buckets = self._by_prefix.get(bucket_type)
+            if not buckets:
+                continue
+            for length in self._prefix_lengths[bucket_type]:
+                candidates.extend(buckets.get(text[:length], ()))
+        return sorted(candidates)
+
+    def match_positions(self, step_type: str, text: str) -> tuple[int, ...]:
+        """Return the positions of every definition matching a step."""
+        key = (step_type, text)
+        cached = self._memo.get(key)
+        if cached is None:
+            cached = tuple(
+                position
+                for position in self._candidates(step_type, text)
+                if self.definitions[position].regex.fullmatch(text)
+            )
+            self._memo[key] = cached
+        return cached
+
+    def match(self, step_type: str, text: str) -> list[StepDefinition]:
+        """Return every definition matching a step."""
+        return [self.definitions[p] for p in self.match_positions(step_type, text)]
+
+
+def _table_cells(row: str) -> list[str]:
+    row = row.strip().replace("\\|", "\0")
+    return [cell.strip().replace("\0", "|") for cell in row.strip("|").split("|")]
+
+
+def _expand_outline_text(text: str, values: dict[str, str]) -> str:
+    return _OUTLINE_PARAM_RE.sub(lambda m: values.get(m.group(1), m.group(0)), text)
+
+
+def extract_feature_steps(tokens: Iterable[GherkinToken], file_path: str) -> list[StepUse]:
+    """Resolve And/But/* continuations and expand Scenario Outline steps per Examples row."""
+    steps: list[StepUse] = []
+    previous_type = "given"
+    outline_steps: list[tuple[str, str, int]] | None = None
+    header: list[str] | None = None
+    in_examples = False
+
+    for token in tokens:
+        match token.kind:
+            case TokenKind.STEP:
+                if token.keyword in _CONTINUATION_KEYWORDS:
+                    step_type = previous_type
+                else:
+                    step_type = token.keyword.lower()
+                previous_type = step_type
+                if outline_steps is not None and not in_examples:
+                    outline_steps.append((step_type, token.text, token.line_number))
+                elif outline_steps is None:
+                    steps.append(StepUse(step_type, token.text, file_path, token.line_number))
+            case TokenKind.EXAMPLES:
+                in_examples = True
+                header = None
+            case TokenKind.TABLE_ROW if in_examples and outline_steps is not None:
+                cells = _table_cells(token.text)
+                if header is None:
+                    header = cells
+                    continue
+                values = dict(zip(header, cells, strict=False))
+                for step_type, text, line_number in outline_steps:
+                    expanded = _expand_outline_text(text, values)
+                    steps.append(StepUse(step_type, expanded, file_path, line_number))
+            case TokenKind.SCENARIO_OUTLINE:
+                outline_steps, in_examples, previous_type = [], False, "given"
+            case TokenKind.SCENARIO | TokenKind.BACKGROUND | TokenKind.RULE | TokenKind.FEATURE:
+                outline_steps, in_examples, previous_type = None, False, "given"
+    return steps
+
+
+def _feature_steps(path: Path) -> list[StepUse]:
+    try:
+        return extract_feature_steps(
+            iter_gherkin_tokens(iter_file_lines(path), steps=True), str(path)
+        )
+    except FileReadError as e:
+        logger.warning("%s", e)
+        return []
+
+
+def _module_definitions(path: Path) -> list[StepDefinition]:
+    try:
+        source = "".join(iter_file_lines(path))
+    except FileReadError as e:
+        logger.warning("%s", e)
+        return []
+    return parse_step_module(source, str(path))
+
+
+def build_step_index(step_files: Iterable[Path]) -> StepIndex:
+    """Parse step modules (in parallel when there are many) into a StepIndex."""
+    paths = sorted(step_files)
+    return StepIndex(
+        d for definitions in map_files(_module_definitions, paths) for d in definitions
+    )
+
+
+def check_steps(step_files: Iterable[Path], feature_files: Iterable[Path]) -> StepReport:
+    """Match every feature step against the step index.
+
+    Unreadable files are logged and skipped.
+    """
+    index = build_step_index(step_files)
+    paths = sorted(feature_files)
+    report = StepReport(definition_count=len(index.definitions))
+    used: set[int] = set()
+    for steps in map_files(_feature_steps, paths):
+        for step in steps:
+            report.step_count += 1
+            positions = index.match_positions(step.step_type, step.text)
+            used.update(positions)
+            if not positions:
+                report.undefined.append(step)
+            elif len(positions) > 1:
+                report.ambiguous.append((step, tuple(index.definitions[p] for p in positions)))
+    report.unused = [d for p, d in enumerate(index.definitions) if p not in used]
+    return report
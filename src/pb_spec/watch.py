@@ -0,0 +1,374 @@
+"""Filesystem watching and incremental revalidation for ``validate --watch``."""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from pb_spec.validation.baseline import Baseline
+from pb_spec.validation.build import validate_build, validate_task
+from pb_spec.validation.contract_config import ContractConfig
+from pb_spec.validation.pipeline import merge_results
+from pb_spec.validation.plan import (
+    validate_design_structure,
+    validate_features_directory,
+    validate_plan,
+    validate_scenario_coverage,
+    validate_tasks_structure,
+)
+from pb_spec.validation.result import ValidationError, ValidationResult
+from pb_spec.validation.scanner import EXCLUDE_DIRS, ScanCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEBOUNCE = 0.2
+DEFAULT_POLL_INTERVAL = 1.0
+
+# inotify(7) event masks.
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _iter_watch_dirs(root: Path) -> Iterator[Path]:
+    """Yield ``root`` and its subdirectories, skipping excluded and hidden ones."""
+    for dirpath, dirnames, _ in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDE_DIRS and not d.startswith(".")]
+        yield Path(dirpath)
+
+
+class PollingWatcher:
+    """Detect changes by comparing ``(mtime_ns, size)`` snapshots of the tree."""
+
+    def __init__(self, root: Path, interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> dict[Path, tuple[int, int]]:
+        snapshot: dict[Path, tuple[int, int]] = {}
+        for directory in _iter_watch_dirs(self.root):
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    continue
+        return snapshot
+
+    def poll(self, timeout: float | None) -> set[Path]:
+        """Wait up to ``timeout`` seconds (forever if None) for changed paths."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._take_snapshot()
+            changed = {
+                path
+                for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            remaining = self.interval if deadline is None else deadline - time.monotonic()
+            time.sleep(max(0.0, min(self.interval, remaining)))
+
+    def close(self) -> None:
+        """Release resources (nothing to do for polling)."""
+
+
+class InotifyWatcher:
+    """Recursive inotify watcher using libc through ctypes (Linux only).
+
+    Raises:
+        OSError: If inotify is unavailable or the watch limit is exhausted.
+    """
+
+    def __init__(self, root: Path) -> None:
+        library = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(library, use_errno=True)
+        self.root = root
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._dirs: dict[int, Path] = {}
+        try:
+            for directory in _iter_watch_dirs(root):
+                self._add_watch(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                return
+            raise OSError(error, os.strerror(error), str(directory))
+        self._dirs[wd] = directory
+
+    def poll(self, timeout: float | None) -> set[Path]:
+        """Wait up to ``timeout`` seconds (forever if None) for changed paths."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed: set[Path] = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, name_length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + name_length].rstrip(b"\0")
+            offset += name_length
+            if mask & _IN_Q_OVERFLOW:
+                # Events were dropped; report the root so callers revalidate fully.
+                changed.add(self.root)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & _IN_IGNORED:
+                del self._dirs[wd]
+                continue
+            path = directory / os.fsdecode(name) if name else directory
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO) and path.name not in EXCLUDE_DIRS:
+                    for new_directory in _iter_watch_dirs(path):
+                        self._add_watch(new_directory)
+                continue
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        """Close the inotify descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+type Watcher = InotifyWatcher | PollingWatcher
+
+
+def create_watcher(root: Path, polling: bool = False) -> Watcher:
+    """Return an inotify watcher on Linux, falling back to polling elsewhere or on error."""
+    if not polling and hasattr(os, "O_CLOEXEC") and os.uname().sysname == "Linux":
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError) as e:
+            logger.info("inotify unavailable (%s); polling for changes", e)
+    return PollingWatcher(root)
+
+
+def wait_for_changes(watcher: Watcher, debounce: float = DEFAULT_DEBOUNCE) -> set[Path]:
+    """Block until something changes, then keep collecting until ``debounce`` seconds are quiet."""
+    changed = watcher.poll(None)
+    while True:
+        more = watcher.poll(debounce)
+        if not more:
+            return changed
+        changed |= more
+
+
+type IssueKey = tuple[str, str, str | None]
+
+
+def _issue_key(error: ValidationError) -> IssueKey:
+    # Line numbers shift as files are edited; they are not part of an issue's identity.
+    return (error.severity.value, error.message, error.file_path)
+
+
+@dataclass
+class IssueDelta:
+    """Issues introduced and resolved by the latest revalidation."""
+
+    new: list[ValidationError] = field(default_factory=list)
+    resolved: list[ValidationError] = field(default_factory=list)
+    new_warnings: list[str] = field(default_factory=list)
+    resolved_warnings: list[str] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        """Return True if nothing changed."""
+        return not (self.new or self.resolved or self.new_warnings or self.resolved_warnings)
+
+
+class IssueIndex:
+    """Multiset of current issues, used to report only what changed between runs."""
+
+    def __init__(self) -> None:
+        self._errors: Counter[IssueKey] = Counter()
+        self._examples: dict[IssueKey, ValidationError] = {}
+        self._warnings: Counter[str] = Counter()
+
+    def update(self, result: ValidationResult) -> IssueDelta:
+        """Replace the indexed issues with ``result`` and return the difference."""
+        errors: Counter[IssueKey] = Counter()
+        examples: dict[IssueKey, ValidationError] = {}
+        new: list[ValidationError] = []
+        for error in result.errors:
+            key = _issue_key(error)
+            errors[key] += 1
+            examples.setdefault(key, error)
+            if errors[key] > self._errors[key]:
+                new.append(error)
+        resolved = [
+            self._examples[key]
+            for key, count in self._errors.items()
+            for _ in range(count - errors[key])
+        ]
+        warnings = Counter(result.warnings)
+        delta = IssueDelta(
+            new=new,
+            resolved=resolved,
+            new_warnings=list((warnings - self._warnings).elements()),
+            resolved_warnings=list((self._warnings - warnings).elements()),
+        )
+        self._errors, self._examples, self._warnings = errors, examples, warnings
+        return delta
+
+
+@dataclass(frozen=True)
+class _PlanPhase:
+    name: str
+    validate: Callable[[Path, ContractConfig | None], ValidationResult]
+    triggers: tuple[str, ...]
+
+
+# Phases of validate_plan, each re-run only when one of its inputs changes.
+_PLAN_PHASES = (
+    _PlanPhase("design", validate_design_structure, ("design.md",)),
+    _PlanPhase("tasks", validate_tasks_structure, ("tasks.md",)),
+    _PlanPhase(
+        "features", lambda spec_dir, _: validate_features_directory(spec_dir), ("features",)
+    ),
+    _PlanPhase(
+        "coverage",
+        lambda spec_dir, _: validate_scenario_coverage(spec_dir),
+        ("tasks.md", "features"),
+    ),
+)
+
+
+class Revalidator:
+    """Incremental revalidation state for one ``validate`` mode.
+
+    Task and build modes share a ScanCache, so only edited files are re-scanned;
+    plan mode re-runs only the validate_plan phases whose documents changed.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        spec_dir: Path | None,
+        root: Path,
+        config: ContractConfig | None = None,
+        baseline: Baseline | None = None,
+    ) -> None:
+        if mode in ("plan", "build") and spec_dir is None:
+            raise ValueError(f"{mode} mode needs a spec directory")
+        self.mode = mode
+        self.spec_dir = spec_dir
+        self.root = root
+        self.config = config
+        self.baseline = baseline
+        self.scan_cache = ScanCache()
+        self._plan_results: dict[str, ValidationResult] = {}
+
+    def validate(self) -> ValidationResult:
+        """Run a full validation, priming the caches."""
+        match self.mode:
+            case "plan":
+                return self._run_plan_phases({phase.name for phase in _PLAN_PHASES})
+            case "build":
+                return validate_build(self._spec_dir, self.scan_cache, baseline=self.baseline)
+            case _:
+                return validate_task(self.root, scan_cache=self.scan_cache, baseline=self.baseline)
+
+    def revalidate(self, changed: set[Path]) -> ValidationResult | None:
+        """Revalidate after ``changed`` paths.
+
+        Returns None in plan mode when no spec document was affected.
+        """
+        if self.mode == "plan" and self._plan_results:
+            affected = self._affected_phases(changed)
+            return self._run_plan_phases(affected) if affected else None
+        return self.validate()
+
+    @property
+    def _spec_dir(self) -> Path:
+        if self.spec_dir is None:
+            raise ValueError(f"{self.mode} mode needs a spec directory")
+        return self.spec_dir
+
+    def _affected_phases(self, changed: set[Path]) -> set[str]:
+        spec_dir = self._spec_dir.resolve()
+        tops: set[str] = set()
+        for path in changed:
+            try:
+                relative = path.resolve().relative_to(spec_dir)
+            except ValueError:
+                continue
+            tops.add(relative.parts[0] if relative.parts else "")
+        if "" in tops:
+            return {phase.name for phase in _PLAN_PHASES}
+        return {phase.name for phase in _PLAN_PHASES if tops & set(phase.triggers)}
+
+    def _run_plan_phases(self, affected: set[str]) -> ValidationResult:
+        spec_dir = self._spec_dir
+        if not all((spec_dir / name).exists() for name in ("design.md", "tasks.md")):
+            self._plan_results.clear()
+            return validate_plan(spec_dir, self.config)
+        if not self._plan_results:
+            affected = {phase.name for phase in _PLAN_PHASES}
+        for phase in _PLAN_PHASES:
+            if phase.name in affected:
+                self._plan_results[phase.name] = phase.validate(spec_dir, self.config)
+        return merge_results([self._plan_results[phase.name] for phase in _PLAN_PHASES])
+
+
+def relevant_changes(changed: set[Path]) -> set[Path]:
+    """Drop hidden files (editor swap files, specs/.index) that never affect validation."""
+    return {path for path in changed if not path.name.startswith(".")}
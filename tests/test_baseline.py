@@ -0,0 +1,124 @@
+"""Unit tests for issue baselines and the baseline command."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pb_spec.cli import main
+from pb_spec.exceptions import BaselineError
+from pb_spec.validation.baseline import (
+    BASELINE_FILE_NAME,
+    Baseline,
+    create_baseline,
+    issue_fingerprint,
+    load_baseline,
+)
+from pb_spec.validation.scanner import CodeScanner, IssueType, ScanStats
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Create a git repository with one committed file holding a TODO."""
+    (tmp_path / "app.py").write_text("x = 1\n# TODO: old debt\n")
+    (tmp_path / "clean.py").write_text("y = 2\n")
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "add", "-A"], cwd=tmp_path, check=True)
+    return tmp_path
+
+
+class TestFingerprint:
+    """Tests for issue_fingerprint."""
+
+    def test_ignores_whitespace_but_not_path_or_type(self) -> None:
+        """Test that only path, type and normalised content identify an issue."""
+        base = issue_fingerprint("a.py", IssueType.TODO, "# TODO:  fix  me")
+        assert base == issue_fingerprint("a.py", IssueType.TODO, "# TODO: fix me")
+        assert base != issue_fingerprint("b.py", IssueType.TODO, "# TODO: fix me")
+        assert base != issue_fingerprint("a.py", IssueType.DEBUG_ARTIFACT, "# TODO: fix me")
+        assert len(base) == 16
+
+
+class TestBaselineFile:
+    """Tests for writing and loading baseline files."""
+
+    def test_round_trip_is_sorted(self, tmp_path: Path) -> None:
+        """Test that dumps sorts each section and load_baseline reads it back."""
+        baseline = Baseline(frozenset({"ff", "0a"}), {"z.py": "2", "a b.py": "1"})
+        text = baseline.dumps()
+        assert text.splitlines()[1:] == ["blob 1 a b.py", "blob 2 z.py", "0a", "ff"]
+        path = tmp_path / BASELINE_FILE_NAME
+        path.write_text(text)
+        loaded = load_baseline(path)
+        assert loaded.fingerprints == baseline.fingerprints
+        assert loaded.blobs == baseline.blobs
+
+    def test_rejects_other_files(self, tmp_path: Path) -> None:
+        """Test that a file without the baseline header raises BaselineError."""
+        path = tmp_path / "notes.txt"
+        path.write_text("hello\n")
+        with pytest.raises(BaselineError, match="not a pb-spec baseline"):
+            load_baseline(path)
+
+    @pytest.mark.parametrize("blob_line", ["blob 1a2b", "blob 1a2b "])
+    def test_rejects_truncated_blob_line(self, tmp_path: Path, blob_line: str) -> None:
+        """Test that a truncated blob line raises BaselineError naming its line."""
+        path = tmp_path / BASELINE_FILE_NAME
+        path.write_text(f"{Baseline(frozenset({'ff'}), {}).dumps()}{blob_line}\n")
+        with pytest.raises(BaselineError, match=rf"{BASELINE_FILE_NAME}:3: malformed blob line"):
+            load_baseline(path)
+
+
+class TestBaselineScan:
+    """Tests for scanning with a baseline."""
+
+    def test_unchanged_files_are_not_read(self, repo: Path) -> None:
+        """Test that files matching their baselined blob are skipped entirely."""
+        baseline = create_baseline(repo)
+        assert set(baseline.blobs) == {"app.py", "clean.py"}
+        stats = ScanStats(count_patterns=False)
+        result = CodeScanner(root_dir=repo, stats=stats, baseline=baseline).scan()
+        assert not result.has_issues
+        assert baseline.skipped_files == 2
+        assert stats.files == []
+
+    def test_only_new_issues_survive_line_shifts(self, repo: Path) -> None:
+        """Test that known issues stay suppressed after lines move and new ones report."""
+        baseline = create_baseline(repo)
+        (repo / "app.py").write_text("import os\nx = 1\n# TODO: old debt\n# TODO: new debt\n")
+        result = CodeScanner(root_dir=repo, baseline=baseline).scan()
+        assert [issue.line_content for issue in result.issues] == ["# TODO: new debt"]
+        assert baseline.suppressed == 1
+        assert baseline.skipped_files == 1
+
+
+class TestBaselineCommand:
+    """Tests for `pb-spec baseline create` and `validate --baseline`."""
+
+    def test_create_then_validate(self, repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that validate --build passes once existing issues are baselined."""
+        spec_dir = repo / "specs" / "2026-01-01-demo"
+        spec_dir.mkdir(parents=True)
+        (spec_dir / "tasks.md").write_text("### Task 1.1: A\nStatus: 🟢 DONE\n- [x] s\n")
+        monkeypatch.chdir(repo)
+        runner = CliRunner()
+
+        assert runner.invoke(main, ["validate", "--build"]).exit_code == 1
+        created = runner.invoke(main, ["baseline", "create"])
+        assert created.exit_code == 0
+        assert "Recorded 1 issue fingerprint(s)" in created.output
+
+        result = runner.invoke(main, ["validate", "--build", "--baseline", BASELINE_FILE_NAME])
+        assert result.exit_code == 0
+        assert "2 unchanged file(s) not re-read" in result.output
+
+    def test_invalid_baseline_fails(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that an unreadable baseline is reported and exits with status 1."""
+        (tmp_path / "bogus").write_text("nope\n")
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(main, ["validate", "--task", "--baseline", "bogus"])
+        assert result.exit_code == 1
+        assert "not a pb-spec baseline" in result.output
@@ -0,0 +1,41 @@
+"""Tests for the synthetic corpus generators used by the benchmark suite."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pb_spec.validation.parser import parse_contract_blocks, parse_task_blocks
+from pb_spec.validation.plan import validate_plan
+
+generators = pytest.importorskip("benchmarks.generators")
+
+
+def _tree(root: Path) -> dict[str, bytes]:
+    return {
+        str(path.relative_to(root)): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and ".git" not in path.parts
+    }
+
+
+class TestGenerators:
+    """Tests for generate_repository and generate_spec."""
+
+    def test_repository_is_deterministic(self, tmp_path: Path) -> None:
+        """Test that the same seed produces byte-identical repositories."""
+        first = generators.generate_repository(tmp_path / "a", 12, 50, 0.05, seed=3, git=False)
+        second = generators.generate_repository(tmp_path / "b", 12, 50, 0.05, seed=3, git=False)
+        assert first == second
+        assert first.markers > 0
+        assert _tree(tmp_path / "a") == _tree(tmp_path / "b")
+
+    def test_spec_passes_plan_validation(self, tmp_path: Path) -> None:
+        """Test that a generated spec is a valid plan with the requested shape."""
+        spec_dir = tmp_path / "specs" / "generated"
+        stats = generators.generate_spec(spec_dir, tasks=25, scenarios=60, contract_every=5)
+        content = (spec_dir / "tasks.md").read_text(encoding="utf-8")
+        assert len(parse_task_blocks(content)) == stats.tasks == 25
+        assert len(parse_contract_blocks(content)) == stats.contract_blocks == 5
+        assert validate_plan(spec_dir).is_valid
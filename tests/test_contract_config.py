@@ -0,0 +1,96 @@
+"""Unit tests for the immutable, memoised contract configuration."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pb_spec.cli import main
+from pb_spec.exceptions import ContractConfigError
+from pb_spec.validation.contract_config import (
+    DEFAULT_CONTRACT_CONFIG_PATH,
+    ContractConfig,
+    load_contract_config,
+)
+from pb_spec.validation.plan import validate_plan
+from pb_spec.validation.result import ValidationResult
+
+DESIGN = "# Design\n\n## Summary\nS.\n"
+TASKS = (
+    "### Task 1.1: Work\n"
+    "Context: c\nVerification: v\nScenario Coverage: N/A\nStatus: 🔴 TODO\n"
+    "- [ ] Step 1\n"
+)
+
+
+def _write_config(path: Path, design_sections: list[str]) -> Path:
+    """Write a contract config requiring ``design_sections``."""
+    sections = ", ".join(f'"{s}"' for s in design_sections)
+    path.write_text(
+        f"[design]\nrequired_sections = [{sections}]\noptional_sections = []\n"
+        '[tasks]\nrequired_fields = ["Context:", "Status:"]\n'
+        '[build_blocked]\nrequired_fields = ["Reason"]\n'
+        '[dcr]\nrequired_fields = ["Reason"]\n'
+    )
+    return path
+
+
+class TestLoadContractConfig:
+    """Tests for load_contract_config."""
+
+    def test_default_is_bundled_file(self) -> None:
+        """Test that the default config is the bundled TOML and is memoised."""
+        config = load_contract_config()
+        assert config is load_contract_config(DEFAULT_CONTRACT_CONFIG_PATH)
+        assert "Summary" in config.design_required_sections
+        assert isinstance(config, ContractConfig)
+
+    def test_memoised_until_content_changes(self, tmp_path: Path) -> None:
+        """Test that unchanged files reuse the parsed config and edits reload it."""
+        path = _write_config(tmp_path / "c.toml", ["Summary"])
+        first = load_contract_config(path)
+        assert load_contract_config(path) is first
+        _write_config(path, ["Summary", "Risks"])
+        assert load_contract_config(path).design_required_sections == ("Summary", "Risks")
+
+    def test_invalid_config_raises(self, tmp_path: Path) -> None:
+        """Test that malformed or incomplete configs raise ContractConfigError."""
+        (tmp_path / "bad.toml").write_text("[design\n")
+        (tmp_path / "partial.toml").write_text("[design]\nrequired_sections = []\n")
+        for name in ("bad.toml", "partial.toml", "missing.toml"):
+            with pytest.raises(ContractConfigError):
+                load_contract_config(tmp_path / name)
+
+
+class TestExplicitConfig:
+    """Tests for passing configs explicitly to validators."""
+
+    def test_concurrent_specs_with_different_configs(self, tmp_path: Path) -> None:
+        """Test that specs validated in parallel each use their own config."""
+        spec_dir = tmp_path / "spec"
+        spec_dir.mkdir()
+        (spec_dir / "design.md").write_text(DESIGN)
+        (spec_dir / "tasks.md").write_text(TASKS)
+        lenient = load_contract_config(_write_config(tmp_path / "l.toml", ["Summary"]))
+        strict = load_contract_config(_write_config(tmp_path / "s.toml", ["Summary", "Risks"]))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda c: validate_plan(spec_dir, c), [lenient, strict] * 8))
+
+        def missing(result: ValidationResult) -> set[str | None]:
+            return {e.field_name for e in result.errors if e.file_path == "design.md"}
+
+        assert all(missing(r) == set() for r in results[::2])
+        assert all(missing(r) == {"Risks"} for r in results[1::2])
+
+    def test_cli_rejects_invalid_config(self, tmp_path: Path) -> None:
+        """Test that validate --config reports an unusable config file."""
+        (tmp_path / "bad.toml").write_text("not toml [")
+        result = CliRunner().invoke(
+            main, ["validate", "--plan", "--config", str(tmp_path / "bad.toml")]
+        )
+        assert result.exit_code == 1
+        assert "Invalid contract config" in result.output
@@ -0,0 +1,119 @@
+"""Unit tests for the Scenario Coverage cross-reference engine."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from pb_spec.cli import main
+from pb_spec.validation.coverage import compute_coverage, extract_scenario_tags
+from pb_spec.validation.gherkin import build_scenario_catalog
+from pb_spec.validation.parser import parse_task_blocks
+from pb_spec.validation.plan import validate_scenario_coverage
+
+FEATURE_CONTENT = (
+    "Feature: Login\n"
+    "  @login-success\n"
+    "  Scenario: Success\n"
+    "    Given a user\n"
+    "  @login-failure\n"
+    "  Scenario: Failure\n"
+    "    Given a user\n"
+    "  @login-lockout\n"
+    "  Scenario: Lockout\n"
+    "    Given a user\n"
+    "  Scenario: Untagged\n"
+    "    Given a user\n"
+)
+
+TASKS_CONTENT = (
+    "# Tasks\n\n"
+    "### Task 1.1: Happy path\n"
+    "Scenario Coverage: @login-success, @login-failure\n"
+    "- [ ] Step 1\n\n"
+    "### Task 1.2: Typo\n"
+    "Scenario Coverage: @login-sucess\n"
+    "- [ ] Step 1\n\n"
+    "### Task 1.3: Infra\n"
+    "Scenario Coverage: N/A\n"
+    "- [ ] Step 1\n"
+)
+
+
+def _write_spec(spec_dir: Path) -> None:
+    (spec_dir / "features").mkdir(parents=True)
+    (spec_dir / "features" / "login.feature").write_text(FEATURE_CONTENT)
+    (spec_dir / "tasks.md").write_text(TASKS_CONTENT)
+
+
+class TestExtractScenarioTags:
+    """Tests for extract_scenario_tags."""
+
+    def test_extracts_tags_without_punctuation_or_emails(self) -> None:
+        """Test that tags are deduplicated and trailing punctuation is dropped."""
+        value = "@a-1, @b.2. and @a-1; owner bob@example.com"
+        assert extract_scenario_tags(value) == ["@a-1", "@b.2"]
+
+    def test_na_has_no_tags(self) -> None:
+        """Test that the literal N/A yields no references."""
+        assert extract_scenario_tags("N/A") == []
+
+
+class TestComputeCoverage:
+    """Tests for compute_coverage."""
+
+    def test_matrix_reports_dangling_uncovered_and_per_task(self, tmp_path: Path) -> None:
+        """Test that one pass yields dangling refs, uncovered scenarios and task rows."""
+        _write_spec(tmp_path)
+        catalog = build_scenario_catalog([tmp_path / "features" / "login.feature"])
+        report = compute_coverage(parse_task_blocks(TASKS_CONTENT), catalog)
+
+        assert [s.name for s in report.covered_by("1.1")] == ["Success", "Failure"]
+        assert report.covered_by("1.3") == []
+        assert [(d.task_id, d.tag) for d in report.dangling] == [("1.2", "@login-sucess")]
+        assert [s.name for s in report.uncovered] == ["Lockout", "Untagged"]
+        assert report.summary() == {"tasks": 3, "scenarios": 4, "covered": 2, "dangling": 1}
+
+
+class TestValidateScenarioCoverage:
+    """Tests for the validate --plan coverage check."""
+
+    def test_dangling_reference_fails(self, tmp_path: Path) -> None:
+        """Test that an unknown scenario tag is a validation error."""
+        _write_spec(tmp_path)
+        result = validate_scenario_coverage(tmp_path)
+        assert result.is_valid is False
+        assert any("@login-sucess" in e.message for e in result.errors)
+        assert any("'Lockout'" in w for w in result.warnings)
+        assert any("1 scenario(s) have no tags" in w for w in result.warnings)
+
+    def test_free_text_coverage_passes(self, tmp_path: Path) -> None:
+        """Test that coverage without tags is not treated as dangling."""
+        _write_spec(tmp_path)
+        (tmp_path / "tasks.md").write_text(
+            "### Task 1.1: T\nScenario Coverage: features/login.feature — Success\n- [ ] S\n"
+        )
+        assert validate_scenario_coverage(tmp_path).is_valid is True
+
+
+class TestPlanCoverageCommand:
+    """Tests for `pb-spec plan coverage`."""
+
+    def test_json_report(self, tmp_path: Path) -> None:
+        """Test that the JSON report carries the matrix and exits non-zero on dangling refs."""
+        specs_dir = tmp_path / "specs"
+        _write_spec(specs_dir / "2026-01-01-login")
+        result = CliRunner().invoke(
+            main, ["plan", "coverage", "--specs-dir", str(specs_dir), "--json"]
+        )
+        assert result.exit_code == 1
+        payload = json.loads(result.output)
+        assert payload["tasks"][0] == {
+            "id": "1.1",
+            "references": ["@login-success", "@login-failure"],
+            "covered": [0, 1],
+        }
+        assert payload["uncovered"] == [2, 3]
+        assert payload["dangling"] == [{"task": "1.2", "tag": "@login-sucess"}]
@@ -0,0 +1,176 @@
+"""Unit tests for the validation daemon, its client and the warm scan cache."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pb_spec import __version__
+from pb_spec.cli import main
+from pb_spec.daemon import serve
+from pb_spec.daemon_client import SOCKET_ENV, request_validation, send_request
+from pb_spec.validation.result import ErrorSeverity, ValidationError, ValidationResult
+from pb_spec.validation.scanner import CodeScanner, ScanCache
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    """Run a daemon on a short socket path (AF_UNIX paths are length-limited)."""
+    directory = Path(tempfile.mkdtemp(prefix="pbs-", dir="/tmp"))
+    path = directory / "d.sock"
+    thread = threading.Thread(target=serve, args=(path,), kwargs={"idle_timeout": 0})
+    thread.start()
+    deadline = time.monotonic() + 5
+    while send_request({"command": "ping"}, path, timeout=1.0) is None:
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.01)
+    yield path
+    send_request({"command": "shutdown"}, path, timeout=1.0)
+    thread.join(timeout=5)
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def git_project(tmp_path: Path) -> Path:
+    """Create a git repository with one untracked file containing a TODO."""
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    (tmp_path / "app.py").write_text("x = 1  # TODO: finish\n")
+    os.utime(tmp_path / "app.py", ns=(1, 1))  # not racily clean, so scans are cached
+    return tmp_path
+
+
+class TestScanCache:
+    """Tests for ScanCache reuse in CodeScanner."""
+
+    def test_unchanged_files_hit(self, tmp_path: Path) -> None:
+        """Test that a second scan reuses results until the file changes."""
+        target = tmp_path / "app.py"
+        target.write_text("# TODO: one\n")
+        os.utime(target, ns=(1, 1))
+        cache = ScanCache()
+
+        def scan() -> int:
+            scanner = CodeScanner(root_dir=tmp_path, target_files={target}, cache=cache)
+            return len(scanner.scan().issues)
+
+        assert scan() == 1
+        assert scan() == 1
+        assert cache.hits == 1
+        target.write_text("# TODO: one\n# TODO: two\n")
+        assert scan() == 2
+
+    def test_racily_clean_files_are_not_cached(self, tmp_path: Path) -> None:
+        """Test that files modified just now are rescanned instead of cached."""
+        target = tmp_path / "app.py"
+        target.write_text("# TODO: one\n")
+        cache = ScanCache()
+        for _ in range(2):
+            CodeScanner(root_dir=tmp_path, target_files={target}, cache=cache).scan()
+        assert cache.hits == 0
+        assert len(cache) == 0
+
+    def test_entry_uses_stat_taken_before_read(self, tmp_path: Path) -> None:
+        """Test that an edit after the pre-read stat invalidates the stored entry."""
+        target = tmp_path / "app.py"
+        target.write_text("# TODO: one\n")
+        os.utime(target, ns=(1, 1))
+        before = target.stat()
+        cache = ScanCache()
+        cache.store(tmp_path, target, before, [])
+        target.write_text("# TODO: one\n# TODO: two\n")
+        os.utime(target, ns=(2, 2))
+        assert cache.lookup(tmp_path, target, target.stat()) is None
+
+
+class TestValidationResultSerialisation:
+    """Tests for ValidationResult.to_dict/from_dict."""
+
+    def test_round_trip(self) -> None:
+        """Test that results survive the JSON wire format."""
+        result = ValidationResult(
+            is_valid=False,
+            errors=[ValidationError("bad", ErrorSeverity.HIGH, "f.py", 3, "Status:")],
+            warnings=["careful"],
+        )
+        assert ValidationResult.from_dict(result.to_dict()) == result
+
+
+class TestDaemon:
+    """Tests for the daemon server and client."""
+
+    def test_ping_reports_version(self, socket_path: Path) -> None:
+        """Test that ping returns the daemon's version and pid."""
+        reply = send_request({"command": "ping"}, socket_path)
+        assert reply is not None
+        assert reply["ok"] is True
+        assert reply["version"] == __version__
+
+    def test_validate_task_is_warm(
+        self, socket_path: Path, git_project: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that repeat task validations are served from the scan cache."""
+        monkeypatch.setenv(SOCKET_ENV, str(socket_path))
+        payload = {"mode": "task", "root": str(git_project)}
+        first = request_validation(payload)
+        second = request_validation(payload)
+        assert first is not None and second is not None
+        assert ValidationResult.from_dict(second["result"]).errors[0].file_path == "app.py"
+        stats = send_request({"command": "stats"}, socket_path)
+        assert stats is not None
+        assert stats["scan_cache"]["hits"] >= 1
+
+    def test_socket_is_private(self, socket_path: Path) -> None:
+        """Test that the daemon socket is only accessible to its owner."""
+        assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
+
+    def test_untrusted_socket_is_refused(
+        self, socket_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the client ignores sockets other users could have created or opened."""
+        os.chmod(socket_path, 0o666)
+        assert send_request({"command": "ping"}, socket_path) is None
+        os.chmod(socket_path, 0o600)
+        uid = os.getuid()
+        monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+        assert send_request({"command": "ping"}, socket_path) is None
+        monkeypatch.undo()
+        assert send_request({"command": "ping"}, socket_path) is not None
+
+    def test_version_mismatch_is_declined(self, socket_path: Path) -> None:
+        """Test that a daemon running another version is not used."""
+        reply = send_request({"command": "validate", "version": "0.0.0-other"}, socket_path)
+        assert reply is not None and reply["ok"] is False
+
+    def test_cli_forwards_to_daemon(
+        self, socket_path: Path, git_project: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that validate --task uses a running daemon without loading the local stack."""
+        monkeypatch.setenv(SOCKET_ENV, str(socket_path))
+        monkeypatch.chdir(git_project)
+        monkeypatch.setitem(sys.modules, "pb_spec.commands.validate_local", None)
+        result = CliRunner().invoke(main, ["validate", "--task"])
+        assert result.exit_code == 1
+        assert "app.py" in result.output
+        stats = send_request({"command": "stats"}, socket_path)
+        assert stats is not None and stats["requests"] >= 2
+
+    def test_cli_falls_back_without_daemon(
+        self, git_project: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that validation runs in-process when no daemon is listening."""
+        monkeypatch.setenv(SOCKET_ENV, str(git_project / "missing.sock"))
+        monkeypatch.chdir(git_project)
+        result = CliRunner().invoke(main, ["validate", "--task"])
+        assert result.exit_code == 1
+        assert "Todo found" in result.output
@@ -0,0 +1,116 @@
+"""Unit tests for DependsOn parsing, cycle detection and wave scheduling."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from pb_spec.cli import main
+from pb_spec.validation.dag import (
+    build_task_graph,
+    compute_waves,
+    parse_dependency_references,
+)
+from pb_spec.validation.parser import parse_task_blocks
+from pb_spec.validation.plan import validate_tasks_structure
+
+
+def _task(task_id: str, depends_on: str, alias: str | None = None) -> str:
+    lines = [f"### Task {task_id}: Task {task_id}"]
+    if alias:
+        lines.append(f"TaskID: {alias}")
+    lines += [
+        f"DependsOn: {depends_on}",
+        "Context: Build.",
+        "Verification: Run tests.",
+        "Scenario Coverage: N/A",
+        "Status: 🔴 TODO",
+        "- [ ] Step 1",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+DIAMOND_TASKS = (
+    "# Tasks\n\n"
+    + _task("1.1", "None", alias="T1")
+    + _task("1.2", "T1")
+    + _task("1.3", "Task 1.1")
+    + _task("2.1", "Task 1.2, Task 1.3")
+    + _task("2.2", "None")
+)
+
+
+class TestParseDependencyReferences:
+    """Tests for parse_dependency_references."""
+
+    def test_none_means_no_dependencies(self) -> None:
+        """Test that None and N/A produce no references."""
+        assert parse_dependency_references("None") == []
+        assert parse_dependency_references("`None`") == []
+        assert parse_dependency_references("") == []
+
+    def test_mixed_reference_styles(self) -> None:
+        """Test that Task prefixes, aliases and punctuation are normalised."""
+        assert parse_dependency_references("Task 1.1, `T2` and Task 1.3.") == ["1.1", "T2", "1.3"]
+
+
+class TestComputeWaves:
+    """Tests for build_task_graph and compute_waves."""
+
+    def test_diamond_waves_and_critical_path(self) -> None:
+        """Test that independent tasks share a wave and the critical path is longest."""
+        graph = build_task_graph(parse_task_blocks(DIAMOND_TASKS))
+        assert graph.dependencies["1.2"] == ["1.1"]
+        schedule = compute_waves(graph)
+        assert schedule.waves == [["1.1", "2.2"], ["1.2", "1.3"], ["2.1"]]
+        assert schedule.critical_path == ["1.1", "1.2", "2.1"]
+        assert schedule.max_parallelism == 2
+        assert schedule.cyclic == []
+
+    def test_cycle_is_detected(self) -> None:
+        """Test that tasks on and behind a cycle never become ready."""
+        tasks = _task("1.1", "1.2") + _task("1.2", "1.1") + _task("1.3", "1.2") + _task("1.4", "")
+        schedule = compute_waves(build_task_graph(parse_task_blocks(tasks)))
+        assert schedule.waves == [["1.4"]]
+        assert schedule.cyclic == ["1.1", "1.2", "1.3"]
+
+    def test_dangling_reference_is_reported(self) -> None:
+        """Test that unknown task IDs are collected as dangling."""
+        graph = build_task_graph(parse_task_blocks(_task("1.1", "Task 9.9")))
+        assert [(d.task_id, d.reference) for d in graph.dangling] == [("1.1", "9.9")]
+
+
+class TestValidateDependencies:
+    """Tests for DependsOn checks in validate_tasks_structure."""
+
+    def test_valid_dag_passes(self, tmp_path: Path) -> None:
+        """Test that an acyclic graph with known references passes."""
+        (tmp_path / "tasks.md").write_text(DIAMOND_TASKS)
+        assert validate_tasks_structure(tmp_path).is_valid is True
+
+    def test_cycle_fails(self, tmp_path: Path) -> None:
+        """Test that a dependency cycle is a validation error."""
+        (tmp_path / "tasks.md").write_text(_task("1.1", "1.2") + _task("1.2", "1.1"))
+        result = validate_tasks_structure(tmp_path)
+        assert result.is_valid is False
+        assert any("cycle" in e.message for e in result.errors)
+
+
+class TestPlanWavesCommand:
+    """Tests for `pb-spec plan waves`."""
+
+    def test_json_schedule(self, tmp_path: Path) -> None:
+        """Test that the JSON schedule carries waves and the critical-path length."""
+        spec_dir = tmp_path / "specs" / "2026-01-01-dag"
+        spec_dir.mkdir(parents=True)
+        (spec_dir / "tasks.md").write_text(DIAMOND_TASKS)
+        result = CliRunner().invoke(
+            main, ["plan", "waves", "--specs-dir", str(tmp_path / "specs"), "--json"]
+        )
+        assert result.exit_code == 0
+        payload = json.loads(result.output)
+        assert payload["waves"] == [["1.1", "2.2"], ["1.2", "1.3"], ["2.1"]]
+        assert payload["critical_path_length"] == 3
@@ -0,0 +1,133 @@
+"""Unit tests for the Gherkin lexer and scenario catalog."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pb_spec.validation.build import validate_build
+from pb_spec.validation.gherkin import (
+    PARALLEL_FILE_THRESHOLD,
+    TokenKind,
+    build_scenario_catalog,
+    find_files_without_scenarios,
+    has_scenario,
+    iter_gherkin_tokens,
+)
+
+FEATURE_CONTENT = (
+    "@feature-tag\n"
+    "Feature: Login\n"
+    "  Users log in. A Scenario mentioned in prose is not a heading.\n"
+    "\n"
+    "  Background:\n"
+    "    Given a user\n"
+    "\n"
+    "  @login-success @smoke\n"
+    "  Scenario: Successful login\n"
+    '    Given a doc string\n      """\n      Scenario: not a heading\n      """\n'
+    "\n"
+    "  Rule: Lockout\n"
+    "    Scenario Outline: Locked after <n> attempts\n"
+    "      When I fail <n> times\n"
+    "      @login-lockout\n"
+    "      Examples:\n"
+    "        | n |\n"
+    "        | 3 |\n"
+)
+
+
+class TestLexer:
+    """Tests for iter_gherkin_tokens."""
+
+    def test_tokens_have_kinds_and_line_numbers(self) -> None:
+        """Test that structural elements are lexed with line numbers."""
+        tokens = list(iter_gherkin_tokens(FEATURE_CONTENT.splitlines()))
+        kinds = [t.kind for t in tokens]
+        assert kinds == [
+            TokenKind.TAGS,
+            TokenKind.FEATURE,
+            TokenKind.BACKGROUND,
+            TokenKind.TAGS,
+            TokenKind.SCENARIO,
+            TokenKind.RULE,
+            TokenKind.SCENARIO_OUTLINE,
+            TokenKind.TAGS,
+            TokenKind.EXAMPLES,
+        ]
+        scenario = tokens[4]
+        assert scenario.text == "Successful login"
+        assert scenario.line_number == 9
+
+    def test_prose_and_doc_strings_are_not_headings(self) -> None:
+        """Test that 'Scenario' in prose or doc strings is not a scenario token."""
+        content = 'Feature: X\n  Scenario text in prose\n  """\n  Scenario: no\n  """\n'
+        tokens = list(iter_gherkin_tokens(content.splitlines()))
+        assert [t.kind for t in tokens] == [TokenKind.FEATURE]
+
+
+class TestScenarioCatalog:
+    """Tests for build_scenario_catalog."""
+
+    def test_catalog_indexes_tags_and_names(self, tmp_path: Path) -> None:
+        """Test that scenarios are indexed by own tags, Examples tags and name."""
+        feature = tmp_path / "login.feature"
+        feature.write_text(FEATURE_CONTENT)
+        catalog = build_scenario_catalog([feature])
+
+        assert len(catalog.scenarios) == 2
+        assert catalog.find_by_tag("@login-success")[0].name == "Successful login"
+        assert catalog.find_by_tag("login-lockout")[0].is_outline is True
+        assert catalog.find_by_tag("@login-lockout")[0].rule == "Lockout"
+        assert catalog.find_by_tag("@feature-tag") == []
+        assert catalog.find_by_name("Successful login")[0].line_number == 9
+        assert catalog.scenario_counts[str(feature)] == 2
+
+    def test_catalog_parallel_matches_serial_order(self, tmp_path: Path) -> None:
+        """Test that parallel parsing keeps a deterministic file order."""
+        files = []
+        for i in range(PARALLEL_FILE_THRESHOLD + 4):
+            path = tmp_path / f"f{i:03d}.feature"
+            path.write_text(f"Feature: F{i}\n  @s-{i}\n  Scenario: S{i}\n")
+            files.append(path)
+        catalog = build_scenario_catalog(reversed(files))
+        assert [s.name for s in catalog.scenarios] == [f"S{i}" for i in range(len(files))]
+        assert catalog.find_by_tag(f"@s-{len(files) - 1}")[0].file_path == str(files[-1])
+
+
+class TestScenarioPresence:
+    """Tests for has_scenario and find_files_without_scenarios."""
+
+    def test_has_scenario_true(self, tmp_path: Path) -> None:
+        """Test that a scenario heading is detected."""
+        feature = tmp_path / "a.feature"
+        feature.write_text(FEATURE_CONTENT)
+        assert has_scenario(feature) is True
+
+    def test_prose_mention_is_not_a_scenario(self, tmp_path: Path) -> None:
+        """Test that a file mentioning Scenario only in prose has no scenario."""
+        feature = tmp_path / "a.feature"
+        feature.write_text("Feature: X\n  Scenarios will be added later.\n")
+        assert has_scenario(feature) is False
+        assert find_files_without_scenarios([feature]) == [(feature, None)]
+
+    def test_unreadable_file_reports_error(self, tmp_path: Path) -> None:
+        """Test that undecodable files are returned with their read error."""
+        feature = tmp_path / "bad.feature"
+        feature.write_bytes(b"\xff\xfe Feature")
+        [(path, error)] = find_files_without_scenarios([feature])
+        assert path == feature
+        assert error is not None
+
+    def test_build_rejects_feature_without_heading(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that validate_build flags a feature whose only 'Scenario' is prose."""
+        spec_dir = tmp_path / "specs" / "test"
+        (spec_dir / "features").mkdir(parents=True)
+        (spec_dir / "tasks.md").write_text("### Task 1.1: T\nStatus: 🟢 DONE\n- [x] Step 1\n")
+        (spec_dir / "features" / "x.feature").write_text("Feature: X\n  Scenarios TBD.\n")
+        monkeypatch.chdir(tmp_path)
+        result = validate_build(spec_dir)
+        assert any("contains no Scenario definition" in e.message for e in result.errors)
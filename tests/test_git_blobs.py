@@ -0,0 +1,109 @@
+"""Unit tests for scanning git revisions and the index without a checkout."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pb_spec.cli import main
+from pb_spec.exceptions import GitError
+from pb_spec.git_utils import GitBlobs
+from pb_spec.validation.build import validate_task
+from pb_spec.validation.scanner import CodeScanner, ScanCache
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=root, check=True
+    )
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Create a repository whose commit, index and working tree all differ."""
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "app.py").write_text("x = 1\n")
+    (tmp_path / "lib.py").write_text("y = 2\n")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    (tmp_path / "app.py").write_text("x = 1\n# TODO: staged\n")
+    _git(tmp_path, "add", "app.py")
+    (tmp_path / "app.py").write_text("x = 1\n")
+    return tmp_path
+
+
+class TestGitBlobs:
+    """Tests for GitBlobs."""
+
+    def test_reads_revision_and_index(self, repo: Path) -> None:
+        """Test that the commit and the index are read instead of the working tree."""
+        with GitBlobs(repo, "HEAD") as head, GitBlobs(repo) as index:
+            assert set(head.oids) == {"app.py", "lib.py"}
+            assert head.read(head.oids["app.py"]) == b"x = 1\n"
+            assert index.read(index.oids["app.py"]) == b"x = 1\n# TODO: staged\n"
+            assert index.oid(repo / "missing.py") is None
+            assert index.read("0" * 40) is None
+
+    def test_changed_files(self, repo: Path) -> None:
+        """Test that a root commit changes every file and the index only staged ones."""
+        with GitBlobs(repo, "HEAD") as head, GitBlobs(repo) as index:
+            assert head.changed_files() == {repo / "app.py", repo / "lib.py"}
+            assert index.changed_files() == {repo / "app.py"}
+
+    def test_bad_revision_raises(self, repo: Path) -> None:
+        """Test that unknown or option-like revisions raise GitError."""
+        with pytest.raises(GitError, match="ls-tree failed"):
+            GitBlobs(repo, "no-such-ref")
+        with pytest.raises(GitError, match="Invalid revision"):
+            GitBlobs(repo, "--output=x")
+
+
+class TestBlobScan:
+    """Tests for scanning through GitBlobs."""
+
+    def test_scans_staged_content_and_caches_by_blob(self, repo: Path) -> None:
+        """Test that only the staged TODO is found and a rescan hits the cache."""
+        assert not CodeScanner(root_dir=repo).scan().has_issues
+        cache = ScanCache()
+        with GitBlobs(repo) as index:
+            result = CodeScanner(root_dir=repo, cache=cache, blobs=index).scan()
+            assert [issue.line_content for issue in result.issues] == ["# TODO: staged"]
+            CodeScanner(root_dir=repo, cache=cache, blobs=index).scan()
+        assert cache.hits == 2
+
+    def test_task_scans_changed_files(self, repo: Path) -> None:
+        """Test that validate_task limits the scan to what the source changed."""
+        (repo / "lib.py").write_text("y = 2  # TODO: unstaged\n")
+        with GitBlobs(repo) as index:
+            result = validate_task(repo, blobs=index)
+        assert [error.file_path for error in result.errors] == ["app.py"]
+
+
+class TestRevisionOptions:
+    """Tests for validate --rev and --staged."""
+
+    def test_task_staged_and_rev(self, repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that --staged fails on the staged TODO while --rev HEAD passes."""
+        monkeypatch.chdir(repo)
+        runner = CliRunner()
+        staged = runner.invoke(main, ["validate", "--task", "--staged"])
+        assert staged.exit_code == 1
+        assert "TODO: staged" in staged.output
+        assert runner.invoke(main, ["validate", "--task", "--rev", "HEAD"]).exit_code == 0
+
+    def test_rejects_invalid_combinations(
+        self, repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that conflicting options and unknown revisions exit with status 1."""
+        monkeypatch.chdir(repo)
+        runner = CliRunner()
+        both = runner.invoke(main, ["validate", "--task", "--rev", "HEAD", "--staged"])
+        assert "mutually exclusive" in both.output
+        watch = runner.invoke(main, ["validate", "--task", "--staged", "--watch"])
+        assert "without --watch" in watch.output
+        missing = runner.invoke(main, ["validate", "--task", "--rev", "nope"])
+        assert missing.exit_code == 1
+        assert "git ls-tree failed" in missing.output
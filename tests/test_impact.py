@@ -0,0 +1,136 @@
+"""Unit tests for import-graph test impact analysis."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from pb_spec.cli import main
+from pb_spec.orchestration.impact import (
+    ImportGraph,
+    module_names,
+    parse_imports,
+    resolve_imports,
+    select_impacted,
+)
+
+
+def _write(root: Path, files: dict[str, str]) -> None:
+    for relative, content in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+PROJECT = {
+    "src/app/__init__.py": "",
+    "src/app/core.py": "VALUE = 1\n",
+    "src/app/api.py": "from .core import VALUE\n",
+    "src/app/cli.py": "import app.api\n",
+    "src/app/other.py": "import json\n",
+    "tests/conftest.py": "",
+    "tests/test_api.py": "from app.api import VALUE\n",
+    "tests/test_cli.py": "from app import cli\n",
+    "tests/test_other.py": "from app.other import json\n",
+    "features/api.feature": "Feature: API\n",
+    "features/steps/api_steps.py": "from app import api\n",
+}
+
+
+class TestImportParsing:
+    """Tests for import extraction and resolution."""
+
+    def test_module_names_per_source_root(self) -> None:
+        """Test that files under src/ are importable by their package path."""
+        assert module_names("src/app/api.py", ("src", "")) == ["app.api", "src.app.api"]
+        assert module_names("src/app/__init__.py", ("src",)) == ["app"]
+        assert module_names("my-scripts/run.py", ("",)) == []
+
+    def test_relative_imports_resolve_against_package(self) -> None:
+        """Test that relative imports and enclosing packages are resolved."""
+        records = parse_imports("from . import core\nfrom ..util.io import read\n")
+        resolved = resolve_imports(records, "app.sub.mod", is_package=False)
+        assert {"app.sub", "app.sub.core", "app.util.io", "app.util.io.read", "app"} <= resolved
+
+    def test_syntax_errors_yield_no_imports(self) -> None:
+        """Test that unparsable files do not abort the scan."""
+        assert parse_imports("def broken(:\n") == []
+
+
+class TestSelectImpacted:
+    """Tests for select_impacted."""
+
+    def test_transitive_dependents(self, tmp_path: Path) -> None:
+        """Test that a change selects tests importing it directly or transitively."""
+        _write(tmp_path, PROJECT)
+        graph = ImportGraph(tmp_path).build()
+        selection = select_impacted(tmp_path, graph, ["src/app/core.py"])
+        assert selection.test_files == ["tests/test_api.py", "tests/test_cli.py"]
+        assert selection.feature_files == ["features/api.feature"]
+
+    def test_unrelated_change_selects_only_its_tests(self, tmp_path: Path) -> None:
+        """Test that an isolated module selects only the tests importing it."""
+        _write(tmp_path, PROJECT)
+        graph = ImportGraph(tmp_path).build()
+        selection = select_impacted(tmp_path, graph, ["src/app/other.py", "README.md"])
+        assert selection.test_files == ["tests/test_other.py"]
+        assert selection.feature_files == []
+        assert selection.unmapped == ["README.md"]
+
+    def test_conftest_selects_its_directory(self, tmp_path: Path) -> None:
+        """Test that a conftest change selects every test below it."""
+        _write(tmp_path, PROJECT)
+        graph = ImportGraph(tmp_path).build()
+        selection = select_impacted(tmp_path, graph, ["tests/conftest.py"])
+        assert len(selection.test_files) == 3
+
+
+class TestImportGraphCache:
+    """Tests for the per-file import cache."""
+
+    def test_only_changed_files_are_reparsed(self, tmp_path: Path) -> None:
+        """Test that a warm cache re-parses only files whose content changed."""
+        _write(tmp_path, PROJECT)
+        cache_path = tmp_path / ".pb-spec" / "import-graph.json"
+        assert ImportGraph(tmp_path, cache_path).build().parsed == 10
+        assert ImportGraph(tmp_path, cache_path).build().parsed == 0
+
+        (tmp_path / "src/app/other.py").write_text("from app import core\n")
+        graph = ImportGraph(tmp_path, cache_path).build()
+        assert graph.parsed == 1
+        selection = select_impacted(tmp_path, graph, ["src/app/core.py"])
+        assert "tests/test_other.py" in selection.test_files
+
+
+class TestImpactCommand:
+    """Tests for `pb-spec impact`."""
+
+    def test_pytest_format(self, tmp_path: Path) -> None:
+        """Test that --format pytest prints selected test paths one per line."""
+        _write(tmp_path, PROJECT)
+        result = CliRunner().invoke(
+            main,
+            [
+                "impact",
+                "--root",
+                str(tmp_path),
+                "--changed",
+                "src/app/api.py",
+                "--format",
+                "pytest",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        assert result.output.splitlines() == ["tests/test_api.py", "tests/test_cli.py"]
+
+    def test_json_format(self, tmp_path: Path) -> None:
+        """Test that --format json reports tests and features."""
+        _write(tmp_path, PROJECT)
+        result = CliRunner().invoke(
+            main,
+            ["impact", "--root", str(tmp_path), "--changed", "src/app/api.py", "--format", "json"],
+        )
+        payload = json.loads(result.output)
+        assert payload["features"] == ["features/api.feature"]
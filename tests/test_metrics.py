@@ -0,0 +1,132 @@
+"""Unit tests for the OpenMetrics textfile export."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pb_spec.cli import main
+from pb_spec.daemon import DaemonState
+from pb_spec.metrics import MetricsCollector, MetricsFile, task_status_counts
+from pb_spec.validation.pipeline import Phase, run_phases
+from pb_spec.validation.result import ErrorSeverity, ValidationError, ValidationResult
+from pb_spec.validation.scanner import IssueType, ScanStats
+
+FAILED = ValidationResult(
+    is_valid=False,
+    errors=[ValidationError(message="Todo found", severity=ErrorSeverity.LOW)],
+)
+
+
+def _samples(text: str) -> dict[str, str]:
+    """Map each sample's name and labels to its value."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            key, _, value = line.rpartition(" ")
+            samples[key] = value
+    return samples
+
+
+class TestMetricsCollector:
+    """Tests for MetricsCollector rendering."""
+
+    def test_counters_and_histograms_accumulate(self) -> None:
+        """Test that runs accumulate while gauges keep the last run's values."""
+        collector = MetricsCollector()
+        stats = ScanStats(count_patterns=False)
+        stats.files_enumerated = 7
+        stats.issues_by_type[IssueType.TODO] = 1
+        collector.observe("build", "demo", FAILED, 0.02, stats, {"scan": 0.3})
+        collector.observe("build", "demo", ValidationResult(is_valid=True), 0.2)
+
+        text = collector.render()
+        samples = _samples(text)
+        labels = 'mode="build",spec="demo"'
+        assert samples[f'pb_spec_validation_runs_total{{{labels},result="fail"}}'] == "1"
+        assert samples[f'pb_spec_validation_runs_total{{{labels},result="pass"}}'] == "1"
+        assert samples[f"pb_spec_files_enumerated{{{labels}}}"] == "7"
+        assert samples[f'pb_spec_scan_issues{{{labels},type="todo"}}'] == "1"
+        assert samples[f'pb_spec_errors{{{labels},severity="low"}}'] == "0"
+        total = f'pb_spec_phase_duration_seconds_bucket{{{labels},phase="total",le='
+        assert samples[total + '"0.025"}'] == "1"
+        assert samples[total + '"0.25"}'] == "2"
+        assert samples[total + '"+Inf"}'] == "2"
+        assert samples[f'pb_spec_phase_duration_seconds_count{{{labels},phase="scan"}}'] == "1"
+        assert text.endswith("# EOF\n")
+
+    def test_label_values_are_escaped(self) -> None:
+        """Test that quotes and backslashes in spec names are escaped."""
+        collector = MetricsCollector()
+        collector.observe("plan", 'odd"\\name', FAILED, 0.1)
+        assert 'spec="odd\\"\\\\name"' in collector.render()
+
+    def test_write_replaces_atomically(self, tmp_path: Path) -> None:
+        """Test that write leaves only the target file behind and clears dirty."""
+        collector = MetricsCollector()
+        collector.observe("task", "", FAILED, 0.1)
+        target = tmp_path / "textfile" / "pb_spec.prom"
+        collector.write(target)
+        assert not collector.dirty
+        assert [p.name for p in target.parent.iterdir()] == ["pb_spec.prom"]
+        assert "pb_spec_validation_runs_total" in target.read_text()
+
+
+class TestSources:
+    """Tests for the inputs metrics are built from."""
+
+    def test_task_status_counts(self, tmp_path: Path) -> None:
+        """Test that statuses are counted without their emoji markers."""
+        (tmp_path / "tasks.md").write_text(
+            "### Task 1.1: A\nStatus: 🟢 DONE\n- [x] s\n"
+            "### Task 1.2: B\nStatus: 🟡 IN PROGRESS\n- [ ] s\n"
+            "### Task 1.3: C\nStatus: 🟢 DONE\n- [x] s\n"
+        )
+        assert task_status_counts(tmp_path) == {"DONE": 2, "IN PROGRESS": 1}
+
+    def test_run_phases_records_timings(self) -> None:
+        """Test that run_phases stores each phase's duration when asked."""
+        timings: dict[str, float] = {}
+        run_phases([Phase("a", lambda _: 1), Phase("b", lambda _: 2, ("a",))], timings=timings)
+        assert set(timings) == {"a", "b"}
+
+
+class TestMetricsExport:
+    """Tests for --metrics-file on validate and the daemon."""
+
+    def test_validate_writes_metrics(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that validate --build writes scan, task and phase metrics."""
+        spec_dir = tmp_path / "specs" / "2026-01-01-demo"
+        spec_dir.mkdir(parents=True)
+        (spec_dir / "tasks.md").write_text("### Task 1.1: A\nStatus: 🟢 DONE\n- [x] s\n")
+        (tmp_path / "app.py").write_text("x = 1  # TODO: later\n")
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        monkeypatch.chdir(tmp_path)
+        target = tmp_path / "out.prom"
+
+        CliRunner().invoke(main, ["validate", "--build", "--metrics-file", str(target)])
+
+        samples = _samples(target.read_text())
+        labels = 'mode="build",spec="2026-01-01-demo"'
+        assert samples[f"pb_spec_files_scanned{{{labels}}}"] == "1"
+        assert samples[f'pb_spec_tasks{{{labels},status="DONE"}}'] == "1"
+        assert f'pb_spec_phase_duration_seconds_count{{{labels},phase="scan"}}' in samples
+
+    def test_daemon_records_and_flushes(self, tmp_path: Path) -> None:
+        """Test that daemon validations are recorded and written on flush."""
+        (tmp_path / "app.py").write_text("x = 1  # TODO: later\n")
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        metrics = MetricsFile(tmp_path / "daemon.prom")
+        state = DaemonState(metrics)
+
+        state.handle(
+            {"command": "validate", "version": state.version, "mode": "task", "root": str(tmp_path)}
+        )
+        assert not metrics.path.exists()
+        metrics.flush()
+
+        samples = _samples(metrics.path.read_text())
+        assert samples['pb_spec_scan_issues{mode="task",spec="",type="todo"}'] == "1"
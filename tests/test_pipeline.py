@@ -0,0 +1,62 @@
+"""Unit tests for the concurrent validation phase pipeline."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from pb_spec.validation.pipeline import Phase, merge_results, run_phases
+from pb_spec.validation.result import ErrorSeverity, ValidationError, ValidationResult
+
+
+class TestRunPhases:
+    """Tests for run_phases."""
+
+    def test_dependencies_receive_results(self) -> None:
+        """Test that a phase sees the results of the phases it depends on."""
+        phases = [
+            Phase("sum", lambda r: r["a"] + r["b"], depends_on=("a", "b")),
+            Phase("a", lambda _: 1),
+            Phase("b", lambda _: 2),
+        ]
+        assert run_phases(phases) == {"a": 1, "b": 2, "sum": 3}
+
+    def test_independent_phases_overlap(self) -> None:
+        """Test that independent phases run at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+        phases = [Phase(name, lambda _: barrier.wait()) for name in ("a", "b", "c")]
+        started = time.perf_counter()
+        run_phases(phases)
+        assert time.perf_counter() - started < 5
+
+    def test_cycle_and_unknown_dependency(self) -> None:
+        """Test that malformed graphs are rejected."""
+        with pytest.raises(ValueError, match="cycle"):
+            run_phases([Phase("a", lambda _: 1, ("b",)), Phase("b", lambda _: 2, ("a",))])
+        with pytest.raises(ValueError, match="unknown"):
+            run_phases([Phase("a", lambda _: 1, ("missing",))])
+
+    def test_exceptions_propagate(self) -> None:
+        """Test that a failing phase raises from run_phases."""
+
+        def fail(_: object) -> None:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            run_phases([Phase("a", fail), Phase("b", lambda _: 1)])
+
+
+class TestMergeResults:
+    """Tests for merge_results."""
+
+    def test_keeps_order(self) -> None:
+        """Test that errors and warnings concatenate in phase order."""
+        first = ValidationResult(False, [ValidationError("x", ErrorSeverity.LOW)], ["w1"])
+        second = ValidationResult(True, [], ["w2"])
+        merged = merge_results([first, second])
+        assert not merged.is_valid
+        assert [e.message for e in merged.errors] == ["x"]
+        assert merged.warnings == ["w1", "w2"]
+        assert merge_results([second]).is_valid
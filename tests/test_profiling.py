@@ -0,0 +1,125 @@
+"""Unit tests for timing spans, trace export and the profiling CLI options."""
+
+from __future__ import annotations
+
+import json
+import pstats
+import subprocess
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pb_spec import profiling
+from pb_spec.cli import main
+from pb_spec.profiling import Recorder, profiling_session, span, traced
+
+
+@pytest.fixture(autouse=True)
+def _disabled() -> Iterator[None]:
+    """Leave profiling disabled after every test."""
+    yield
+    profiling.disable()
+
+
+@traced("double")
+def _double(value: int) -> int:
+    return value * 2
+
+
+class TestSpans:
+    """Tests for span, traced and Recorder."""
+
+    def test_disabled_span_is_shared_null_context(self) -> None:
+        """Test that disabled spans allocate nothing and record nothing."""
+        assert span("a") is span("b")
+        assert _double(2) == 4
+        assert not profiling.is_enabled()
+
+    def test_enabled_records_spans_from_threads(self) -> None:
+        """Test that spans from worker threads are recorded with their thread."""
+        recorder = profiling.enable()
+        with span("outer", "detail"):
+            worker = threading.Thread(target=_double, args=(1,), name="worker")
+            worker.start()
+            worker.join()
+        names = {event.name for event in recorder.events}
+        assert names == {"outer", "double"}
+        assert "worker" in recorder.thread_names.values()
+
+    def test_summary_aggregates_by_name(self) -> None:
+        """Test that summary counts calls per span name, slowest first."""
+        recorder = profiling.enable()
+        for _ in range(3):
+            _double(1)
+        with span("slow"):
+            sum(range(100_000))
+        summary = recorder.summary()
+        assert [s.name for s in summary] == ["slow", "double"]
+        assert summary[1].calls == 3
+
+    def test_chrome_trace_format(self) -> None:
+        """Test that the trace uses complete events with microsecond times."""
+        recorder = Recorder()
+        with recorder.span("phase", "src/a.py"):
+            pass
+        events = recorder.chrome_trace()["traceEvents"]
+        complete = [e for e in events if e["ph"] == "X"]
+        assert complete[0]["name"] == "phase"
+        assert complete[0]["args"] == {"detail": "src/a.py"}
+        assert complete[0]["dur"] >= 0
+        assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in events)
+
+
+class TestProfilingSession:
+    """Tests for profiling_session."""
+
+    def test_writes_all_outputs(self, tmp_path: Path) -> None:
+        """Test that trace, cProfile and tracemalloc outputs are written on exit."""
+        trace, stats, memory = tmp_path / "t.json", tmp_path / "p.prof", tmp_path / "m.txt"
+        with profiling_session(True, trace, stats, memory) as recorder:
+            assert recorder is not None
+            _double(3)
+        assert not profiling.is_enabled()
+        assert json.loads(trace.read_text())["traceEvents"]
+        assert pstats.Stats(str(stats)).get_stats_profile().func_profiles
+        assert memory.read_text().startswith("current:")
+
+    def test_no_recorder_without_spans(self) -> None:
+        """Test that a cProfile-only session does not enable spans."""
+        with profiling_session() as recorder:
+            assert recorder is None
+            assert not profiling.is_enabled()
+
+
+class TestProfileOptions:
+    """Tests for validate --profile, --trace and --scan-stats."""
+
+    def test_profile_and_trace(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that --profile prints a phase summary and --trace writes spans."""
+        spec_dir = tmp_path / "specs" / "2026-01-01-demo"
+        spec_dir.mkdir(parents=True)
+        (spec_dir / "tasks.md").write_text(
+            "# Tasks\n\n### Task 1.1: Done\nStatus: 🟢 DONE\n- [x] Step 1\n"
+        )
+        monkeypatch.chdir(tmp_path)
+        trace = tmp_path / "trace.json"
+        result = CliRunner().invoke(
+            main, ["validate", "--build", "--profile", "--trace", str(trace)]
+        )
+        assert "validate_build" in result.output
+        names = {event["name"] for event in json.loads(trace.read_text())["traceEvents"]}
+        assert {"validate_build", "phase scan", "parse_task_blocks", "report"} <= names
+
+    def test_scan_stats(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that --scan-stats reports rule costs, slow files and throughput."""
+        (tmp_path / "app.py").write_text("# TODO: later\n")
+        monkeypatch.chdir(tmp_path)
+        subprocess.run(["git", "init", "-q"], check=True)
+        subprocess.run(["git", "add", "-A"], check=True)
+        result = CliRunner().invoke(main, ["validate", "--task", "--scan-stats"])
+        assert "todo: TODO:" in result.output
+        assert "app.py" in result.output
+        assert ".py" in result.output and "MiB/s" in result.output
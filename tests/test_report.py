@@ -0,0 +1,122 @@
+"""Unit tests for validation result reporting."""
+
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from pb_spec.commands.report import AgentReport, JsonlWriter, report_scan_result
+from pb_spec.validation.result import ErrorSeverity, ValidationError, ValidationResult
+
+
+def _error(index: int, severity: ErrorSeverity = ErrorSeverity.LOW) -> ValidationError:
+    return ValidationError(
+        message=f"Todo found: # TODO {index}",
+        severity=severity,
+        file_path="app.py",
+        line_number=index,
+    )
+
+
+class TestJsonlWriter:
+    """Tests for JsonlWriter."""
+
+    def test_records_and_summary(self) -> None:
+        """Test that errors, warnings and a summary are written one per line."""
+        stream = io.StringIO()
+        writer = JsonlWriter(stream)
+        writer.error(_error(1, ErrorSeverity.HIGH))
+        writer.result(ValidationResult(is_valid=False, errors=[_error(2)], warnings=["w"]))
+        writer.close("task", False)
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [r["type"] for r in records] == ["error", "error", "warning", "summary"]
+        assert records[0]["line_number"] == 1
+        assert records[-1] == {
+            "type": "summary",
+            "mode": "task",
+            "is_valid": False,
+            "errors": 2,
+            "warnings": 1,
+            "by_severity": {"critical": 0, "high": 1, "medium": 0, "low": 1},
+        }
+
+    def test_flushes_in_batches(self) -> None:
+        """Test that records reach the stream once the buffer fills, not before close."""
+        stream = io.StringIO()
+        writer = JsonlWriter(stream, buffer_size=1000)
+        writer.error(_error(1))
+        assert stream.getvalue() == ""
+        for index in range(20):
+            writer.error(_error(index))
+        assert stream.getvalue().endswith("\n")
+        writer.close("build", False)
+        assert len(stream.getvalue().splitlines()) == 22
+
+
+class TestReportScanResult:
+    """Tests for report_scan_result."""
+
+    def test_groups_by_severity_and_truncates(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that each severity shows its count and at most ten issues."""
+        errors = [_error(i) for i in range(12)] + [_error(99, ErrorSeverity.HIGH)]
+        assert report_scan_result(ValidationResult(is_valid=False, errors=errors)) is False
+
+        output = capsys.readouterr().out
+        assert "Found 12 low issue(s):" in output
+        assert "Found 1 high issue(s):" in output
+        assert "# TODO 9 " in output and "# TODO 10 " not in output
+        assert "... and 2 more" in output
+
+
+class TestAgentReport:
+    """Tests for AgentReport."""
+
+    def test_dedupes_and_collapses_patterns(self) -> None:
+        """Test that repeats merge with counts and representative locations."""
+        report = AgentReport(budget=1000)
+        for index in range(5):
+            report.error(
+                ValidationError(
+                    message="Todo found: # TODO: later",
+                    severity=ErrorSeverity.LOW,
+                    file_path=f"m{index}.py",
+                    line_number=3,
+                )
+            )
+        report.error(_error(7))
+        report.error(ValidationError(message="Task Unfinished: 1.1", severity=ErrorSeverity.HIGH))
+        report.warning("Task Skipped: 1.2")
+
+        lines = report.render("build", False).splitlines()
+        assert lines == [
+            "validate --build FAILED: 7 error(s) (1 high, 6 low), 1 warning(s)",
+            "[HIGH] Task Unfinished: 1.1",
+            "[LOW] Todo found ×6 in 6 file(s):",
+            "  - # TODO: later ×5 (m0.py:3, m1.py:3, m2.py:3, +2 more)",
+            "  - # TODO 7 (app.py:7)",
+            "[WARNING] Task Skipped: 1.2",
+        ]
+
+    def test_truncates_to_budget_and_reports_omissions(self) -> None:
+        """Test that groups past the budget are counted in the omission note."""
+        report = AgentReport(budget=80)
+        report.error(
+            ValidationError(message="Missing file: design.md", severity=ErrorSeverity.CRITICAL)
+        )
+        for index in range(40):
+            report.error(
+                ValidationError(message=f"Rule {index}: {'x' * 40}", severity=ErrorSeverity.MEDIUM)
+            )
+        report.warning("Unused step definition")
+
+        text = report.render("plan", False)
+        assert len(text) <= 80 * 4
+        lines = text.splitlines()
+        assert lines[1:3] == ["[CRITICAL] Missing file: design.md", f"[MEDIUM] Rule 0: {'x' * 40}"]
+        assert lines[3] == (
+            "Omitted to fit the ~80-token budget: 40 group(s) with 39 error(s) (39 medium) "
+            "and 1 warning(s). Use --format jsonl for the full list."
+        )
@@ -0,0 +1,175 @@
+"""Scaling tests asserting near-linear growth of parsers, scanner and reporting.
+
+Each hot path is timed at geometrically growing input sizes and the growth
+exponent is fitted on a log-log scale. Linear code fits close to 1.0 and a
+quadratic regression close to 2.0, so the threshold sits well clear of both
+and timer noise cannot fail the suite. Raise PB_SPEC_SCALING_MAX_EXPONENT on
+very noisy machines.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from pb_spec.commands.report import report_scan_result
+from pb_spec.validation.parser import parse_contract_blocks, parse_task_blocks
+from pb_spec.validation.result import ErrorSeverity, ValidationError, ValidationResult
+from pb_spec.validation.scanner import CodeScanner, ScanResult
+
+MAX_EXPONENT = float(os.environ.get("PB_SPEC_SCALING_MAX_EXPONENT", "1.6"))
+GROWTH_STEPS = 4
+REPEATS = 5
+# Each timing sample repeats the call until it lasts this long, so sub-millisecond
+# calls are not dominated by timer resolution and scheduler jitter.
+MIN_SAMPLE_SECONDS = 0.005
+
+
+def _sample(function: Callable[[], object], loops: int) -> float:
+    started = time.process_time()
+    for _ in range(loops):
+        function()
+    return time.process_time() - started
+
+
+def _best_time(function: Callable[[], object]) -> float:
+    """Return the best per-call CPU time over REPEATS samples of at least MIN_SAMPLE_SECONDS."""
+    loops = 1
+    while (elapsed := _sample(function, loops)) < MIN_SAMPLE_SECONDS:
+        loops *= 2
+    best = elapsed
+    for _ in range(REPEATS - 1):
+        best = min(best, _sample(function, loops))
+    return best / loops
+
+
+def growth_exponent(make_call: Callable[[int], Callable[[], object]], base: int) -> float:
+    """Fit the exponent k in time ~ n**k over sizes base, 2*base, 4*base, ...
+
+    The least-squares slope of log(time) against log(n), using the best of
+    several runs per size. Process CPU time is measured, so time spent
+    descheduled on a busy machine does not count.
+    """
+    sizes = [base * 2**step for step in range(GROWTH_STEPS)]
+    points = [(math.log(n), math.log(_best_time(make_call(n)))) for n in sizes]
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    return covariance / variance
+
+
+def _tasks_md(tasks: int, context_lines: int = 1) -> str:
+    blocks = ["# Tasks", ""]
+    for number in range(tasks):
+        blocks += [
+            f"### Task {number // 10 + 1}.{number % 10 + 1}: Task {number}",
+            "Context: Build it.",
+            *(f"  continued context line {line}" for line in range(context_lines)),
+            "Verification: Run tests.",
+            "Status: 🔴 TODO",
+            "Scenario Coverage: N/A",
+            "- [ ] Step 1",
+            "",
+        ]
+    return "\n".join(blocks)
+
+
+def _contract_packets(packets: int) -> str:
+    packet = (
+        "🛑 Build Blocked — Task 1.1: Task 0\n\n"
+        "Reason: Blocked.\nRequested Change: Unblock.\nImpact: Delayed.\n\n"
+    )
+    return _tasks_md(1) + "\n" + packet * packets
+
+
+def _scan_errors(count: int) -> ValidationResult:
+    severities = list(ErrorSeverity)
+    errors = [
+        ValidationError(
+            message=f"Todo found: # TODO: item {index}",
+            file_path=f"src/module_{index % 50}.py",
+            line_number=index,
+            severity=severities[index % len(severities)],
+        )
+        for index in range(count)
+    ]
+    return ValidationResult(is_valid=False, errors=errors)
+
+
+def _assert_near_linear(exponent: float) -> None:
+    assert exponent <= MAX_EXPONENT, f"growth exponent {exponent:.2f} > {MAX_EXPONENT}"
+
+
+class TestGrowthExponent:
+    """Tests for the exponent fit itself."""
+
+    def test_detects_quadratic_growth(self) -> None:
+        """Test that a quadratic workload fits an exponent well above the threshold."""
+
+        def quadratic(n: int) -> Callable[[], object]:
+            return lambda: [a * b for a in range(n) for b in range(n)]
+
+        assert growth_exponent(quadratic, 100) > MAX_EXPONENT
+
+
+class TestParserScaling:
+    """Tests that tasks.md parsing grows linearly with input size."""
+
+    def test_parse_task_blocks_many_tasks(self) -> None:
+        """Test scaling with the number of task blocks."""
+
+        def make_call(n: int) -> Callable[[], object]:
+            content = _tasks_md(n)
+            return lambda: parse_task_blocks(content)
+
+        _assert_near_linear(growth_exponent(make_call, 250))
+
+    def test_parse_task_blocks_long_fields(self) -> None:
+        """Test scaling with the number of continuation lines in one field."""
+
+        def make_call(n: int) -> Callable[[], object]:
+            content = _tasks_md(1, context_lines=n)
+            return lambda: parse_task_blocks(content)
+
+        _assert_near_linear(growth_exponent(make_call, 1000))
+
+    def test_parse_contract_blocks_many_packets(self) -> None:
+        """Test scaling with the number of packets after the last task heading."""
+
+        def make_call(n: int) -> Callable[[], object]:
+            content = _contract_packets(n)
+            return lambda: parse_contract_blocks(content)
+
+        _assert_near_linear(growth_exponent(make_call, 250))
+
+
+class TestScannerScaling:
+    """Tests that scanning and scan reporting grow linearly."""
+
+    def test_scan_file_long_file(self, tmp_path: Path) -> None:
+        """Test scaling of CodeScanner._scan_file with the file's line count."""
+        scanner = CodeScanner(root_dir=tmp_path)
+
+        def make_call(n: int) -> Callable[[], object]:
+            path = tmp_path / f"module_{n}.py"
+            lines = (f"x = {i}  # TODO: tidy" if i % 20 == 0 else f"x = {i}" for i in range(n))
+            path.write_text("\n".join(lines), encoding="utf-8")
+            return lambda: scanner._scan_file(path, ScanResult())
+
+        _assert_near_linear(growth_exponent(make_call, 1000))
+
+    @pytest.mark.usefixtures("capsys")
+    def test_report_scan_result_many_issues(self) -> None:
+        """Test scaling of report_scan_result with the issue count."""
+
+        def make_call(n: int) -> Callable[[], object]:
+            result = _scan_errors(n)
+            return lambda: report_scan_result(result)
+
+        _assert_near_linear(growth_exponent(make_call, 2000))
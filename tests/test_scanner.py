@@ -9,6 +9,7 @@ from pb_spec.validation.scanner import (
     IssueType,
     ScanIssue,
     ScanResult,
+    ScanStats,
 )
 
 
@@ -294,3 +295,44 @@ class TestCodeScanner:
         scanner = CodeScanner(root_dir=tmp_path)
         result = scanner.scan()
         assert result.has_issues is False
+
+
+class TestScanStats:
+    """Tests for opt-in scan cost accounting."""
+
+    def test_stats_do_not_change_issues(self, tmp_path: Path) -> None:
+        """Test that a scanner with stats finds exactly the same issues."""
+        (tmp_path / "a.py").write_text("# TODO: one\nbreakpoint()\nx = 1\n")
+        (tmp_path / "b.js").write_text("console.log(1)\nit.skip('x')\n")
+
+        plain = CodeScanner(root_dir=tmp_path).scan()
+        counted = CodeScanner(root_dir=tmp_path, stats=ScanStats()).scan()
+
+        assert sorted(map(repr, counted.issues)) == sorted(map(repr, plain.issues))
+
+    def test_counts_evaluations_hits_and_files(self, tmp_path: Path) -> None:
+        """Test per-pattern counters, per-file records and per-extension totals."""
+        (tmp_path / "a.py").write_text("# TODO: one\nx = 1\n")
+        (tmp_path / "b.js").write_text("console.log(1)\n")
+        stats = ScanStats()
+
+        CodeScanner(root_dir=tmp_path, stats=stats).scan()
+
+        todo = next(p for p in stats.patterns.values() if p.pattern == "TODO:")
+        assert todo.hits == 1
+        # Every line of both files (including the trailing empty ones) is evaluated.
+        assert todo.evaluations == 5
+        assert {f.path for f in stats.files} == {"a.py", "b.js"}
+        assert stats.slowest_files(1)[0].path in {"a.py", "b.js"}
+        by_extension = {t.extension: t for t in stats.throughput_by_extension()}
+        assert by_extension[".py"].size == len("# TODO: one\nx = 1\n")
+        assert by_extension[".js"].files == 1
+
+    def test_first_hit_stops_type(self, tmp_path: Path) -> None:
+        """Test that patterns after a hit in the same issue type are not evaluated."""
+        (tmp_path / "a.py").write_text("# TODO: fix")
+        stats = ScanStats()
+
+        CodeScanner(root_dir=tmp_path, stats=stats).scan()
+
+        assert next(p for p in stats.patterns.values() if p.pattern == "FIXME:").evaluations == 0
@@ -0,0 +1,105 @@
+"""Unit tests for the async ValidationSession API."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from pb_spec.git_utils import (
+    get_git_modified_files,
+    get_git_modified_files_async,
+    parse_porcelain_status,
+)
+from pb_spec.validation.build import validate_build, validate_task
+from pb_spec.validation.plan import validate_plan
+from pb_spec.validation.session import ValidationSession
+
+
+def _git_project(root: Path, todo: str) -> Path:
+    """Create a git project with one untracked Python file containing a TODO."""
+    root.mkdir(parents=True, exist_ok=True)
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    (root / "app.py").write_text(f"x = 1  # TODO: {todo}\n")
+    os.utime(root / "app.py", ns=(1, 1))  # not racily clean, so scans are cached
+    return root
+
+
+@pytest.fixture
+def spec_dir(tmp_path: Path) -> Path:
+    """Create a project with a half-finished spec."""
+    _git_project(tmp_path, "build")
+    spec = tmp_path / "specs" / "2026-01-01-session"
+    spec.mkdir(parents=True)
+    (spec / "design.md").write_text("# Design\n")
+    (spec / "tasks.md").write_text(
+        "### Task 1.1: Work\nStatus: 🔴 TODO\nContext: c\nVerification: v\n- [ ] Step 1\n"
+    )
+    return spec
+
+
+class TestParsePorcelainStatus:
+    """Tests for parse_porcelain_status."""
+
+    def test_renames_and_quoted_paths(self, tmp_path: Path) -> None:
+        """Test that renames keep the new path and quotes are stripped."""
+        output = ' M a.py\nR  old.py -> new.py\n?? "with space.py"\n'
+        assert parse_porcelain_status(output, tmp_path) == {
+            tmp_path / "a.py",
+            tmp_path / "new.py",
+            tmp_path / "with space.py",
+        }
+
+
+class TestValidationSession:
+    """Tests for ValidationSession."""
+
+    def test_matches_synchronous_validation(self, spec_dir: Path) -> None:
+        """Test that async results equal the synchronous validators'."""
+        root = spec_dir.parent.parent
+
+        async def run() -> tuple:
+            async with ValidationSession() as session:
+                return await asyncio.gather(
+                    session.validate_task(root),
+                    session.validate_build(spec_dir),
+                    session.validate_plan(spec_dir),
+                )
+
+        task, build, plan = asyncio.run(run())
+        assert task == validate_task(root)
+        assert build == validate_build(spec_dir)
+        assert plan == validate_plan(spec_dir)
+
+    def test_concurrent_roots_and_warm_cache(self, tmp_path: Path) -> None:
+        """Test that many roots validate concurrently and repeat calls hit the cache."""
+        roots = [_git_project(tmp_path / f"p{i}", f"item {i}") for i in range(8)]
+
+        async def run() -> tuple[list, int]:
+            async with ValidationSession(max_workers=4) as session:
+                results = await asyncio.gather(*(session.validate_task(r) for r in roots))
+                await asyncio.gather(*(session.validate_task(r) for r in roots))
+                return results, session.scan_cache.hits
+
+        results, hits = asyncio.run(run())
+        assert [r.errors[0].message for r in results] == [
+            f"Todo found: x = 1  # TODO: item {i}" for i in range(8)
+        ]
+        assert hits == 8
+
+    def test_modified_files_match_sync_git_query(self, tmp_path: Path) -> None:
+        """Test that the async git status query sees the same files."""
+        root = _git_project(tmp_path, "x")
+        assert asyncio.run(get_git_modified_files_async(root)) == get_git_modified_files(root)
+
+    def test_format_without_markdown_is_noop(self, tmp_path: Path) -> None:
+        """Test that formatting a spec without markdown files succeeds."""
+
+        async def run() -> bool:
+            async with ValidationSession() as session:
+                return (await session.format_spec(tmp_path)).success
+
+        assert asyncio.run(run())
@@ -0,0 +1,143 @@
+"""Unit tests for the build-time simulator."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pb_spec.cli import main
+from pb_spec.orchestration.simulate import (
+    DEFAULT_COMPLEXITY_WEIGHTS,
+    calibrate_weights,
+    simulate_build,
+    task_durations,
+)
+from pb_spec.validation.dag import build_task_graph
+from pb_spec.validation.parser import parse_task_blocks
+
+
+def _task(task_id: str, depends_on: str, complexity: str) -> str:
+    return (
+        f"### Task {task_id}: Task {task_id}\n"
+        f"DependsOn: {depends_on}\n"
+        f"Complexity: {complexity}\n"
+        "- [ ] Step 1\n\n"
+    )
+
+
+FAN_OUT_TASKS = (
+    _task("1.1", "None", "Low")
+    + "".join(_task(f"2.{i}", "1.1", "High") for i in range(1, 5))
+    + _task("3.1", "2.1, 2.2, 2.3, 2.4", "Low")
+)
+
+
+def _simulate(content: str, max_workers: int, weights: dict[str, float] | None = None):
+    task_blocks = parse_task_blocks(content)
+    durations = task_durations(task_blocks, weights or DEFAULT_COMPLEXITY_WEIGHTS)
+    return simulate_build(build_task_graph(task_blocks), durations, max_workers)
+
+
+class TestSimulateBuild:
+    """Tests for simulate_build."""
+
+    def test_fan_out_saturates_at_width(self) -> None:
+        """Test that makespan stops improving once every parallel task has a worker."""
+        result = _simulate(FAN_OUT_TASKS, max_workers=6)
+        makespans = [p.makespan for p in result.points]
+        assert makespans == [14.0, 8.0, 8.0, 5.0, 5.0, 5.0]
+        assert result.saturation_workers == 4
+        assert result.total_work == 14.0
+        assert result.critical_path_time == 5.0
+        assert result.points[3].utilization == pytest.approx(14.0 / 20.0)
+
+    def test_chain_gains_nothing_from_workers(self) -> None:
+        """Test that a dependency chain runs serially regardless of worker count."""
+        chain = (
+            _task("1.1", "None", "Low") + _task("1.2", "1.1", "Low") + _task("1.3", "1.2", "Low")
+        )
+        result = _simulate(chain, max_workers=3)
+        assert [p.makespan for p in result.points] == [3.0, 3.0, 3.0]
+        assert result.saturation_workers == 1
+
+    def test_cycle_is_rejected(self) -> None:
+        """Test that cyclic plans cannot be simulated."""
+        with pytest.raises(ValueError, match="cycle"):
+            _simulate(_task("1.1", "1.2", "Low") + _task("1.2", "1.1", "Low"), max_workers=2)
+
+
+class TestCalibrateWeights:
+    """Tests for calibrate_weights."""
+
+    def test_history_means_by_complexity_and_task_id(self, tmp_path: Path) -> None:
+        """Test that recorded durations replace the default weights."""
+        history = tmp_path / "history.jsonl"
+        history.write_text(
+            '{"complexity": "High", "duration": 100}\n'
+            '{"id": "2.1", "duration": 200}\n'
+            '{"id": "1.1", "seconds": 10}\n'
+        )
+        weights = calibrate_weights(
+            history, parse_task_blocks(FAN_OUT_TASKS), DEFAULT_COMPLEXITY_WEIGHTS
+        )
+        assert weights == {"low": 10.0, "high": 150.0}
+
+    def test_ignores_unrun_and_malformed_records(self, tmp_path: Path) -> None:
+        """Test that only ran records calibrate and uncalibrated weights scale to seconds."""
+        history = tmp_path / "history.jsonl"
+        history.write_text(
+            '{"complexity": "high", "duration": 30, "status": "failed"}\n'
+            '{"complexity": "high", "duration": 0.0, "status": "passed"}\n'
+            '{"complexity": "high", "duration": 5, "status": "skipped"}\n'
+            '{"complexity": 3, "duration": 5}\n'
+            '{"complexity": "high", "duration": "slow"}\n'
+            '{"complexity": "high", "duration": null}\n'
+            "[1, 2]\n"
+        )
+        weights = calibrate_weights(history, [], DEFAULT_COMPLEXITY_WEIGHTS)
+        assert weights == {"low": 10.0, "high": 30.0}
+
+    def test_rejects_non_list_history(self, tmp_path: Path) -> None:
+        """Test that JSON other than a record list or tasks object raises ValueError."""
+        history = tmp_path / "history.json"
+        for payload in ("5", '{"tasks": 3}', '"text"'):
+            history.write_text(payload)
+            with pytest.raises(ValueError, match="expected a list of records"):
+                calibrate_weights(history, [], DEFAULT_COMPLEXITY_WEIGHTS)
+
+
+class TestPlanSimulateCommand:
+    """Tests for `pb-spec plan simulate`."""
+
+    def test_json_output_with_weights(self, tmp_path: Path) -> None:
+        """Test that custom weights and the worker range reach the report."""
+        spec_dir = tmp_path / "specs" / "2026-01-01-sim"
+        spec_dir.mkdir(parents=True)
+        (spec_dir / "tasks.md").write_text(FAN_OUT_TASKS)
+        result = CliRunner().invoke(
+            main,
+            [
+                "plan",
+                "simulate",
+                "--specs-dir",
+                str(tmp_path / "specs"),
+                "--workers",
+                "2..4",
+                "--weight",
+                "High=10",
+                "--json",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        payload = json.loads(result.output)
+        assert [p["workers"] for p in payload["points"]] == [2, 3, 4]
+        assert payload["points"][-1]["makespan"] == 12.0
+        assert payload["saturation_workers"] == 4
+
+    def test_bad_weight_is_rejected(self) -> None:
+        """Test that malformed weights are usage errors."""
+        result = CliRunner().invoke(main, ["plan", "simulate", "--weight", "High"])
+        assert result.exit_code == 2
@@ -0,0 +1,146 @@
+"""Unit tests for the specs/.index manifest."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pb_spec.cli import main
+from pb_spec.commands.discovery import get_latest_spec_dir
+from pb_spec.spec_index import (
+    INDEX_FILE_NAME,
+    _rebuild_index,
+    _write_spec_index,
+    is_index_fresh,
+    latest_spec_name,
+    load_spec_index,
+    record_validation_outcome,
+    refresh_spec_index,
+)
+
+TASKS_CONTENT = (
+    "# Tasks\n\n"
+    "### Task 1.1: Done task\n"
+    "Status: 🟢 DONE\n"
+    "- [x] Step 1\n\n"
+    "### Task 1.2: Open task\n"
+    "Status: 🔴 TODO\n"
+    "- [ ] Step 1\n"
+)
+
+
+@pytest.fixture
+def specs_dir(tmp_path: Path) -> Path:
+    """Create a specs directory with two dated specs and one undated spec."""
+    specs = tmp_path / "specs"
+    for name in ("2026-03-01-old-feature", "2026-03-28-new-feature", "scratch"):
+        (specs / name).mkdir(parents=True)
+    (specs / "2026-03-28-new-feature" / "tasks.md").write_text(TASKS_CONTENT)
+    return specs
+
+
+class TestSpecIndex:
+    """Tests for building and reading the manifest."""
+
+    def test_refresh_records_entries_and_latest(self, specs_dir: Path) -> None:
+        """Test that refresh captures every spec and the latest one."""
+        index = refresh_spec_index(specs_dir)
+        assert set(index.entries) == {"2026-03-01-old-feature", "2026-03-28-new-feature", "scratch"}
+        assert index.latest == "2026-03-28-new-feature"
+        entry = index.entries["2026-03-28-new-feature"]
+        assert entry.date == "2026-03-28"
+        assert entry.status_counts == {"🟢 DONE": 1, "🔴 TODO": 1}
+        assert index.entries["scratch"].date is None
+
+    def test_index_is_fresh_after_write(self, specs_dir: Path) -> None:
+        """Test that the written manifest matches the directory mtime."""
+        refresh_spec_index(specs_dir)
+        index = load_spec_index(specs_dir)
+        assert index is not None
+        assert is_index_fresh(specs_dir, index)
+
+    def test_spec_added_during_write_leaves_index_stale(self, specs_dir: Path) -> None:
+        """Test that a spec dir missing from the written index is never hidden."""
+        index = _rebuild_index(specs_dir)
+        (specs_dir / "2026-04-01-newest").mkdir()
+        _write_spec_index(specs_dir, index)
+        loaded = load_spec_index(specs_dir)
+        assert loaded is not None
+        assert not is_index_fresh(specs_dir, loaded)
+        assert latest_spec_name(specs_dir) == "2026-04-01-newest"
+        assert not [p for p in specs_dir.iterdir() if p.name.endswith(".tmp")]
+
+    def test_new_spec_makes_index_stale(self, specs_dir: Path) -> None:
+        """Test that adding a spec dir invalidates the manifest and is still resolved."""
+        refresh_spec_index(specs_dir)
+        (specs_dir / "2026-04-01-newest").mkdir()
+        index = load_spec_index(specs_dir)
+        assert index is not None
+        assert not is_index_fresh(specs_dir, index)
+        assert latest_spec_name(specs_dir) == "2026-04-01-newest"
+
+    def test_latest_uses_fresh_manifest(self, specs_dir: Path) -> None:
+        """Test that a fresh manifest answers latest-spec lookups without scanning."""
+        refresh_spec_index(specs_dir)
+        index_path = specs_dir / INDEX_FILE_NAME
+        raw = json.loads(index_path.read_text())
+        raw["latest"] = "scratch"
+        mtime_ns = index_path.stat().st_mtime_ns
+        index_path.write_text(json.dumps(raw))
+        os.utime(index_path, ns=(mtime_ns, mtime_ns))
+        assert get_latest_spec_dir(specs_dir).name == "scratch"
+
+    def test_unchanged_tasks_are_not_reparsed(
+        self, specs_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a second refresh reuses entries whose tasks.md did not change."""
+        refresh_spec_index(specs_dir)
+        calls: list[Path] = []
+        monkeypatch.setattr(
+            "pb_spec.spec_index._task_status_counts", lambda path: calls.append(path) or {}
+        )
+        refresh_spec_index(specs_dir)
+        assert calls == []
+
+    def test_corrupt_index_falls_back_to_scan(self, specs_dir: Path) -> None:
+        """Test that an unreadable manifest is ignored."""
+        (specs_dir / INDEX_FILE_NAME).write_text("{not json")
+        assert load_spec_index(specs_dir) is None
+        assert latest_spec_name(specs_dir) == "2026-03-28-new-feature"
+
+    def test_record_validation_outcome(self, specs_dir: Path) -> None:
+        """Test that validation outcomes are stored per spec."""
+        record_validation_outcome(specs_dir / "2026-03-28-new-feature", "plan", False)
+        index = load_spec_index(specs_dir)
+        assert index is not None
+        outcome = index.entries["2026-03-28-new-feature"].last_validation
+        assert outcome is not None
+        assert outcome.mode == "plan"
+        assert outcome.passed is False
+
+
+class TestSpecsListCommand:
+    """Tests for `pb-spec specs list`."""
+
+    def test_list_json(self, specs_dir: Path) -> None:
+        """Test that specs list emits the manifest as JSON in spec order."""
+        result = CliRunner().invoke(
+            main, ["specs", "list", "--specs-dir", str(specs_dir), "--json"]
+        )
+        assert result.exit_code == 0
+        payload = json.loads(result.output)
+        assert payload["latest"] == "2026-03-28-new-feature"
+        assert [s["name"] for s in payload["specs"]] == [
+            "scratch",
+            "2026-03-01-old-feature",
+            "2026-03-28-new-feature",
+        ]
+
+    def test_list_missing_specs_dir_fails(self, tmp_path: Path) -> None:
+        """Test that specs list fails when the specs directory is missing."""
+        result = CliRunner().invoke(main, ["specs", "list", "--specs-dir", str(tmp_path / "nope")])
+        assert result.exit_code == 1
@@ -0,0 +1,138 @@
+"""Import-time budget tests guarding CLI cold-start latency."""
+
+from __future__ import annotations
+
+import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import pb_spec
+from pb_spec.cli import LAZY_COMMANDS
+
+SRC_DIR = Path(pb_spec.__file__).resolve().parent.parent
+
+# Cumulative `python -X importtime` budgets in microseconds (best of three runs),
+# with headroom for slow CI machines. Override with PB_SPEC_IMPORT_BUDGET_SCALE.
+IMPORT_BUDGETS_US: dict[str, int] = {
+    "pb_spec.cli": 100_000,
+    "pb_spec.commands.validate": 150_000,
+}
+
+# Modules that must not load just to build the CLI or the validate command.
+DEFERRED_MODULES: dict[str, tuple[str, ...]] = {
+    "pb_spec.cli": (
+        "importlib.metadata",
+        "asyncio",
+        "tomllib",
+        "pb_spec.commands.validate",
+        "pb_spec.validation.scanner",
+        "pb_spec.daemon",
+    ),
+    "pb_spec.commands.validate": (
+        "importlib.metadata",
+        "asyncio",
+        "ctypes",
+        "cProfile",
+        "tracemalloc",
+        "pb_spec.watch",
+        "pb_spec.daemon",
+        "pb_spec.commands.validate_local",
+        "pb_spec.validation.build",
+        "pb_spec.validation.plan",
+        "pb_spec.validation.parser",
+        "pb_spec.validation.scanner",
+    ),
+}
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(SRC_DIR), *sys.path])}
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def _cumulative_import_us(module: str) -> int:
+    """Return the cumulative import time of ``module`` reported by -X importtime."""
+    stderr = _run_python("-X", "importtime", "-c", f"import {module}").stderr
+    for line in stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    raise AssertionError(f"{module} missing from -X importtime output")
+
+
+class TestImportTime:
+    """Tests for CLI start-up cost."""
+
+    @pytest.mark.parametrize("module", sorted(DEFERRED_MODULES))
+    def test_heavy_modules_are_deferred(self, module: str) -> None:
+        """Test that importing an entry module does not load deferred modules."""
+        code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+        loaded = set(_run_python("-c", code).stdout.split())
+        assert loaded.isdisjoint(DEFERRED_MODULES[module])
+
+    @pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS_US))
+    def test_import_time_budget(self, module: str) -> None:
+        """Test that importing an entry module stays within its time budget."""
+        scale = float(os.environ.get("PB_SPEC_IMPORT_BUDGET_SCALE", "1"))
+        best = min(_cumulative_import_us(module) for _ in range(3))
+        assert best <= IMPORT_BUDGETS_US[module] * scale
+
+    def test_scanner_rules_compile_lazily(self) -> None:
+        """Test that scanner regexes are compiled on first scan, not at import."""
+        code = (
+            "from pb_spec.validation.scanner import compiled_rules; "
+            "print(compiled_rules.cache_info().currsize)"
+        )
+        assert _run_python("-c", code).stdout.strip() == "0"
+
+    def test_help_lists_lazy_commands(self) -> None:
+        """Test that --help lists every subcommand without importing them."""
+        code = (
+            "import sys; from click.testing import CliRunner; from pb_spec.cli import main; "
+            "out = CliRunner().invoke(main, ['--help']).output; "
+            "print(out); print('LOADED' if 'pb_spec.commands.validate' in sys.modules else '')"
+        )
+        output = _run_python("-c", code).stdout
+        for name in ("baseline", "daemon", "impact", "plan", "specs", "validate", "verify"):
+            assert f"  {name} " in output
+        assert "LOADED" not in output
+
+    @pytest.mark.parametrize("name", sorted(LAZY_COMMANDS))
+    def test_lazy_help_matches_command(self, name: str) -> None:
+        """Test that each placeholder help line matches the real command's short help."""
+        target, short_help = LAZY_COMMANDS[name]
+        module_name, attr = target.split(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        assert command.get_short_help_str(limit=len(short_help) + 1) == short_help
+
+
+class TestZipapp:
+    """Tests for the zipapp build."""
+
+    def test_build_and_run(self, tmp_path: Path) -> None:
+        """Test that the zipapp runs without importlib.metadata or installed sources."""
+        script = SRC_DIR.parent / "scripts" / "build_zipapp.py"
+        if not script.is_file():
+            pytest.skip("build script not available outside a source checkout")
+        archive = tmp_path / "pb-spec.pyz"
+        subprocess.run(
+            [sys.executable, str(script), "--output", str(archive)], check=True, capture_output=True
+        )
+        code = (
+            "import runpy, sys; sys.argv = ['pb-spec', '--version']\n"
+            f"sys.path.insert(0, {str(archive)!r})\n"
+            "try:\n    runpy.run_path(sys.path[0], run_name='__main__')\n"
+            "except SystemExit:\n    pass\n"
+            "print('METADATA' if 'importlib.metadata' in sys.modules else '')\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-I", "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.startswith("pb-spec, version ")
+        assert "METADATA" not in result.stdout
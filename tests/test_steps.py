@@ -0,0 +1,201 @@
+"""Unit tests for the static behave step index."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from pb_spec.validation.build import validate_build
+from pb_spec.validation.gherkin import iter_gherkin_tokens
+from pb_spec.validation.steps import (
+    StepIndex,
+    check_steps,
+    compile_parse_pattern,
+    extract_feature_steps,
+    parse_step_module,
+)
+
+STEP_MODULE = """
+from behave import given, step, then, when, use_step_matcher
+
+@given("I have {count:d} apples")
+def have_apples(context, count):
+    pass
+
+@when('I eat "{fruit}"')
+def eat(context, fruit):
+    pass
+
+@then("I have {count:d} left")
+@then("nothing is left")
+def left(context, count=0):
+    pass
+
+@step("{anything} happens")
+def anything(context, anything):
+    pass
+
+@given("an unused step")
+def unused(context):
+    pass
+
+use_step_matcher("re")
+
+@when(r"I (?:walk|run) (\\d+) km")
+def move(context, distance):
+    pass
+"""
+
+FEATURE = """Feature: Fruit
+  Background:
+    Given I have 3 apples
+
+  Scenario: Eating
+    When I eat "apple"
+    Then I have 2 left
+    And something happens
+    But I dance
+
+  Scenario Outline: Moving
+    When I <verb> <km> km
+    Then nothing is left
+
+    Examples:
+      | verb | km |
+      | walk | 5  |
+      | fly  | 7  |
+"""
+
+
+class TestCompileParsePattern:
+    """Tests for compile_parse_pattern."""
+
+    def test_typed_fields(self) -> None:
+        """Test that typed fields only match their type and escapes are literal."""
+        regex, prefix = compile_parse_pattern("I have {count:d} {{items}}")
+        assert regex.fullmatch("I have 12 {items}")
+        assert not regex.fullmatch("I have many {items}")
+        assert prefix == "I have "
+
+    def test_leading_field_has_empty_prefix(self) -> None:
+        """Test that patterns starting with a field have no literal prefix."""
+        assert compile_parse_pattern("{x} happens")[1] == ""
+
+
+class TestParseStepModule:
+    """Tests for parse_step_module."""
+
+    def test_decorators_and_matcher_switch(self) -> None:
+        """Test that stacked decorators and use_step_matcher are honoured."""
+        definitions = parse_step_module(STEP_MODULE, "steps.py")
+        assert [(d.step_type, d.matcher) for d in definitions] == [
+            ("given", "parse"),
+            ("when", "parse"),
+            ("then", "parse"),
+            ("then", "parse"),
+            ("step", "parse"),
+            ("given", "parse"),
+            ("when", "re"),
+        ]
+
+    def test_non_string_matcher_is_ignored(self) -> None:
+        """Test that use_step_matcher with a non-string argument keeps the matcher."""
+        source = (
+            'use_step_matcher(1)\nuse_step_matcher(None)\n\n@given("a {x}")\ndef f(c, x): ...\n'
+        )
+        assert [d.matcher for d in parse_step_module(source, "steps.py")] == ["parse"]
+
+    def test_syntax_error_yields_nothing(self) -> None:
+        """Test that unparsable modules are skipped."""
+        assert parse_step_module("def broken(:\n", "steps.py") == []
+
+
+class TestExtractFeatureSteps:
+    """Tests for extract_feature_steps."""
+
+    def test_continuations_and_outline_expansion(self) -> None:
+        """Test that And/But inherit the step type and outlines expand per row."""
+        steps = extract_feature_steps(iter_gherkin_tokens(FEATURE.splitlines(), steps=True), "f")
+        assert [(s.step_type, s.text) for s in steps] == [
+            ("given", "I have 3 apples"),
+            ("when", 'I eat "apple"'),
+            ("then", "I have 2 left"),
+            ("then", "something happens"),
+            ("then", "I dance"),
+            ("when", "I walk 5 km"),
+            ("then", "nothing is left"),
+            ("when", "I fly 7 km"),
+            ("then", "nothing is left"),
+        ]
+
+
+class TestCheckSteps:
+    """Tests for check_steps."""
+
+    def test_undefined_and_unused(self, tmp_path: Path) -> None:
+        """Test that undefined steps and unused definitions are reported."""
+        (tmp_path / "steps.py").write_text(STEP_MODULE)
+        (tmp_path / "fruit.feature").write_text(FEATURE)
+        report = check_steps([tmp_path / "steps.py"], [tmp_path / "fruit.feature"])
+        assert [s.text for s in report.undefined] == ["I dance", "I fly 7 km"]
+        assert [d.pattern for d in report.unused] == ["an unused step"]
+        assert report.ambiguous == []
+
+    def test_ambiguous(self) -> None:
+        """Test that a step matched by two definitions is ambiguous."""
+        index = StepIndex(parse_step_module(STEP_MODULE, "steps.py"))
+        assert len(index.match("then", "I have 2 left")) == 1
+        assert len(index.match("then", "nothing happens")) == 1
+        assert len(index.match("given", "I have 3 apples")) == 1
+
+        ambiguous = STEP_MODULE.replace(
+            'use_step_matcher("re")',
+            '@given("I have {what} apples")\ndef other(context, what):\n    pass\n\n'
+            'use_step_matcher("re")',
+        )
+        index = StepIndex(parse_step_module(ambiguous, "steps.py"))
+        assert len(index.match("given", "I have 3 apples")) == 2
+
+    def test_large_suite_is_fast(self, tmp_path: Path) -> None:
+        """Test that thousands of steps against hundreds of definitions check quickly."""
+        module = "from behave import given, when, then\n" + "".join(
+            f'@given("precondition {i} holds for {{name}}")\ndef g{i}(context, name):\n    pass\n'
+            f'@then("outcome {i} is {{value:d}}")\ndef t{i}(context, value):\n    pass\n'
+            for i in range(300)
+        )
+        (tmp_path / "steps.py").write_text(module)
+        for f in range(20):
+            scenarios = "".join(
+                f"  Scenario: S{s}\n"
+                f"    Given precondition {(f * 7 + s) % 300} holds for user{s}\n"
+                f"    Then outcome {(f + s) % 300} is {s}\n"
+                for s in range(150)
+            )
+            (tmp_path / f"f{f}.feature").write_text(f"Feature: F{f}\n{scenarios}")
+
+        started = time.perf_counter()
+        report = check_steps([tmp_path / "steps.py"], sorted(tmp_path.glob("*.feature")))
+        elapsed = time.perf_counter() - started
+        assert report.step_count == 6000
+        assert report.undefined == []
+        assert elapsed < 1.0
+
+
+class TestValidateBuildSteps:
+    """Tests for step checking in validate_build."""
+
+    def test_undefined_step_fails_build(self, tmp_path: Path) -> None:
+        """Test that validate_build reports undefined steps when steps/ exists."""
+        spec_dir = tmp_path / "specs" / "2026-01-01-fruit"
+        (spec_dir / "features").mkdir(parents=True)
+        (spec_dir / "tasks.md").write_text("### Task 1.1: Fruit\nStatus: 🟢 DONE\n- [x] Step 1\n")
+        (spec_dir / "features" / "fruit.feature").write_text(FEATURE)
+        steps_dir = tmp_path / "features" / "steps"
+        steps_dir.mkdir(parents=True)
+        (steps_dir / "fruit_steps.py").write_text(STEP_MODULE)
+
+        result = validate_build(spec_dir)
+        messages = [e.message for e in result.errors]
+        assert "Undefined step: Then I dance" in messages
+        assert "Undefined step: When I fly 7 km" in messages
+        assert any("an unused step" in w for w in result.warnings)
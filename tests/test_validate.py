@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import subprocess
 from pathlib import Path
 
@@ -13,6 +14,7 @@ from pb_spec.commands.discovery import get_latest_spec_dir
 from pb_spec.exceptions import SpecNotFoundError
 from pb_spec.validation.build import validate_build, validate_task
 from pb_spec.validation.plan import validate_plan, validate_tasks_structure
+from pb_spec.validation.result import ValidationError
 
 
 @pytest.fixture
@@ -555,6 +557,20 @@ class TestValidateTask:
         assert result.is_valid is False
         assert len(result.errors) > 0
 
+    def test_on_error_streams_issues(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that on_error receives each issue and the result keeps only the outcome."""
+        dirty_file = tmp_path / "dirty.py"
+        dirty_file.write_text("# TODO: one\n# TODO: two\n")
+        monkeypatch.setattr(
+            "pb_spec.validation.build.get_git_modified_files",
+            lambda _root_dir=".": {dirty_file},
+        )
+        streamed: list[ValidationError] = []
+        result = validate_task(tmp_path, on_error=streamed.append)
+        assert result.is_valid is False
+        assert result.errors == []
+        assert [e.line_number for e in streamed] == [1, 2]
+
 
 class TestValidateCommand:
     """Tests for validate command integration."""
@@ -568,6 +584,52 @@ class TestValidateCommand:
             assert result.exit_code == 0
             assert "passed" in result.output.lower() or "✅" in result.output
 
+    def test_build_jsonl_streams_records(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that --format jsonl emits one record per error and a final summary."""
+        spec_dir = tmp_path / "specs" / "2026-01-01-demo"
+        spec_dir.mkdir(parents=True)
+        (spec_dir / "tasks.md").write_text("### Task 1.1: A\nStatus: 🔴 TODO\n- [ ] s\n")
+        (tmp_path / "app.py").write_text("# TODO: one\n# FIXME: two\n")
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(main, ["validate", "--build", "--format", "jsonl"])
+
+        assert result.exit_code == 1
+        records = [json.loads(line) for line in result.output.splitlines()]
+        scan_lines = {r["line_number"] for r in records if r.get("file_path") == "app.py"}
+        assert scan_lines == {1, 2}
+        assert records[-1]["type"] == "summary"
+        assert records[-1]["errors"] == len(records) - 1
+        assert records[-1]["by_severity"]["low"] == 2
+
+    def test_agent_format_is_compact(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that --format agent merges repeated issues into one group."""
+        (tmp_path / "app.py").write_text("# TODO: later\n" * 50)
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(main, ["validate", "--task", "--format", "agent", "--budget", "100"])
+
+        assert result.exit_code == 1
+        header, group = result.output.splitlines()
+        assert header == "validate --task FAILED: 50 error(s) (50 low), 0 warning(s)"
+        assert group.startswith("[LOW] Todo found: # TODO: later ×50 (")
+        assert group.endswith("app.py:3, +47 more)")
+
+    def test_jsonl_rejects_watch(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that --watch cannot be combined with --format jsonl."""
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(main, ["validate", "--task", "--watch", "--format", "jsonl"])
+        assert result.exit_code == 1
+        assert "--watch only supports --format text" in result.output
+
 
 CONSOLIDATED_VALID_DESIGN = (
     "# Design: Codebase Quality Improvements\n\n"
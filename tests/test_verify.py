@@ -0,0 +1,231 @@
+"""Unit tests for the parallel verification executor."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from pb_spec.cli import main
+from pb_spec.orchestration.verify import (
+    VerifyStatus,
+    extract_verification_commands,
+    run_verifications,
+)
+from pb_spec.orchestration.verify_cache import VerifyCache, context_paths
+from pb_spec.validation.parser import parse_task_blocks
+
+
+def _task(task_id: str, depends_on: str, verification: str, status: str = "🔴 TODO") -> str:
+    return (
+        f"### Task {task_id}: Task {task_id}\n"
+        f"Status: {status}\n"
+        f"DependsOn: {depends_on}\n"
+        f"Verification: {verification}\n"
+        "- [ ] Step 1\n\n"
+    )
+
+
+def _statuses(content: str, tmp_path: Path, **kwargs) -> dict[str, VerifyStatus]:
+    report = run_verifications(parse_task_blocks(content), root=tmp_path, **kwargs)
+    return {o.task_id: o.status for o in report.outcomes}
+
+
+class TestExtractVerificationCommands:
+    """Tests for extract_verification_commands."""
+
+    def test_inline_code_spans(self) -> None:
+        """Test that every inline code span is one command."""
+        value = "Run `uv run pytest -q` then `just lint`."
+        assert extract_verification_commands(value) == ["uv run pytest -q", "just lint"]
+
+    def test_fenced_block_lines(self) -> None:
+        """Test that fenced blocks contribute one command per non-empty line."""
+        value = "\n```bash\nmake test\n\nmake lint\n```\n"
+        assert extract_verification_commands(value) == ["make test", "make lint"]
+
+    def test_prose_has_no_commands(self) -> None:
+        """Test that unquoted prose is not executed."""
+        assert extract_verification_commands("Check the page renders.") == []
+
+
+class TestRunVerifications:
+    """Tests for run_verifications."""
+
+    def test_passing_and_failing_tasks(self, tmp_path: Path) -> None:
+        """Test that exit codes map to passed and failed outcomes with logs."""
+        content = _task("1.1", "None", "`echo hello`") + _task("1.2", "None", "`false`")
+        report = run_verifications(parse_task_blocks(content), root=tmp_path)
+        outcomes = {o.task_id: o for o in report.outcomes}
+        assert outcomes["1.1"].status is VerifyStatus.PASSED
+        assert outcomes["1.2"].status is VerifyStatus.FAILED
+        assert outcomes["1.2"].returncode == 1
+        assert "hello" in Path(outcomes["1.1"].log_path or "").read_text()
+        assert not report.passed
+
+    def test_failure_stops_later_waves(self, tmp_path: Path) -> None:
+        """Test that tasks after a failing wave are reported as not run."""
+        content = _task("1.1", "None", "`false`") + _task("1.2", "1.1", "`true`")
+        statuses = _statuses(content, tmp_path)
+        assert statuses == {"1.1": VerifyStatus.FAILED, "1.2": VerifyStatus.NOT_RUN}
+
+    def test_timeout(self, tmp_path: Path) -> None:
+        """Test that a command exceeding the timeout is killed."""
+        content = _task("1.1", "None", "`sleep 5`")
+        statuses = _statuses(content, tmp_path, timeout=0.2)
+        assert statuses == {"1.1": VerifyStatus.TIMEOUT}
+
+    def test_skipped_and_commandless_tasks(self, tmp_path: Path) -> None:
+        """Test that skipped tasks and prose-only verifications are not executed."""
+        content = _task("1.1", "None", "`false`", status="⏭️ SKIPPED") + _task(
+            "1.2", "None", "Manual review."
+        )
+        statuses = _statuses(content, tmp_path)
+        assert statuses == {"1.1": VerifyStatus.SKIPPED, "1.2": VerifyStatus.NO_COMMAND}
+
+    def test_cycle_raises(self, tmp_path: Path) -> None:
+        """Test that a dependency cycle is rejected before anything runs."""
+        content = _task("1.1", "1.2", "`true`") + _task("1.2", "1.1", "`true`")
+        with pytest.raises(ValueError, match="cycle"):
+            run_verifications(parse_task_blocks(content), root=tmp_path)
+
+
+def _cached_task(task_id: str, verification: str, context: str) -> str:
+    return (
+        f"### Task {task_id}: Task {task_id}\n"
+        f"Context: {context}\n"
+        f"Verification: {verification}\n"
+        "- [ ] Step 1\n\n"
+    )
+
+
+class TestVerifyCache:
+    """Tests for the verification result cache."""
+
+    def _run(self, content: str, tmp_path: Path, **kwargs):
+        cache = VerifyCache(tmp_path / "cache.json", tmp_path, **kwargs)
+        report = run_verifications(parse_task_blocks(content), root=tmp_path, cache=cache)
+        cache.save()
+        return {o.task_id: (o.status, o.cached) for o in report.outcomes}
+
+    def test_context_paths(self, tmp_path: Path) -> None:
+        """Test that existing files and directories named in Context are inputs."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.py").write_text("x = 1\n")
+        content = _cached_task("1.1", "`true`", "Edit `src/app.py` and docs/missing.md in src/.")
+        assert context_paths(parse_task_blocks(content)[0], tmp_path) == ["src/app.py", "src"]
+
+    def test_unchanged_inputs_hit(self, tmp_path: Path) -> None:
+        """Test that a second run with identical inputs reuses pass and fail results."""
+        (tmp_path / "app.py").write_text("x = 1\n")
+        content = _cached_task("1.1", "`true`", "`app.py`") + _cached_task(
+            "1.2", "`false`", "`app.py`"
+        )
+        first = self._run(content, tmp_path)
+        assert first == {"1.1": (VerifyStatus.PASSED, False), "1.2": (VerifyStatus.FAILED, False)}
+        second = self._run(content, tmp_path)
+        assert second == {"1.1": (VerifyStatus.PASSED, True), "1.2": (VerifyStatus.FAILED, True)}
+
+    def test_changed_input_or_command_misses(self, tmp_path: Path) -> None:
+        """Test that editing an input file or the command invalidates the entry."""
+        (tmp_path / "app.py").write_text("x = 1\n")
+        self._run(_cached_task("1.1", "`true`", "`app.py`"), tmp_path)
+        (tmp_path / "app.py").write_text("x = 22\n")
+        assert self._run(_cached_task("1.1", "`true`", "`app.py`"), tmp_path)["1.1"][1] is False
+        assert (
+            self._run(_cached_task("1.1", "`true && true`", "`app.py`"), tmp_path)["1.1"][1]
+            is False
+        )
+        assert (
+            self._run(_cached_task("1.1", "`true && true`", "`app.py`"), tmp_path)["1.1"][1] is True
+        )
+
+    def test_env_change_misses(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that selected environment variables are part of the key."""
+        (tmp_path / "app.py").write_text("x = 1\n")
+        content = _cached_task("1.1", "`true`", "`app.py`")
+        monkeypatch.setenv("PB_SPEC_TEST_MODE", "a")
+        self._run(content, tmp_path, env_names=("PB_SPEC_TEST_MODE",))
+        monkeypatch.setenv("PB_SPEC_TEST_MODE", "b")
+        assert self._run(content, tmp_path, env_names=("PB_SPEC_TEST_MODE",))["1.1"][1] is False
+
+    def test_task_without_inputs_is_not_cached(self, tmp_path: Path) -> None:
+        """Test that tasks naming no input files always run."""
+        content = _cached_task("1.1", "`true`", "Explain the design.")
+        self._run(content, tmp_path)
+        assert self._run(content, tmp_path)["1.1"] == (VerifyStatus.PASSED, False)
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"version": 1, "results": {"1.1": {"key": "k"}}},
+            {"version": 1, "results": {}, "files": {"app.py": [1, 2]}},
+            {"version": 1, "results": ["1.1"]},
+            {
+                "version": 1,
+                "results": {
+                    "1.1": {
+                        "key": "k",
+                        "status": "exploded",
+                        "returncode": 0,
+                        "duration": 0.1,
+                        "log_path": None,
+                    }
+                },
+            },
+        ],
+    )
+    def test_malformed_cache_is_rebuilt(self, tmp_path: Path, payload: dict) -> None:
+        """Test that an old-format or hand-edited cache file is discarded, not fatal."""
+        (tmp_path / "app.py").write_text("x = 1\n")
+        (tmp_path / "cache.json").write_text(json.dumps(payload))
+        content = _cached_task("1.1", "`true`", "`app.py`")
+        assert self._run(content, tmp_path)["1.1"] == (VerifyStatus.PASSED, False)
+        assert self._run(content, tmp_path)["1.1"] == (VerifyStatus.PASSED, True)
+
+
+class TestVerifyCommand:
+    """Tests for `pb-spec verify`."""
+
+    def test_json_summary(self, tmp_path: Path) -> None:
+        """Test that --json reports per-task outcomes and the exit code reflects failures."""
+        spec_dir = tmp_path / "specs" / "2026-01-01-verify"
+        spec_dir.mkdir(parents=True)
+        (spec_dir / "tasks.md").write_text(
+            _task("1.1", "None", "`true`") + _task("1.2", "1.1", "`exit 3`")
+        )
+        result = CliRunner().invoke(
+            main,
+            [
+                "verify",
+                "--specs-dir",
+                str(tmp_path / "specs"),
+                "--log-dir",
+                str(tmp_path / "logs"),
+                "--json",
+            ],
+        )
+        assert result.exit_code == 1, result.output
+        payload = json.loads(result.output)
+        assert payload["waves"] == [["1.1"], ["1.2"]]
+        assert [(t["id"], t["status"], t["returncode"]) for t in payload["tasks"]] == [
+            ("1.1", "passed", 0),
+            ("1.2", "failed", 3),
+        ]
+        assert (tmp_path / "logs" / "task-1.2.log").exists()
+
+    def test_no_cache_forces_execution(self, tmp_path: Path) -> None:
+        """Test that cache hits are reported and --no-cache bypasses them."""
+        spec_dir = tmp_path / "specs" / "2026-01-01-verify"
+        spec_dir.mkdir(parents=True)
+        (tmp_path / "app.py").write_text("x = 1\n")
+        (spec_dir / "tasks.md").write_text(_cached_task("1.1", "`true`", "`app.py`"))
+        args = ["verify", "--specs-dir", str(tmp_path / "specs"), "--json"]
+        CliRunner().invoke(main, args)
+        hit = json.loads(CliRunner().invoke(main, args).output)
+        assert hit["cached"] == 1
+        forced = json.loads(CliRunner().invoke(main, [*args, "--no-cache"]).output)
+        assert forced["cached"] == 0
+        assert (tmp_path / ".pb-spec" / "verify-cache.json").exists()
@@ -0,0 +1,164 @@
+"""Unit tests for validate --watch: watchers, issue deltas and incremental revalidation."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from pb_spec.validation.plan import validate_plan
+from pb_spec.validation.result import ErrorSeverity, ValidationError, ValidationResult
+from pb_spec.watch import (
+    InotifyWatcher,
+    IssueIndex,
+    PollingWatcher,
+    Revalidator,
+    relevant_changes,
+    wait_for_changes,
+)
+
+DESIGN = (
+    "# Design\n\n"
+    "## Summary\nSummary.\n\n"
+    "## Approach\nApproach.\n\n"
+    "## Architecture Decisions\nDecision.\n\n"
+    "## BDD/TDD Strategy\nStrategy.\n\n"
+    "## Verification\nVerify.\n"
+)
+
+TASKS = (
+    "# Tasks\n\n"
+    "### Task 1.1: Implement feature\n"
+    "Context: Implement the core feature logic.\n"
+    "Verification: Run the full test suite.\n"
+    "Scenario Coverage: Test scenario in test.feature.\n"
+    "Status: 🟢 DONE\n"
+    "- [x] Step 1: Write test\n"
+)
+
+FEATURE = "Feature: F\n  Scenario: Test scenario\n    Given a condition\n"
+
+
+@pytest.fixture
+def spec_dir(tmp_path: Path) -> Path:
+    """Create a valid plan-stage spec directory."""
+    spec = tmp_path / "specs" / "2026-01-01-watch"
+    (spec / "features").mkdir(parents=True)
+    (spec / "design.md").write_text(DESIGN)
+    (spec / "tasks.md").write_text(TASKS)
+    (spec / "features" / "test.feature").write_text(FEATURE)
+    return spec
+
+
+def _error(message: str, line: int | None = None) -> ValidationError:
+    return ValidationError(message, ErrorSeverity.HIGH, "a.py", line)
+
+
+class TestIssueIndex:
+    """Tests for IssueIndex deltas."""
+
+    def test_reports_new_and_resolved(self) -> None:
+        """Test that only issues that appeared or disappeared are reported."""
+        index = IssueIndex()
+        first = index.update(ValidationResult(False, [_error("a"), _error("b")], ["w1"]))
+        assert [e.message for e in first.new] == ["a", "b"]
+
+        delta = index.update(ValidationResult(False, [_error("b"), _error("c")], ["w2"]))
+        assert [e.message for e in delta.new] == ["c"]
+        assert [e.message for e in delta.resolved] == ["a"]
+        assert delta.new_warnings == ["w2"]
+        assert delta.resolved_warnings == ["w1"]
+
+    def test_line_moves_are_not_changes(self) -> None:
+        """Test that an issue shifting lines is the same issue."""
+        index = IssueIndex()
+        index.update(ValidationResult(False, [_error("a", 3)]))
+        assert index.update(ValidationResult(False, [_error("a", 9)])).empty
+
+    def test_duplicates_are_counted(self) -> None:
+        """Test that a second copy of an existing issue is reported as new."""
+        index = IssueIndex()
+        index.update(ValidationResult(False, [_error("a")]))
+        delta = index.update(ValidationResult(False, [_error("a"), _error("a")]))
+        assert len(delta.new) == 1
+
+
+class TestWatchers:
+    """Tests for the change watchers."""
+
+    def test_polling_detects_edits_and_skips_hidden_dirs(self, tmp_path: Path) -> None:
+        """Test that the polling watcher reports edits but not .git contents."""
+        (tmp_path / ".git").mkdir()
+        target = tmp_path / "a.py"
+        target.write_text("x = 1\n")
+        watcher = PollingWatcher(tmp_path, interval=0.01)
+        (tmp_path / ".git" / "HEAD").write_text("ref\n")
+        assert watcher.poll(0.05) == set()
+        target.write_text("x = 22\n")
+        assert watcher.poll(1.0) == {target}
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_follows_new_directories(self, tmp_path: Path) -> None:
+        """Test that files in directories created after start are watched."""
+        watcher = InotifyWatcher(tmp_path)
+        try:
+            (tmp_path / "pkg").mkdir()
+            wait_for_changes(watcher, debounce=0.05)
+            (tmp_path / "pkg" / "mod.py").write_text("x = 1\n")
+            assert tmp_path / "pkg" / "mod.py" in wait_for_changes(watcher, debounce=0.05)
+        finally:
+            watcher.close()
+
+    def test_relevant_changes_drop_hidden_files(self, tmp_path: Path) -> None:
+        """Test that spec index and swap files never trigger revalidation."""
+        changed = {tmp_path / ".index", tmp_path / ".design.md.swp", tmp_path / "design.md"}
+        assert relevant_changes(changed) == {tmp_path / "design.md"}
+
+
+class TestRevalidator:
+    """Tests for incremental revalidation."""
+
+    def test_plan_matches_full_validation(self, spec_dir: Path) -> None:
+        """Test that the phased plan run reports what validate_plan reports."""
+        (spec_dir / "design.md").write_text("# Design\n")
+        assert Revalidator("plan", spec_dir, spec_dir).validate() == validate_plan(spec_dir)
+
+    def test_plan_reruns_only_affected_phases(self, spec_dir: Path) -> None:
+        """Test that an edit re-runs only the phases reading the changed document."""
+        revalidator = Revalidator("plan", spec_dir, spec_dir)
+        assert revalidator.validate().is_valid
+
+        (spec_dir / "tasks.md").write_text(TASKS.replace("Context:", "Notes:"))
+        (spec_dir / "design.md").write_text("# Design\n")
+        design_only = revalidator.revalidate({spec_dir / "design.md"})
+        assert design_only is not None
+        assert {e.file_path for e in design_only.errors} == {"design.md"}
+
+        both = revalidator.revalidate({spec_dir / "tasks.md"})
+        assert both is not None
+        assert both == validate_plan(spec_dir)
+
+    def test_plan_ignores_unrelated_changes(self, spec_dir: Path, tmp_path: Path) -> None:
+        """Test that edits outside the spec directory do not revalidate the plan."""
+        revalidator = Revalidator("plan", spec_dir, spec_dir)
+        revalidator.validate()
+        assert revalidator.revalidate({tmp_path / "README.md"}) is None
+
+    def test_task_rescans_only_changed_files(self, tmp_path: Path) -> None:
+        """Test that task revalidation reuses cached scans of unchanged files."""
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        (tmp_path / "a.py").write_text("x = 1  # TODO: a\n")
+        (tmp_path / "b.py").write_text("y = 2\n")
+        os.utime(tmp_path / "a.py", ns=(1, 1))
+        revalidator = Revalidator("task", None, tmp_path)
+        assert len(revalidator.validate().errors) == 1
+
+        (tmp_path / "b.py").write_text("y = 3  # FIXME: b\n")
+        os.utime(tmp_path / "b.py", ns=(1, 1))
+        result = revalidator.revalidate({tmp_path / "b.py"})
+        assert result is not None
+        assert {e.file_path for e in result.errors} == {"a.py", "b.py"}
+        assert revalidator.scan_cache.hits == 1